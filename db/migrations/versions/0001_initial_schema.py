@@ -0,0 +1,154 @@
+"""Initial schema (tables as originally created by init_db).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _created_at() -> sa.Column:
+    return sa.Column("created_at", sa.DateTime(timezone=True), nullable=True)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "households",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("name", sa.String(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("display_name", sa.String(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "preferences",
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), primary_key=True),
+        sa.Column("default_merchant", sa.String(), nullable=True),
+        sa.Column("default_booking_vendor", sa.String(), nullable=True),
+        _created_at(),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "execution_requests",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("raw_command_text", sa.String(), nullable=False),
+        sa.Column("normalized_intent_json", sa.JSON(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "drafts",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column(
+            "execution_request_id",
+            sa.String(),
+            sa.ForeignKey("execution_requests.id"),
+            nullable=False,
+        ),
+        sa.Column("verb", sa.String(), nullable=False),
+        sa.Column("vendor", sa.String(), nullable=False),
+        sa.Column("estimated_cost_cents", sa.Integer(), nullable=True),
+        sa.Column("draft_payload_json", sa.JSON(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "confirmations",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("draft_id", sa.String(), sa.ForeignKey("drafts.id"), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("confirmed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("confirmation_latency_ms", sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        "executions",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("draft_id", sa.String(), sa.ForeignKey("drafts.id"), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("final_cost_cents", sa.Integer(), nullable=True),
+        sa.Column("execution_payload_json", sa.JSON(), nullable=False),
+        sa.Column("error_message", sa.String(), nullable=True),
+    )
+    op.create_table(
+        "receipt_artifacts",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("execution_id", sa.String(), sa.ForeignKey("executions.id"), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("content_text", sa.String(), nullable=False),
+        sa.Column("external_reference_id", sa.String(), nullable=True),
+        _created_at(),
+    )
+    op.create_table(
+        "event_log",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("entity_type", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("event_payload_json", sa.JSON(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "usual_items",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "subscriptions",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("monthly_cost_cents", sa.Integer(), nullable=False),
+        sa.Column("renewal_date", sa.DateTime(timezone=True), nullable=False),
+        _created_at(),
+    )
+    op.create_table(
+        "booking_vendors",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("default_service_type", sa.String(), nullable=False),
+        sa.Column("price_estimate_cents", sa.Integer(), nullable=False),
+        _created_at(),
+    )
+
+
+def downgrade() -> None:
+    for table in (
+        "booking_vendors",
+        "subscriptions",
+        "usual_items",
+        "event_log",
+        "receipt_artifacts",
+        "executions",
+        "confirmations",
+        "drafts",
+        "execution_requests",
+        "preferences",
+        "users",
+        "households",
+    ):
+        op.drop_table(table)
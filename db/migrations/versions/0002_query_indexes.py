@@ -0,0 +1,49 @@
+"""Index the columns every router query filters, joins or orders on.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ("ix_execution_requests_household_id", "execution_requests", ["household_id"]),
+    ("ix_drafts_execution_request_id", "drafts", ["execution_request_id"]),
+    ("ix_confirmations_draft_id_confirmed_at", "confirmations", ["draft_id", "confirmed_at"]),
+    ("ix_executions_draft_id", "executions", ["draft_id"]),
+    ("ix_executions_started_at", "executions", ["started_at"]),
+    (
+        "ix_receipt_artifacts_execution_id_created_at",
+        "receipt_artifacts",
+        ["execution_id", "created_at"],
+    ),
+    ("ix_event_log_entity", "event_log", ["entity_type", "entity_id", "event_type"]),
+    ("ix_usual_items_household_id_created_at", "usual_items", ["household_id", "created_at"]),
+    ("ix_subscriptions_household_id_name", "subscriptions", ["household_id", "name"]),
+    (
+        "ix_booking_vendors_household_id_created_at",
+        "booking_vendors",
+        ["household_id", "created_at"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,140 @@
+"""Promote verb/routine_key out of the intent JSON; JSONB + GIN on Postgres.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_JSON_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("execution_requests", "normalized_intent_json"),
+    ("drafts", "draft_payload_json"),
+    ("executions", "execution_payload_json"),
+    ("event_log", "event_payload_json"),
+)
+
+_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    (
+        "ix_execution_requests_household_id_routine_key",
+        "execution_requests",
+        ["household_id", "routine_key"],
+    ),
+    ("ix_execution_requests_household_id_verb", "execution_requests", ["household_id", "verb"]),
+    ("ix_drafts_routine_key", "drafts", ["routine_key"]),
+    ("ix_drafts_verb", "drafts", ["verb"]),
+)
+
+_GIN_INDEXES: tuple[tuple[str, str, str], ...] = (
+    ("ix_execution_requests_intent_gin", "execution_requests", "normalized_intent_json"),
+    ("ix_drafts_payload_gin", "drafts", "draft_payload_json"),
+)
+
+_BACKFILL_BATCH = 1000
+
+
+def upgrade() -> None:
+    op.add_column("execution_requests", sa.Column("verb", sa.String(), nullable=True))
+    op.add_column("execution_requests", sa.Column("routine_key", sa.String(), nullable=True))
+    op.add_column("drafts", sa.Column("routine_key", sa.String(), nullable=True))
+
+    if op.get_bind().dialect.name == "postgresql":
+        for table, column in _JSON_COLUMNS:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+            )
+        op.execute(
+            "UPDATE execution_requests SET "
+            "verb = NULLIF(normalized_intent_json->>'verb', ''), "
+            "routine_key = NULLIF(normalized_intent_json->>'routine_key', '')"
+        )
+        op.execute(
+            "UPDATE drafts SET "
+            "routine_key = NULLIF(draft_payload_json->'intent'->>'routine_key', '')"
+        )
+        for name, table, column in _GIN_INDEXES:
+            op.create_index(name, table, [column], postgresql_using="gin")
+    else:
+        _backfill_in_python()
+
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
+
+    if op.get_bind().dialect.name == "postgresql":
+        for name, table, _column in reversed(_GIN_INDEXES):
+            op.drop_index(name, table_name=table)
+        for table, column in _JSON_COLUMNS:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json")
+
+    with op.batch_alter_table("drafts") as batch:
+        batch.drop_column("routine_key")
+    with op.batch_alter_table("execution_requests") as batch:
+        batch.drop_column("routine_key")
+        batch.drop_column("verb")
+
+
+def _backfill_in_python() -> None:
+    bind = op.get_bind()
+
+    requests = sa.table(
+        "execution_requests",
+        sa.column("id", sa.String),
+        sa.column("normalized_intent_json", sa.JSON),
+        sa.column("verb", sa.String),
+        sa.column("routine_key", sa.String),
+    )
+    updates = [
+        {"b_id": row.id, "b_verb": _text(intent, "verb"), "b_key": _text(intent, "routine_key")}
+        for row in bind.execute(sa.select(requests.c.id, requests.c.normalized_intent_json))
+        for intent in [row.normalized_intent_json or {}]
+    ]
+    stmt = (
+        requests.update()
+        .where(requests.c.id == sa.bindparam("b_id"))
+        .values(verb=sa.bindparam("b_verb"), routine_key=sa.bindparam("b_key"))
+    )
+    for start in range(0, len(updates), _BACKFILL_BATCH):
+        bind.execute(stmt, updates[start : start + _BACKFILL_BATCH])
+
+    drafts = sa.table(
+        "drafts",
+        sa.column("id", sa.String),
+        sa.column("draft_payload_json", sa.JSON),
+        sa.column("routine_key", sa.String),
+    )
+    updates = [
+        {
+            "b_id": row.id,
+            "b_key": _text((row.draft_payload_json or {}).get("intent"), "routine_key"),
+        }
+        for row in bind.execute(sa.select(drafts.c.id, drafts.c.draft_payload_json))
+    ]
+    stmt = (
+        drafts.update()
+        .where(drafts.c.id == sa.bindparam("b_id"))
+        .values(routine_key=sa.bindparam("b_key"))
+    )
+    for start in range(0, len(updates), _BACKFILL_BATCH):
+        bind.execute(stmt, updates[start : start + _BACKFILL_BATCH])
+
+
+def _text(doc: object, key: str) -> str | None:
+    if not isinstance(doc, dict):
+        return None
+    return str(doc.get(key) or "").strip() or None
@@ -0,0 +1,40 @@
+"""Per-routine autopilot rollup table.
+
+Populate it for existing data with `uv run python scripts/backfill_routine_stats.py`.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "routine_stats",
+        sa.Column("household_id", sa.String(), sa.ForeignKey("households.id"), primary_key=True),
+        sa.Column("routine_key", sa.String(), primary_key=True),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("first_completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("cost_sum_cents", sa.Integer(), nullable=False),
+        sa.Column("cost_count", sa.Integer(), nullable=False),
+        sa.Column("last_items_json", sa.JSON().with_variant(JSONB(), "postgresql"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("routine_stats")
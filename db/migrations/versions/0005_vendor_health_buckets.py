@@ -0,0 +1,41 @@
+"""Hourly vendor health counters.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vendor_health_buckets",
+        sa.Column("vendor", sa.String(), primary_key=True),
+        sa.Column("household_id", sa.String(), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("failures", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_vendor_health_buckets_household_id_bucket_start",
+        "vendor_health_buckets",
+        ["household_id", "bucket_start"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_vendor_health_buckets_household_id_bucket_start", table_name="vendor_health_buckets"
+    )
+    op.drop_table("vendor_health_buckets")
@@ -0,0 +1,46 @@
+"""Denormalize household_id onto executions for the keyset-paginated activity feed.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("executions") as batch:
+        batch.add_column(sa.Column("household_id", sa.String(), nullable=True))
+        batch.create_foreign_key(
+            "executions_household_id_fkey", "households", ["household_id"], ["id"]
+        )
+
+    op.execute(
+        "UPDATE executions SET household_id = ("
+        "SELECT er.household_id FROM drafts d "
+        "JOIN execution_requests er ON er.id = d.execution_request_id "
+        "WHERE d.id = executions.draft_id)"
+    )
+
+    op.create_index(
+        "ix_executions_household_id_started_at_id",
+        "executions",
+        ["household_id", "started_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_executions_household_id_started_at_id", table_name="executions")
+    with op.batch_alter_table("executions") as batch:
+        batch.drop_constraint("executions_household_id_fkey", type_="foreignkey")
+        batch.drop_column("household_id")
@@ -0,0 +1,37 @@
+"""Shared intent extraction cache.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "intent_cache_entries",
+        sa.Column("key", sa.String(), primary_key=True),
+        sa.Column("model", sa.String(), nullable=False),
+        sa.Column("intent_json", sa.JSON().with_variant(JSONB(), "postgresql"), nullable=False),
+        sa.Column("extract_ms", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_intent_cache_entries_expires_at", "intent_cache_entries", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_intent_cache_entries_expires_at", table_name="intent_cache_entries")
+    op.drop_table("intent_cache_entries")
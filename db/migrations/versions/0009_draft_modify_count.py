@@ -0,0 +1,37 @@
+"""Per-draft modification counter for the autopilot trust signal.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "drafts",
+        sa.Column("modify_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE drafts SET modify_count = ("
+        "SELECT COUNT(*) FROM event_log "
+        "WHERE event_log.entity_type = 'Draft' "
+        "AND event_log.entity_id = drafts.id "
+        "AND event_log.event_type = 'DRAFT_MODIFIED')"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("drafts") as batch:
+        batch.drop_column("modify_count")
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import argparse
+
+from services.api.app.db.database import db_session
+from services.api.app.db.init_db import init_db
+from services.api.app.services.routine_stats import rebuild_routine_stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the routine_stats rollup from execution history"
+    )
+    parser.add_argument("--household-id", default=None, help="Only rebuild this household")
+    args = parser.parse_args()
+
+    init_db()
+
+    db = db_session()
+    try:
+        written = rebuild_routine_stats(db, household_id=args.household_id)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"routine_stats rows written: {written}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
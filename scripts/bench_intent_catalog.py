@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from services.api.app.llm.catalog import CatalogSet
+from services.api.app.llm.fake import FakeIntentExtractor
+
+_COMMANDS = [
+    "order 2 paper towels and 3 detergent",
+    "we are running low on pet food, handle it like last time",
+    "buy 4 sku 7 refill and sku 9 refill please",
+    "restock the usual",
+]
+
+
+def synthetic_entries(n: int) -> list[dict]:
+    """`n` catalog entries, each with two synonyms, plus the built-in household nouns."""
+
+    entries = [
+        {"name": "paper towels", "synonyms": ["kitchen roll"]},
+        {"name": "detergent", "synonyms": ["laundry soap"]},
+        {"name": "pet food", "synonyms": ["dog food"]},
+    ]
+    for i in range(n):
+        entries.append(
+            {"name": f"sku {i} refill", "synonyms": [f"brand {i} pack", f"sku{i} bundle"]}
+        )
+    return entries
+
+
+def time_parses(size: int, *, rounds: int) -> float:
+    """Median microseconds per extract() against a catalog of `size` entries."""
+
+    extractor = FakeIntentExtractor(CatalogSet(synthetic_entries(size), {}))
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for text in _COMMANDS:
+            extractor.extract(raw_command_text=text, household_id="hh-1", user_id="u-1")
+        samples.append((time.perf_counter() - start) * 1e6 / len(_COMMANDS))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rule extractor parse time vs. catalog size")
+    parser.add_argument("--sizes", default="10,100,1000,10000,50000")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        print(f"catalog={size:>6} entries  parse={time_parses(size, rounds=args.rounds):7.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""Offline throughput/latency benchmark of the OpenAI extraction pipeline.
+
+Starts scripts.openai_standin in-process (or targets --base-url), points the real OpenAI
+extractor at it through OPENAI_BASE_URL, and fires --requests extractions with
+--concurrency in flight. Reports throughput, latency percentiles, HTTP retries, degraded
+(rule fallback) answers and breaker trips. HALO_LLM_* env vars (budget, breaker, retries)
+apply as in production:
+
+    uv run python -m scripts.bench_llm_pipeline --requests 500 --concurrency 32 \\
+        --latency lognormal:300:0.6 --throttle-rate 0.05 --error-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+import anyio
+from scripts.openai_standin import StandInServer, add_behavior_args, behavior_from_args
+
+_COMMANDS = [
+    "reorder the usual",
+    "order 2 paper towels and 3 detergent",
+    "cancel netflix",
+    "book dinner for 4 on friday around 7pm",
+    "we are running low on pet food, handle it like last time",
+]
+
+
+def run(requests: int, concurrency: int, *, use_async: bool) -> dict:
+    """Run the load against the extractor configured by env; returns the summary."""
+
+    from services.api.app.llm.factory import build_intent_extractor
+    from services.api.app.llm.http_client import close_llm_clients
+    from services.api.app.metrics import registry
+
+    anyio.run(close_llm_clients)
+    registry.reset()
+    extractor = build_intent_extractor()
+    latencies: list[float] = []
+
+    def _kwargs(i: int) -> dict:
+        # Distinct text per request so the intent cache never short-circuits the load.
+        return {
+            "raw_command_text": f"{_COMMANDS[i % len(_COMMANDS)]} #{i}",
+            "household_id": "hh-bench",
+            "user_id": "u-bench",
+        }
+
+    async def _worker(queue: list[int], limiter: anyio.CapacityLimiter) -> None:
+        while queue:
+            i = queue.pop()
+            async with limiter:
+                started = time.perf_counter()
+                if use_async:
+                    await extractor.aextract(**_kwargs(i))
+                else:
+                    await anyio.to_thread.run_sync(lambda: extractor.extract(**_kwargs(i)))
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    async def _main() -> None:
+        queue = list(range(requests))
+        limiter = anyio.CapacityLimiter(concurrency)
+        async with anyio.create_task_group() as tg:
+            for _ in range(concurrency):
+                tg.start_soon(_worker, queue, limiter)
+        await close_llm_clients()
+
+    started = time.perf_counter()
+    anyio.run(_main)
+    elapsed = time.perf_counter() - started
+
+    counters = registry.snapshot()["counters"]
+    latencies.sort()
+    return {
+        "requests": requests,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 1),
+        "max_ms": round(latencies[-1], 1),
+        "http_retries": counters.get("llm_http_retries_total", 0),
+        "degraded": {
+            k.split("reason=")[1].rstrip("}"): v
+            for k, v in counters.items()
+            if k.startswith("intent_degraded_total")
+        },
+        "breaker_trips": counters.get("llm_breaker_trips_total", 0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline OpenAI extraction pipeline benchmark")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="use aextract")
+    parser.add_argument("--base-url", default=None, help="existing stand-in; default: in-process")
+    add_behavior_args(parser)
+    args = parser.parse_args()
+
+    server = None
+    if args.base_url is None:
+        server = StandInServer(behavior_from_args(args))
+        server.serve_in_thread()
+        args.base_url = server.base_url
+
+    os.environ["OPENAI_BASE_URL"] = args.base_url
+    os.environ["HALO_LLM_PROVIDER"] = "openai"
+    os.environ.setdefault("OPENAI_API_KEY", "sk-local")
+    os.environ.setdefault("HALO_INTENT_CACHE_DB", "false")
+
+    try:
+        summary = run(args.requests, args.concurrency, use_async=args.use_async)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    for key, value in summary.items():
+        print(f"{key:>15}: {value}")
+    if server is not None:
+        print(f"{'stand-in':>15}: {server.counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+"""Local OpenAI-compatible chat-completions server for offline extraction load tests.
+
+It serves `POST /v1/chat/completions`. Each answer comes from a recorded fixture for the
+command when one exists, and from FakeIntentExtractor otherwise, so the extractor pipeline
+(pooled client, retries, breaker, cache) can be exercised without a network or an API key.
+Latency, 5xx errors and 429 throttling can be injected:
+
+    uv run python -m scripts.openai_standin --port 8900 --latency lognormal:300:0.5 \\
+        --error-rate 0.02 --throttle-rate 0.05
+    export HALO_LLM_PROVIDER=openai OPENAI_API_KEY=sk-local \\
+        OPENAI_BASE_URL=http://127.0.0.1:8900/v1
+
+Fixtures file (JSON): {"<command text>": <IntentV1 JSON>, ...}. Keys are matched
+case-insensitively after trimming whitespace.
+
+Latency specs (milliseconds): `fixed:MS`, `uniform:LO:HI`, `lognormal:MEDIAN:SIGMA`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from services.api.app.llm.fake import FakeIntentExtractor
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Sampler of response delays in seconds for a `kind:args` spec in milliseconds."""
+
+    kind, _, rest = spec.partition(":")
+    args = [float(a) for a in rest.split(":") if a]
+    if kind == "fixed" and len(args) == 1:
+        return lambda rng: args[0] / 1000
+    if kind == "uniform" and len(args) == 2:
+        return lambda rng: rng.uniform(args[0], args[1]) / 1000
+    if kind == "lognormal" and len(args) == 2:
+        return lambda rng: rng.lognormvariate(math.log(args[0]), args[1]) / 1000
+    raise ValueError(f"Unknown latency spec {spec!r}")
+
+
+@dataclass
+class StandInBehavior:
+    latency: Callable[[random.Random], float] = field(default=lambda rng: 0.0)
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_s: float = 1.0
+    fixtures: dict[str, dict] = field(default_factory=dict)
+    seed: int | None = None
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, behavior: StandInBehavior, *, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.behavior = behavior
+        self.extractor = FakeIntentExtractor()
+        self.counts = {"ok": 0, "error": 0, "throttled": 0}
+        self._rng = random.Random(behavior.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def serve_in_thread(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def plan(self) -> tuple[float, str]:
+        """Delay and outcome (ok, error, throttled) for the next request."""
+
+        with self._lock:
+            delay = max(0.0, self.behavior.latency(self._rng))
+            roll = self._rng.random()
+            if roll < self.behavior.throttle_rate:
+                outcome = "throttled"
+            elif roll < self.behavior.throttle_rate + self.behavior.error_rate:
+                outcome = "error"
+            else:
+                outcome = "ok"
+            self.counts[outcome] += 1
+        return delay, outcome
+
+    def answer(self, user_json: dict) -> dict:
+        command = str(user_json.get("command") or "")
+        recorded = self.behavior.fixtures.get(_fixture_key(command))
+        if recorded is not None:
+            return recorded
+        intent = self.extractor.extract(
+            raw_command_text=command,
+            household_id="standin",
+            user_id="standin",
+            clarification_answers=user_json.get("clarification_answers") or {},
+        )
+        return intent.model_dump(mode="json")
+
+
+def load_fixtures(path: Path) -> dict[str, dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {_fixture_key(k): v for k, v in data.items()}
+
+
+def _fixture_key(command: str) -> str:
+    return command.strip().lower()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInServer
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send(404, {"error": {"message": f"no route {self.path}"}})
+            return
+
+        delay, outcome = self.server.plan()
+        time.sleep(delay)
+        if outcome == "throttled":
+            retry_after = {"Retry-After": f"{self.server.behavior.retry_after_s:g}"}
+            self._send(429, {"error": {"message": "stand-in throttle"}}, retry_after)
+            return
+        if outcome == "error":
+            self._send(500, {"error": {"message": "stand-in failure"}})
+            return
+
+        user_json = json.loads(body["messages"][-1]["content"])
+        content = json.dumps(self.server.answer(user_json))
+        self._send(
+            200,
+            {
+                "object": "chat.completion",
+                "model": body.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    def _send(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+        raw = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, format: str, *args: object) -> None:
+        del format, args
+
+
+def add_behavior_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", default="fixed:0", help="fixed:MS | uniform:LO:HI | ...")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction answered 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 Retry-After seconds")
+    parser.add_argument("--fixtures", type=Path, default=None, help="recorded intents (JSON)")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def behavior_from_args(args: argparse.Namespace) -> StandInBehavior:
+    return StandInBehavior(
+        latency=parse_latency(args.latency),
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after_s=args.retry_after,
+        fixtures=load_fixtures(args.fixtures) if args.fixtures else {},
+        seed=args.seed,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local OpenAI chat-completions stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    add_behavior_args(parser)
+    args = parser.parse_args()
+
+    server = StandInServer(behavior_from_args(args), host=args.host, port=args.port)
+    print(f"OPENAI_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"served: {server.counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import argparse
+import os
+
+from services.api.app.db.database import db_session
+from services.api.app.db.init_db import init_db
+from services.api.app.services.product_resolution import pin_product, unpin_product
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Pin (or unpin) the Amazon product a household's item name resolves to"
+    )
+    parser.add_argument("--household-id", required=True)
+    parser.add_argument("--item", required=True, help='Item name as spoken, e.g. "paper towels"')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--asin", help="Product ASIN, e.g. B00000TOWL")
+    target.add_argument("--url", help="Full product URL")
+    target.add_argument("--unpin", action="store_true", help="Remove the pin")
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("HALO_AMAZON_BASE_URL", "https://www.amazon.com"),
+        help="Amazon base URL used with --asin (default: https://www.amazon.com)",
+    )
+    args = parser.parse_args()
+
+    init_db()
+
+    db = db_session()
+    try:
+        if args.unpin:
+            removed = unpin_product(db, args.household_id, args.item)
+            message = "unpinned" if removed else "no pin found"
+        else:
+            product_url = args.url or f"{args.base_url.rstrip('/')}/dp/{args.asin.upper()}"
+            pin_product(db, args.household_id, args.item, product_url)
+            message = f"pinned to {product_url}"
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"{args.household_id} {args.item!r}: {message}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+"""Process-wide intent extractor and vendor adapter instances.
+
+`get_intent_extractor`, `get_amazon_adapter` and `get_booking_adapter` return instances
+memoized here. Each is built once from env by its `build_*` factory, so request handlers stop
+re-reading configuration and can share warm resources (HTTP pools, browser pools).
+
+Components may implement optional lifecycle hooks:
+- `start()` runs once, right after the component is built
+- `close()` runs on app shutdown and on reload
+
+main.py reloads the registry on startup (so every app start sees the current env), warms
+the configured components, and closes them on shutdown. Tests that change adapter env vars
+after startup call `reload_components()`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ComponentRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._instances: dict[str, object] = {}
+        # Builds can be slow (browser pools, HTTP warm-up), so they run outside `_lock`:
+        # one lock per name serializes builds of that component only.
+        self._build_locks: dict[str, threading.Lock] = {}
+        self._generation = 0
+
+    def get(self, name: str, build: Callable[[], T]) -> T:
+        while True:
+            with self._lock:
+                if name in self._instances:
+                    return cast(T, self._instances[name])
+                build_lock = self._build_locks.setdefault(name, threading.Lock())
+                generation = self._generation
+
+            with build_lock:
+                with self._lock:
+                    if name in self._instances:
+                        return cast(T, self._instances[name])
+                # A failing build is not memoized; the caller sees the error every time.
+                instance = build()
+                _call_hook(instance, "start")
+                with self._lock:
+                    if self._generation == generation:
+                        self._instances[name] = instance
+                        return instance
+            # `close()` ran while building: this instance saw the old env, so drop it.
+            _close_quietly(name, instance)
+
+    def close(self) -> None:
+        with self._lock:
+            instances, self._instances = self._instances, {}
+            self._generation += 1
+        for name, instance in instances.items():
+            _close_quietly(name, instance)
+
+
+def _close_quietly(name: str, instance: object) -> None:
+    try:
+        _call_hook(instance, "close")
+    except Exception:
+        logger.warning("closing component %s failed", name, exc_info=True)
+
+
+def _call_hook(instance: object, hook: str) -> None:
+    fn = getattr(instance, hook, None)
+    if callable(fn):
+        fn()
+
+
+_REGISTRY = ComponentRegistry()
+
+
+def components() -> ComponentRegistry:
+    return _REGISTRY
+
+
+def reload_components() -> None:
+    """Close every instance; the next `get_*` call rebuilds it from the current env."""
+
+    _REGISTRY.close()
+
+
+def start_components() -> None:
+    """Rebuild and warm the configured components at app startup.
+
+    Misconfiguration is logged rather than raised so the API still boots; the affected
+    endpoints keep returning the factory's error until the env is fixed.
+    """
+
+    from services.api.app.llm.factory import get_intent_extractor
+    from services.api.app.services.amazon_factory import get_amazon_adapter
+    from services.api.app.services.booking_factory import get_booking_adapter
+
+    reload_components()
+    for get in (get_intent_extractor, get_amazon_adapter, get_booking_adapter):
+        try:
+            get()
+        except ValueError as e:
+            logger.warning("component not started: %s", e)
@@ -0,0 +1,35 @@
+"""Offloading blocking work from async endpoints.
+
+The command/draft pipelines call blocking vendor SDKs (the OpenAI HTTP client, Playwright's
+sync API). In async mode they run on a dedicated, bounded limiter rather than FastAPI's shared
+threadpool, so a burst of slow drafts cannot starve cheap reads.
+
+Env vars:
+- HALO_API_SLOW_PATH_CONCURRENCY (default: 16)
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from functools import partial
+from typing import TypeVar
+
+import anyio
+from anyio import CapacityLimiter
+from fastapi import FastAPI, Request
+
+T = TypeVar("T")
+
+
+def install_slow_path_limiter(app: FastAPI) -> CapacityLimiter:
+    limiter = CapacityLimiter(int(os.getenv("HALO_API_SLOW_PATH_CONCURRENCY", "16")))
+    app.state.slow_path_limiter = limiter
+    return limiter
+
+
+async def run_slow_path(request: Request, fn: Callable[..., T], *args: object) -> T:
+    limiter = getattr(request.app.state, "slow_path_limiter", None)
+    if limiter is None:
+        limiter = install_slow_path_limiter(request.app)
+    return await anyio.to_thread.run_sync(partial(fn, *args), limiter=limiter)
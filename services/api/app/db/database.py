@@ -1,20 +1,87 @@
 from __future__ import annotations
 
 import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 
-from sqlalchemy import Engine, create_engine
+from services.api.app.metrics import registry
+from sqlalchemy import ColumnElement, Engine, Insert, create_engine, exc, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine as _create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
 
 _ENGINE: Engine | None = None
 _ENGINE_URL: str | None = None
 _SESSIONMAKER: sessionmaker | None = None
 
+_ASYNC_ENGINE: AsyncEngine | None = None
+_ASYNC_ENGINE_URL: str | None = None
+_ASYNC_SESSIONMAKER: async_sessionmaker[AsyncSession] | None = None
+
 
 def _default_db_url() -> str:
     # Local-only default. Production must provide DATABASE_URL explicitly.
     return "sqlite+pysqlite:///.local/halo.db"
 
 
+@dataclass(frozen=True, slots=True)
+class PoolConfig:
+    """Connection pool settings.
+
+    Env vars:
+    - HALO_DB_POOL_SIZE (default: 5)
+    - HALO_DB_MAX_OVERFLOW (default: 10)
+    - HALO_DB_POOL_TIMEOUT_S (default: 30) max wait for a free connection
+    - HALO_DB_POOL_RECYCLE_S (default: 1800) Cloud SQL drops idle connections; recycle first
+    - HALO_DB_POOL_PRE_PING (default: true)
+    - HALO_DB_STATEMENT_TIMEOUT_MS (default: 0 = disabled; Postgres only)
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_s: float = 30.0
+    pool_recycle_s: int = 1800
+    pre_ping: bool = True
+    statement_timeout_ms: int = 0
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        return cls(
+            pool_size=int(os.getenv("HALO_DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("HALO_DB_MAX_OVERFLOW", "10")),
+            pool_timeout_s=float(os.getenv("HALO_DB_POOL_TIMEOUT_S", "30")),
+            pool_recycle_s=int(os.getenv("HALO_DB_POOL_RECYCLE_S", "1800")),
+            pre_ping=_parse_bool(os.getenv("HALO_DB_POOL_PRE_PING", "true")),
+            statement_timeout_ms=int(os.getenv("HALO_DB_STATEMENT_TIMEOUT_MS", "0")),
+        )
+
+
+class _InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    _metric_labels: dict[str, str] | None = None
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            registry.inc("db_pool_checkout_timeouts_total", labels=self._metric_labels)
+            raise
+        finally:
+            registry.observe(
+                "db_pool_checkout_wait_ms",
+                (time.perf_counter() - start) * 1000,
+                labels=self._metric_labels,
+            )
+
+
+class _InstrumentedAsyncQueuePool(_InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    _metric_labels = {"engine": "async"}
+
+
 def get_engine() -> Engine:
     """Return a cached SQLAlchemy engine.
 
@@ -28,14 +95,227 @@ def get_engine() -> Engine:
     if _ENGINE is not None and _ENGINE_URL == url:
         return _ENGINE
 
-    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
-    _ENGINE = create_engine(url, future=True, connect_args=connect_args)
+    cfg = PoolConfig.from_env()
+    _ENGINE = create_engine(
+        url,
+        future=True,
+        connect_args=_connect_args(url, cfg),
+        **_pool_kwargs(url, cfg),
+    )
     _ENGINE_URL = url
     _SESSIONMAKER = sessionmaker(bind=_ENGINE, class_=Session, autocommit=False, autoflush=False)
+    _register_pool_gauges(lambda: _ENGINE)
     return _ENGINE
 
 
+def get_async_engine() -> AsyncEngine:
+    """Return a cached async engine for the same database as get_engine().
+
+    The driver is swapped for its async counterpart (aiosqlite locally, psycopg async for
+    Postgres). Set HALO_ASYNC_DATABASE_URL to override, e.g. to use asyncpg.
+    """
+
+    global _ASYNC_ENGINE, _ASYNC_ENGINE_URL, _ASYNC_SESSIONMAKER
+
+    url = os.getenv("HALO_ASYNC_DATABASE_URL") or async_db_url(
+        os.getenv("DATABASE_URL", _default_db_url())
+    )
+
+    if _ASYNC_ENGINE is not None and _ASYNC_ENGINE_URL == url:
+        return _ASYNC_ENGINE
+
+    cfg = PoolConfig.from_env()
+    pool_kwargs = _pool_kwargs(url, cfg)
+    if pool_kwargs:
+        pool_kwargs["poolclass"] = _InstrumentedAsyncQueuePool
+
+    try:
+        _ASYNC_ENGINE = _create_async_engine(
+            url, connect_args=_connect_args(url, cfg), **pool_kwargs
+        )
+    except ModuleNotFoundError as e:
+        raise RuntimeError(
+            f"Async driver for {make_url(url).drivername!r} is not installed "
+            f"({e.name}). For local SQLite: uv sync --group dev"
+        ) from e
+
+    _ASYNC_ENGINE_URL = url
+    _ASYNC_SESSIONMAKER = async_sessionmaker(
+        bind=_ASYNC_ENGINE, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    _register_pool_gauges(lambda: _ASYNC_ENGINE.sync_engine if _ASYNC_ENGINE else None, "async")
+    return _ASYNC_ENGINE
+
+
+def async_db_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver."""
+
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if backend == "postgresql" and parsed.drivername != "postgresql+asyncpg":
+        return parsed.set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
+    return url
+
+
 def db_session() -> Session:
     get_engine()  # ensure _SESSIONMAKER is created
     assert _SESSIONMAKER is not None
     return _SESSIONMAKER()
+
+
+def async_db_session() -> AsyncSession:
+    get_async_engine()  # ensure _ASYNC_SESSIONMAKER is created
+    assert _ASYNC_SESSIONMAKER is not None
+    return _ASYNC_SESSIONMAKER()
+
+
+async def dispose_async_engine() -> None:
+    global _ASYNC_ENGINE, _ASYNC_ENGINE_URL, _ASYNC_SESSIONMAKER
+
+    if _ASYNC_ENGINE is not None:
+        await _ASYNC_ENGINE.dispose()
+    _ASYNC_ENGINE = None
+    _ASYNC_ENGINE_URL = None
+    _ASYNC_SESSIONMAKER = None
+
+
+def release_connection(db: Session, *, read_only: bool = False) -> None:
+    """End the session's transaction so its pooled connection is returned.
+
+    Call this before slow vendor calls (browser checkouts, LLM requests). Instances are
+    expunged as well, so an accidental lazy load afterwards fails loudly instead of quietly
+    checking a connection back out for the duration of the call.
+
+    With `read_only=True` the transaction has only read so far and is rolled back rather
+    than committed, leaving the request's single commit for after the call.
+    """
+
+    if read_only:
+        if db.new or db.dirty or db.deleted:
+            raise RuntimeError("release_connection(read_only=True) with pending writes")
+        db.rollback()
+    else:
+        db.commit()
+    db.expunge_all()
+
+
+def insert_ignoring_conflicts(db: Session, model: type, rows: list[dict]) -> Insert:
+    """Multi-row INSERT that skips rows whose primary/unique key already exists."""
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(model).values(rows).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(model).values(rows).on_conflict_do_nothing()
+    raise NotImplementedError(f"insert_ignoring_conflicts does not support {dialect!r}")
+
+
+def insert_or_increment(
+    db: Session, model: type, row: dict, *, key: list[str], increment: list[str]
+) -> Insert:
+    """Single-statement counter upsert: insert `row`, or add its `increment` columns."""
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"insert_or_increment does not support {dialect!r}")
+
+    stmt = dialect_insert(model).values(row)
+    table = model.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=key,
+        set_={col: table.c[col] + stmt.excluded[col] for col in increment},
+    )
+
+
+def insert_or_update(
+    db: Session,
+    model: type,
+    row: dict,
+    *,
+    key: list[str],
+    where: ColumnElement[bool] | None = None,
+) -> Insert:
+    """Single-statement upsert: insert `row`, or overwrite its non-key columns.
+
+    With `where`, an existing row is only overwritten when it matches that condition.
+    """
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"insert_or_update does not support {dialect!r}")
+
+    stmt = dialect_insert(model).values(row)
+    return stmt.on_conflict_do_update(
+        index_elements=key,
+        set_={col: stmt.excluded[col] for col in row if col not in key},
+        where=where,
+    )
+
+
+def _connect_args(url: str, cfg: PoolConfig) -> dict:
+    if url.startswith("sqlite"):
+        return {"check_same_thread": False}
+
+    if url.startswith("postgresql") and cfg.statement_timeout_ms > 0:
+        # asyncpg is not libpq-based and rejects `options`; it takes GUCs as server_settings.
+        if make_url(url).drivername == "postgresql+asyncpg":
+            return {"server_settings": {"statement_timeout": str(cfg.statement_timeout_ms)}}
+        return {"options": f"-c statement_timeout={cfg.statement_timeout_ms}"}
+
+    return {}
+
+
+def _pool_kwargs(url: str, cfg: PoolConfig) -> dict:
+    # In-memory SQLite must stay on a single shared connection (SingletonThreadPool).
+    if url.startswith("sqlite") and make_url(url).database in (None, "", ":memory:"):
+        return {}
+
+    return {
+        "poolclass": _InstrumentedQueuePool,
+        "pool_size": cfg.pool_size,
+        "max_overflow": cfg.max_overflow,
+        "pool_timeout": cfg.pool_timeout_s,
+        "pool_recycle": cfg.pool_recycle_s,
+        "pool_pre_ping": cfg.pre_ping,
+    }
+
+
+def _register_pool_gauges(current_engine: Callable[[], Engine | None], kind: str = "") -> None:
+    labels = {"engine": kind} if kind else None
+
+    def _pool() -> QueuePool | None:
+        engine = current_engine()
+        pool = engine.pool if engine is not None else None
+        return pool if isinstance(pool, QueuePool) else None
+
+    def _gauge(read: Callable[[QueuePool], float]) -> Callable[[], float | None]:
+        def fn() -> float | None:
+            pool = _pool()
+            return read(pool) if pool is not None else None
+
+        return fn
+
+    registry.gauge_callback("db_pool_size", _gauge(lambda p: p.size()), labels=labels)
+    registry.gauge_callback("db_pool_in_use", _gauge(lambda p: p.checkedout()), labels=labels)
+    registry.gauge_callback("db_pool_idle", _gauge(lambda p: p.checkedin()), labels=labels)
+    registry.gauge_callback(
+        "db_pool_overflow", _gauge(lambda p: max(0, p.overflow())), labels=labels
+    )
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
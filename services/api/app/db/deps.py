@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import TypeVar
 
-from services.api.app.db.database import db_session
+from services.api.app.db.database import async_db_session, db_session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+T = TypeVar("T")
+
 
 def get_db() -> Generator[Session, None, None]:
     db = db_session()
@@ -12,3 +16,21 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    db = async_db_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def call_with_db(fn: Callable[..., T], *args: object) -> T:
+    """Run a sync handler with its own session, as `get_db` would inject it."""
+
+    db = db_session()
+    try:
+        return fn(*args, db)
+    finally:
+        db.close()
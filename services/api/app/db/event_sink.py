@@ -0,0 +1,292 @@
+"""Buffered EventLog writer.
+
+Routers call `log_event(db, ...)`. Rows are buffered on the Session and written when that
+unit of work commits, as one multi-row INSERT. A unit of work that rolls back drops its
+events, exactly as ORM-added rows would be. Savepoints (`db.begin_nested()`) are part of
+the enclosing unit of work: releasing one writes nothing, and rolling one back drops only
+the events logged inside it.
+
+HALO_EVENT_SINK_MODE:
+- sync (default): the INSERT runs inside the committing transaction.
+- async: the committed batch is appended to a spool file (fsync'd) under
+  HALO_EVENT_SPOOL_DIR and a background thread inserts it. Spool files are deleted only
+  after their INSERT commits and are replayed on startup, so every event is written at
+  least once. Event ids are primary keys and replays ignore conflicts, so a replay never
+  duplicates rows. A batch that still fails after HALO_EVENT_SPOOL_MAX_ATTEMPTS (default:
+  8, with doubling delays up to 30 s) is moved to `<spool dir>/dead_letter` and counted
+  in event_sink_dead_letter_total, so it cannot hold up the batches behind it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+from services.api.app.db.database import db_session, insert_ignoring_conflicts
+from services.api.app.db.models import EventLog
+from services.api.app.metrics import registry
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "halo.pending_events"
+_HANDOFF_KEY = "halo.committed_events"
+_SAVEPOINT_MARKS_KEY = "halo.savepoint_marks"
+
+# SQLite caps bound parameters per statement; 8 columns * 500 rows stays well below it.
+_MAX_ROWS_PER_INSERT = 500
+
+_MAX_RETRY_DELAY_S = 30.0
+
+
+def log_event(
+    db: Session,
+    *,
+    household_id: str,
+    user_id: str | None,
+    entity_type: str,
+    entity_id: str,
+    event_type: str,
+    event_payload: dict,
+) -> str:
+    event_id = uuid4().hex
+    if not db.in_transaction():
+        # Tie the buffer to a unit of work so a rollback() before any SQL still drops it.
+        db.begin()
+    db.info.setdefault(_PENDING_KEY, []).append(
+        {
+            "id": event_id,
+            "household_id": household_id,
+            "user_id": user_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "event_type": event_type,
+            "event_payload_json": event_payload,
+            "created_at": datetime.utcnow(),
+        }
+    )
+    return event_id
+
+
+def sink_mode() -> str:
+    mode = os.getenv("HALO_EVENT_SINK_MODE", "sync").strip().lower()
+    if mode not in {"sync", "async"}:
+        raise ValueError(f"Unknown HALO_EVENT_SINK_MODE={mode!r}. Expected sync or async.")
+    return mode
+
+
+def write_events(db: Session, rows: list[dict], *, ignore_duplicates: bool = False) -> None:
+    for start in range(0, len(rows), _MAX_ROWS_PER_INSERT):
+        chunk = rows[start : start + _MAX_ROWS_PER_INSERT]
+        if ignore_duplicates:
+            stmt = insert_ignoring_conflicts(db, EventLog, chunk)
+        else:
+            stmt = insert(EventLog).values(chunk)
+        db.execute(stmt)
+    registry.inc("event_sink_events_written_total", len(rows))
+
+
+@event.listens_for(Session, "before_commit")
+def _flush_pending_events(session: Session) -> None:
+    if session.in_nested_transaction():
+        # Releasing a savepoint; the events are written when the outer transaction commits.
+        return
+
+    rows = session.info.pop(_PENDING_KEY, None)
+    if not rows:
+        return
+
+    if sink_mode() == "async":
+        # Hand off only once the surrounding transaction has actually committed.
+        session.info.setdefault(_HANDOFF_KEY, []).extend(rows)
+        return
+
+    # event_log has FKs to rows that may still be pending in this unit of work.
+    session.flush()
+    start = time.perf_counter()
+    write_events(session, rows)
+    registry.observe("event_sink_flush_ms", (time.perf_counter() - start) * 1000)
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_off_committed_events(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+
+    rows = session.info.pop(_HANDOFF_KEY, None)
+    if rows:
+        get_spool_writer().submit(rows)
+
+
+@event.listens_for(Session, "after_transaction_create")
+def _mark_savepoint(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.nested:
+        marks = session.info.setdefault(_SAVEPOINT_MARKS_KEY, {})
+        marks[transaction] = len(session.info.get(_PENDING_KEY, ()))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_savepoints(session: Session, transaction: SessionTransaction) -> None:
+    if not transaction.nested and transaction.parent is None:
+        session.info.pop(_SAVEPOINT_MARKS_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending_events(session: Session, previous_transaction: SessionTransaction) -> None:
+    if previous_transaction.nested:
+        mark = session.info.get(_SAVEPOINT_MARKS_KEY, {}).pop(previous_transaction, None)
+        pending = session.info.get(_PENDING_KEY)
+        if mark is not None and pending is not None:
+            del pending[mark:]
+        return
+
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_HANDOFF_KEY, None)
+
+
+class SpoolWriter:
+    """Background writer for async mode, backed by an fsync'd on-disk spool."""
+
+    def __init__(
+        self, spool_dir: Path, *, retry_delay_s: float = 1.0, max_attempts: int = 8
+    ) -> None:
+        self._spool_dir = spool_dir
+        self._retry_delay_s = retry_delay_s
+        self._max_attempts = max(1, max_attempts)
+        self._queue: queue.Queue[Path | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._spool_dir.mkdir(parents=True, exist_ok=True)
+            # Replay anything a previous process spooled but never wrote.
+            for path in sorted(self._spool_dir.glob("*.jsonl")):
+                self._queue.put(path)
+            self._thread = threading.Thread(target=self._run, name="event-sink", daemon=True)
+            self._thread.start()
+        registry.gauge_callback("event_sink_spool_backlog", self._queue.qsize)
+
+    def submit(self, rows: list[dict]) -> None:
+        self.start()
+        path = self._spool_dir / f"{time.time_ns():020d}-{uuid4().hex[:8]}.jsonl"
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(path)
+        self._queue.put(path)
+
+    def drain(self, timeout_s: float = 10.0) -> bool:
+        """Block until every submitted batch is written (or timeout). Returns True if empty."""
+
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return self._queue.unfinished_tasks == 0
+
+    def stop(self, timeout_s: float = 10.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self.drain(timeout_s)
+        self._queue.put(None)
+        thread.join(timeout=timeout_s)
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                self._write_spooled(path)
+            finally:
+                self._queue.task_done()
+
+    def _write_spooled(self, path: Path) -> None:
+        error: Exception | None = None
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                rows = [_row_from_json(line) for line in path.read_text("utf-8").splitlines()]
+                with db_session() as db:
+                    write_events(db, rows, ignore_duplicates=True)
+                    db.commit()
+                path.unlink(missing_ok=True)
+                return
+            except FileNotFoundError:
+                return
+            except Exception as e:
+                error = e
+                registry.inc("event_sink_write_failures_total")
+                if self._thread is None:
+                    # Shutting down: leave the file for replay on next start.
+                    return
+                if attempt == self._max_attempts:
+                    break
+                time.sleep(min(self._retry_delay_s * 2 ** (attempt - 1), _MAX_RETRY_DELAY_S))
+
+        self._dead_letter(path, error)
+
+    def _dead_letter(self, path: Path, error: Exception | None) -> None:
+        dead_letter_dir = self._spool_dir / "dead_letter"
+        dead_letter_dir.mkdir(exist_ok=True)
+        path.replace(dead_letter_dir / path.name)
+        registry.inc("event_sink_dead_letter_total")
+        logger.error(
+            "event batch %s failed %d times; moved to %s",
+            path.name,
+            self._max_attempts,
+            dead_letter_dir,
+            exc_info=error,
+        )
+
+
+def _row_from_json(line: str) -> dict:
+    row = json.loads(line)
+    row["created_at"] = datetime.fromisoformat(row["created_at"])
+    return row
+
+
+_WRITER: SpoolWriter | None = None
+
+
+def get_spool_writer() -> SpoolWriter:
+    global _WRITER
+
+    spool_dir = Path(os.getenv("HALO_EVENT_SPOOL_DIR", ".local/event_spool")).expanduser()
+    if _WRITER is None or _WRITER._spool_dir != spool_dir:
+        if _WRITER is not None:
+            _WRITER.stop()
+        _WRITER = SpoolWriter(
+            spool_dir, max_attempts=int(os.getenv("HALO_EVENT_SPOOL_MAX_ATTEMPTS", "8"))
+        )
+    _WRITER.start()
+    return _WRITER
+
+
+def start_event_sink() -> None:
+    if sink_mode() == "async":
+        get_spool_writer()
+
+
+def stop_event_sink() -> None:
+    global _WRITER
+
+    if _WRITER is not None:
+        _WRITER.stop()
+        _WRITER = None
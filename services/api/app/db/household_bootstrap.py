@@ -0,0 +1,117 @@
+"""Get-or-create for the (household, user, preference) rows every command depends on.
+
+Pairs known to exist are remembered in a process-local TTL/LRU cache, so the steady-state
+command path issues no existence checks at all. On a miss, one
+`INSERT ... ON CONFLICT DO NOTHING` per table runs inside the caller's transaction; the
+pair is cached only once that transaction commits, so a rollback cannot leave the cache
+claiming rows that were never written.
+
+Env vars:
+- HALO_BOOTSTRAP_CACHE_SIZE (default: 10000) pairs remembered per process
+- HALO_BOOTSTRAP_CACHE_TTL_S (default: 300) bounds staleness if rows are deleted elsewhere
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+from services.api.app.db.database import insert_ignoring_conflicts
+from services.api.app.db.models import Household, Preference, User
+from services.api.app.metrics import registry
+from services.api.app.ttl_cache import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "halo.bootstrapped_pairs"
+
+_Key = tuple[str, str, str]  # (database url, household_id, user_id)
+
+
+@dataclass(frozen=True, slots=True)
+class BootstrapCacheConfig:
+    max_entries: int = 10_000
+    ttl_s: float = 300.0
+
+    @classmethod
+    def from_env(cls) -> "BootstrapCacheConfig":
+        return cls(
+            max_entries=int(os.getenv("HALO_BOOTSTRAP_CACHE_SIZE", "10000")),
+            ttl_s=float(os.getenv("HALO_BOOTSTRAP_CACHE_TTL_S", "300")),
+        )
+
+
+_CACHE: TTLCache[_Key, bool] | None = None
+
+
+def _cache() -> TTLCache[_Key, bool]:
+    global _CACHE
+
+    if _CACHE is None:
+        cfg = BootstrapCacheConfig.from_env()
+        _CACHE = TTLCache(max_entries=cfg.max_entries, ttl_s=cfg.ttl_s)
+    return _CACHE
+
+
+def clear_bootstrap_cache() -> None:
+    global _CACHE
+
+    _CACHE = None
+
+
+def ensure_household_user(db: Session, household_id: str, user_id: str) -> None:
+    key = (str(db.get_bind().url), household_id, user_id)
+    if key in _cache():
+        registry.inc("household_bootstrap_cache_total", labels={"result": "hit"})
+        return
+
+    registry.inc("household_bootstrap_cache_total", labels={"result": "miss"})
+    now = datetime.utcnow()
+    db.execute(
+        insert_ignoring_conflicts(
+            db, Household, [{"id": household_id, "name": household_id, "created_at": now}]
+        )
+    )
+    db.execute(
+        insert_ignoring_conflicts(
+            db,
+            User,
+            [
+                {
+                    "id": user_id,
+                    "household_id": household_id,
+                    "display_name": user_id,
+                    "created_at": now,
+                }
+            ],
+        )
+    )
+    db.execute(
+        insert_ignoring_conflicts(
+            db,
+            Preference,
+            [
+                {
+                    "household_id": household_id,
+                    "default_merchant": "amazon",
+                    "default_booking_vendor": None,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            ],
+        )
+    )
+    db.info.setdefault(_PENDING_KEY, set()).add(key)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_committed_pairs(session: Session) -> None:
+    for key in session.info.pop(_PENDING_KEY, ()):
+        _cache().put(key, True)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back_pairs(session: Session, previous_transaction: object) -> None:
+    del previous_transaction
+    session.info.pop(_PENDING_KEY, None)
@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Plain JSON everywhere except Postgres, where JSONB allows GIN indexing.
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _gin_index(name: str, column: str) -> Index:
+    return Index(name, column, postgresql_using="gin").ddl_if(dialect="postgresql")
+
 
 class Base(DeclarativeBase):
     pass
@@ -40,36 +48,58 @@ class Preference(Base):
 
 class ExecutionRequest(Base):
     __tablename__ = "execution_requests"
+    __table_args__ = (
+        Index("ix_execution_requests_household_id_routine_key", "household_id", "routine_key"),
+        Index("ix_execution_requests_household_id_verb", "household_id", "verb"),
+        _gin_index("ix_execution_requests_intent_gin", "normalized_intent_json"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), nullable=False)
+    household_id: Mapped[str] = mapped_column(
+        ForeignKey("households.id"), nullable=False, index=True
+    )
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False)
 
     channel: Mapped[str] = mapped_column(String, nullable=False)
     raw_command_text: Mapped[str] = mapped_column(String, nullable=False)
-    normalized_intent_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    normalized_intent_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
+    # Denormalized from normalized_intent_json so routine history is an index lookup.
+    verb: Mapped[str | None] = mapped_column(String, nullable=True)
+    routine_key: Mapped[str | None] = mapped_column(String, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
 
 class Draft(Base):
     __tablename__ = "drafts"
+    __table_args__ = (
+        Index("ix_drafts_routine_key", "routine_key"),
+        Index("ix_drafts_verb", "verb"),
+        _gin_index("ix_drafts_payload_gin", "draft_payload_json"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     execution_request_id: Mapped[str] = mapped_column(
-        ForeignKey("execution_requests.id"), nullable=False
+        ForeignKey("execution_requests.id"), nullable=False, index=True
     )
 
     verb: Mapped[str] = mapped_column(String, nullable=False)
     vendor: Mapped[str] = mapped_column(String, nullable=False)
     estimated_cost_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    draft_payload_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    draft_payload_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
+    routine_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Bumped with every DRAFT_MODIFIED event, in the same transaction (event rows may be
+    # written after the request returns; see db/event_sink.py).
+    modify_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
 
 class Confirmation(Base):
     __tablename__ = "confirmations"
+    __table_args__ = (Index("ix_confirmations_draft_id_confirmed_at", "draft_id", "confirmed_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False)
@@ -81,21 +111,32 @@ class Confirmation(Base):
 
 class Execution(Base):
     __tablename__ = "executions"
+    __table_args__ = (
+        # Keyset pagination of the activity feed: WHERE household_id = ? ORDER BY started_at, id.
+        Index("ix_executions_household_id_started_at_id", "household_id", "started_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False)
+    draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False, index=True)
+    # Denormalized from the execution request so the feed needs no join to filter.
+    household_id: Mapped[str | None] = mapped_column(ForeignKey("households.id"), nullable=True)
 
     status: Mapped[str] = mapped_column(String, nullable=False)
-    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, index=True
+    )
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     final_cost_cents: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    execution_payload_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    execution_payload_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
     error_message: Mapped[str | None] = mapped_column(String, nullable=True)
 
 
 class ReceiptArtifact(Base):
     __tablename__ = "receipt_artifacts"
+    __table_args__ = (
+        Index("ix_receipt_artifacts_execution_id_created_at", "execution_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     execution_id: Mapped[str] = mapped_column(ForeignKey("executions.id"), nullable=False)
@@ -109,6 +150,7 @@ class ReceiptArtifact(Base):
 
 class EventLog(Base):
     __tablename__ = "event_log"
+    __table_args__ = (Index("ix_event_log_entity", "entity_type", "entity_id", "event_type"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), nullable=False)
@@ -117,13 +159,16 @@ class EventLog(Base):
     entity_type: Mapped[str] = mapped_column(String, nullable=False)
     entity_id: Mapped[str] = mapped_column(String, nullable=False)
     event_type: Mapped[str] = mapped_column(String, nullable=False)
-    event_payload_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    event_payload_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
 
 
 class UsualItem(Base):
     __tablename__ = "usual_items"
+    __table_args__ = (
+        Index("ix_usual_items_household_id_created_at", "household_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), nullable=False)
@@ -136,6 +181,7 @@ class UsualItem(Base):
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (Index("ix_subscriptions_household_id_name", "household_id", "name"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), nullable=False)
@@ -149,6 +195,9 @@ class Subscription(Base):
 
 class BookingVendor(Base):
     __tablename__ = "booking_vendors"
+    __table_args__ = (
+        Index("ix_booking_vendors_household_id_created_at", "household_id", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), nullable=False)
@@ -158,3 +207,72 @@ class BookingVendor(Base):
     price_estimate_cents: Mapped[int] = mapped_column(Integer, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class RoutineStats(Base):
+    """Running autopilot rollup for one routine, folded forward on every DONE execution."""
+
+    __tablename__ = "routine_stats"
+
+    household_id: Mapped[str] = mapped_column(ForeignKey("households.id"), primary_key=True)
+    routine_key: Mapped[str] = mapped_column(String, primary_key=True)
+
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    cost_sum_cents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cost_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_items_json: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class VendorHealthBucket(Base):
+    """Hourly attempt/failure counters per vendor; household_id "" holds the vendor-wide row."""
+
+    __tablename__ = "vendor_health_buckets"
+    __table_args__ = (
+        Index("ix_vendor_health_buckets_household_id_bucket_start", "household_id", "bucket_start"),
+    )
+
+    vendor: Mapped[str] = mapped_column(String, primary_key=True)
+    household_id: Mapped[str] = mapped_column(String, primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failures: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class IntentCacheEntry(Base):
+    """Shared tier of the intent extraction cache; keyed by a hash of command + prompt + model."""
+
+    __tablename__ = "intent_cache_entries"
+    __table_args__ = (Index("ix_intent_cache_entries_expires_at", "expires_at"),)
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    model: Mapped[str] = mapped_column(String, nullable=False)
+    intent_json: Mapped[dict] = mapped_column(JSONDocument, nullable=False)
+    extract_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class ProductResolution(Base):
+    """Household item name (normalized) -> product it resolved to; pinned rows never expire."""
+
+    __tablename__ = "product_resolutions"
+
+    household_id: Mapped[str] = mapped_column(String, primary_key=True)
+    item_key: Mapped[str] = mapped_column(String, primary_key=True)
+    product_url: Mapped[str] = mapped_column(String, nullable=False)
+    asin: Mapped[str | None] = mapped_column(String, nullable=True)
+    source: Mapped[str] = mapped_column(String, nullable=False)
+    pinned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    resolved_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
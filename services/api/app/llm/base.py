@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from packages.shared.schemas.intent import IntentV1
 
@@ -14,3 +14,17 @@ class IntentExtractor(Protocol):
         user_id: str,
         clarification_answers: dict[str, str] | None = None,
     ) -> IntentV1: ...
+
+
+@runtime_checkable
+class AsyncIntentExtractor(Protocol):
+    """Extractors that can also run on the event loop (HALO_API_MODE=async)."""
+
+    async def aextract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1: ...
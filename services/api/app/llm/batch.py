@@ -0,0 +1,119 @@
+"""Concurrent intent extraction for `POST /v1/command/parse:batch`.
+
+Backfills, evaluations and replayed channel queues parse many commands at once. Commands in
+a batch are extracted concurrently, with at most HALO_PARSE_BATCH_CONCURRENCY in flight per
+request. Results come back in input order, each with its own timing. A command that fails
+does not fail the batch; its error is reported on its own result.
+
+Sync mode runs `extract` on a small per-request thread pool. Async mode awaits `aextract`
+when the extractor has it and otherwise runs `extract` on worker threads under the same
+limit.
+
+Env vars:
+- HALO_PARSE_BATCH_MAX_ITEMS (default: 100) commands accepted per request
+- HALO_PARSE_BATCH_CONCURRENCY (default: 8) extractions in flight per request
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import anyio
+from packages.shared.schemas.intent import IntentV1
+
+from services.api.app.llm.base import AsyncIntentExtractor, IntentExtractor
+from services.api.app.metrics import registry
+from services.api.app.models.command import CommandParseBatchResult, CommandParseRequest
+
+
+@dataclass(frozen=True, slots=True)
+class BatchParseConfig:
+    max_items: int = 100
+    concurrency: int = 8
+
+    @classmethod
+    def from_env(cls) -> "BatchParseConfig":
+        return cls(
+            max_items=int(os.getenv("HALO_PARSE_BATCH_MAX_ITEMS", "100")),
+            concurrency=max(1, int(os.getenv("HALO_PARSE_BATCH_CONCURRENCY", "8"))),
+        )
+
+
+def extract_batch(
+    extractor: IntentExtractor, commands: list[CommandParseRequest], *, concurrency: int
+) -> list[CommandParseBatchResult]:
+    workers = max(1, min(concurrency, len(commands)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="halo-parse") as pool:
+        return list(pool.map(lambda ic: _extract_one(extractor, *ic), enumerate(commands)))
+
+
+async def aextract_batch(
+    extractor: IntentExtractor, commands: list[CommandParseRequest], *, concurrency: int
+) -> list[CommandParseBatchResult]:
+    limiter = anyio.CapacityLimiter(max(1, concurrency))
+    results: list[CommandParseBatchResult | None] = [None] * len(commands)
+
+    async def _run(index: int, command: CommandParseRequest) -> None:
+        async with limiter:
+            if isinstance(extractor, AsyncIntentExtractor):
+                results[index] = await _aextract_one(extractor, index, command)
+            else:
+                results[index] = await anyio.to_thread.run_sync(
+                    _extract_one, extractor, index, command
+                )
+
+    async with anyio.create_task_group() as tg:
+        for index, command in enumerate(commands):
+            tg.start_soon(_run, index, command)
+    return [r for r in results if r is not None]
+
+
+def _extract_one(
+    extractor: IntentExtractor, index: int, command: CommandParseRequest
+) -> CommandParseBatchResult:
+    started = time.perf_counter()
+    try:
+        intent = extractor.extract(**_extract_kwargs(command))
+    except Exception as e:
+        return _result(index, started, error=e)
+    return _result(index, started, intent=intent)
+
+
+async def _aextract_one(
+    extractor: AsyncIntentExtractor, index: int, command: CommandParseRequest
+) -> CommandParseBatchResult:
+    started = time.perf_counter()
+    try:
+        intent = await extractor.aextract(**_extract_kwargs(command))
+    except Exception as e:
+        return _result(index, started, error=e)
+    return _result(index, started, intent=intent)
+
+
+def _extract_kwargs(command: CommandParseRequest) -> dict:
+    return {
+        "raw_command_text": command.raw_command_text,
+        "household_id": command.household_id,
+        "user_id": command.user_id,
+        "clarification_answers": command.clarification_answers,
+    }
+
+
+def _result(
+    index: int,
+    started: float,
+    *,
+    intent: IntentV1 | None = None,
+    error: Exception | None = None,
+) -> CommandParseBatchResult:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    registry.observe("parse_batch_item_ms", elapsed_ms)
+    if error is not None:
+        registry.inc("parse_batch_item_errors_total")
+        return CommandParseBatchResult(
+            index=index, elapsed_ms=elapsed_ms, error=f"{type(error).__name__}: {error}"
+        )
+    return CommandParseBatchResult(index=index, elapsed_ms=elapsed_ms, intent=intent)
@@ -0,0 +1,211 @@
+"""Circuit breaker and latency budget around LLM intent extraction.
+
+Without a guard, a slow provider makes every command wait out the full HTTP timeout and
+retries before failing closed, and concurrent commands all wait at once. The guard puts two
+limits on the LLM extractor:
+
+- Latency budget: each extraction gets at most HALO_LLM_BUDGET_S seconds, counting retries
+  and backoff. Sync calls enforce it through `http_client.llm_deadline`. Async calls are
+  also cancelled when it runs out.
+- Circuit breaker: after HALO_LLM_BREAKER_FAILURES consecutive failures or budget overruns,
+  the breaker opens and the LLM is not called for HALO_LLM_BREAKER_RESET_S seconds. It then
+  goes half-open and lets one probe request through. A successful probe closes the breaker;
+  a failed probe opens it again.
+
+When the LLM is skipped or fails, the deterministic rule extractor answers instead. Its
+intent is tagged with `params["degraded"]`, set to one of `breaker_open`,
+`budget_exceeded` or `llm_error`, and is stored and returned like any other intent.
+
+Metrics:
+- llm_breaker_state gauge (0 closed, 1 half-open, 2 open)
+- llm_breaker_trips_total
+- intent_degraded_total{reason}
+
+Env vars:
+- HALO_LLM_BUDGET_S (default: 8)
+- HALO_LLM_BREAKER_FAILURES (default: 5)
+- HALO_LLM_BREAKER_RESET_S (default: 30)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import anyio
+import httpx
+from packages.shared.schemas.intent import IntentV1
+
+from services.api.app.llm.base import AsyncIntentExtractor, IntentExtractor
+from services.api.app.llm.http_client import llm_deadline
+from services.api.app.metrics import registry
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+@dataclass(frozen=True, slots=True)
+class BreakerConfig:
+    budget_s: float = 8.0
+    failure_threshold: int = 5
+    reset_s: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "BreakerConfig":
+        return cls(
+            budget_s=float(os.getenv("HALO_LLM_BUDGET_S", "8")),
+            failure_threshold=max(1, int(os.getenv("HALO_LLM_BREAKER_FAILURES", "5"))),
+            reset_s=float(os.getenv("HALO_LLM_BREAKER_RESET_S", "30")),
+        )
+
+
+class CircuitBreaker:
+    def __init__(self, cfg: BreakerConfig, *, clock: Callable[[], float] = time.monotonic):
+        self._cfg = cfg
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        registry.set_gauge("llm_breaker_state", _STATE_GAUGE[CLOSED])
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the LLM now. In half-open state only one probe may."""
+
+        with self._lock:
+            if self._state == OPEN:
+                if self._clock() - self._opened_at < self._cfg.reset_s:
+                    return False
+                self._set_state(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._set_state(CLOSED)
+
+    def release_probe(self) -> None:
+        """Give up a call's slot without an outcome, e.g. when the caller was cancelled."""
+
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            probe_failed = self._state == HALF_OPEN
+            self._probing = False
+            if probe_failed or self._failures >= self._cfg.failure_threshold:
+                if self._state != OPEN:
+                    registry.inc("llm_breaker_trips_total")
+                self._opened_at = self._clock()
+                self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        registry.set_gauge("llm_breaker_state", _STATE_GAUGE[state])
+
+
+class GuardedIntentExtractor:
+    def __init__(
+        self,
+        *,
+        llm: IntentExtractor,
+        fallback: IntentExtractor,
+        cfg: BreakerConfig,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self._llm = llm
+        self._fallback = fallback
+        self._cfg = cfg
+        self.breaker = breaker or CircuitBreaker(cfg)
+
+    def extract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1:
+        kwargs = {
+            "raw_command_text": raw_command_text,
+            "household_id": household_id,
+            "user_id": user_id,
+            "clarification_answers": clarification_answers,
+        }
+        if not self.breaker.allow():
+            return self._degraded("breaker_open", **kwargs)
+
+        try:
+            with llm_deadline(self._cfg.budget_s):
+                intent = self._llm.extract(**kwargs)
+        except Exception as e:
+            return self._failed(e, **kwargs)
+        except BaseException:
+            self.breaker.release_probe()
+            raise
+
+        self.breaker.record_success()
+        return intent
+
+    async def aextract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1:
+        kwargs = {
+            "raw_command_text": raw_command_text,
+            "household_id": household_id,
+            "user_id": user_id,
+            "clarification_answers": clarification_answers,
+        }
+        if not self.breaker.allow():
+            return self._degraded("breaker_open", **kwargs)
+
+        try:
+            with anyio.fail_after(self._cfg.budget_s), llm_deadline(self._cfg.budget_s):
+                if isinstance(self._llm, AsyncIntentExtractor):
+                    intent = await self._llm.aextract(**kwargs)
+                else:
+                    intent = await anyio.to_thread.run_sync(lambda: self._llm.extract(**kwargs))
+        except Exception as e:
+            return self._failed(e, **kwargs)
+        except BaseException:
+            # Cancelled by the caller (client gone), not a provider failure. A half-open
+            # breaker must not wait forever for a probe that will never report back.
+            self.breaker.release_probe()
+            raise
+
+        self.breaker.record_success()
+        return intent
+
+    def _failed(self, error: Exception, **kwargs: object) -> IntentV1:
+        self.breaker.record_failure()
+        timed_out = isinstance(error, (TimeoutError, httpx.TimeoutException))
+        return self._degraded("budget_exceeded" if timed_out else "llm_error", **kwargs)
+
+    def _degraded(self, reason: str, **kwargs: object) -> IntentV1:
+        registry.inc("intent_degraded_total", labels={"reason": reason})
+        intent = self._fallback.extract(**kwargs)
+        return intent.model_copy(update={"params": {**intent.params, "degraded": reason}})
@@ -0,0 +1,108 @@
+"""Rules-first intent extraction with LLM fallback (HALO_LLM_PROVIDER=cascade).
+
+The deterministic rule extractor answers first. Its intent is returned as-is when it is
+confident enough and needs no clarification. Otherwise the LLM is asked. The LLM's answer is
+used unless it is less confident than the rules' answer, which also covers the LLM failing
+closed (confidence 0).
+
+Per-tier counts and latency are exported at `GET /metrics`, for tuning the threshold against
+LLM cost and p95 latency:
+- intent_cascade_total{tier=rules|llm}
+- intent_cascade_ms{tier=rules|llm} (the llm tier includes the rules pass before it)
+
+Env vars:
+- HALO_LLM_CASCADE_THRESHOLD (default: 0.8) minimum rule confidence to skip the LLM
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+
+import anyio
+from packages.shared.schemas.intent import IntentV1, VerbV1
+
+from services.api.app.llm.base import AsyncIntentExtractor, IntentExtractor
+from services.api.app.metrics import registry
+
+
+@dataclass(frozen=True, slots=True)
+class CascadeConfig:
+    threshold: float = 0.8
+
+    @classmethod
+    def from_env(cls) -> "CascadeConfig":
+        return cls(threshold=float(os.getenv("HALO_LLM_CASCADE_THRESHOLD", "0.8")))
+
+
+class CascadeIntentExtractor:
+    def __init__(self, *, rules: IntentExtractor, llm: IntentExtractor, cfg: CascadeConfig) -> None:
+        self._rules = rules
+        self._llm = llm
+        self._cfg = cfg
+
+    def extract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1:
+        kwargs = {
+            "raw_command_text": raw_command_text,
+            "household_id": household_id,
+            "user_id": user_id,
+            "clarification_answers": clarification_answers,
+        }
+        started = time.perf_counter()
+        ruled = self._rules.extract(**kwargs)
+        if self._settled(ruled):
+            return _served("rules", ruled, started)
+
+        return _served("llm", _preferred(ruled, self._llm.extract(**kwargs)), started)
+
+    async def aextract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1:
+        kwargs = {
+            "raw_command_text": raw_command_text,
+            "household_id": household_id,
+            "user_id": user_id,
+            "clarification_answers": clarification_answers,
+        }
+        started = time.perf_counter()
+        ruled = self._rules.extract(**kwargs)
+        if self._settled(ruled):
+            return _served("rules", ruled, started)
+
+        if isinstance(self._llm, AsyncIntentExtractor):
+            answered = await self._llm.aextract(**kwargs)
+        else:
+            answered = await anyio.to_thread.run_sync(lambda: self._llm.extract(**kwargs))
+        return _served("llm", _preferred(ruled, answered), started)
+
+    def _settled(self, intent: IntentV1) -> bool:
+        return (
+            intent.verb != VerbV1.UNSUPPORTED
+            and not intent.clarifications
+            and intent.confidence >= self._cfg.threshold
+        )
+
+
+def _preferred(ruled: IntentV1, answered: IntentV1) -> IntentV1:
+    return answered if answered.confidence >= ruled.confidence else ruled
+
+
+def _served(tier: str, intent: IntentV1, started: float) -> IntentV1:
+    registry.inc("intent_cascade_total", labels={"tier": tier})
+    registry.observe(
+        "intent_cascade_ms", (time.perf_counter() - started) * 1000, labels={"tier": tier}
+    )
+    return intent
@@ -0,0 +1,143 @@
+"""Item catalog and single-pass matcher for the rule-based intent extractor.
+
+Catalog names and synonyms are tokenized and inserted into a word trie once, at load time.
+Matching walks the command's tokens left to right and takes the longest catalog phrase
+starting at each token, skipping past it. The cost is proportional to the command length
+times the longest phrase, so it does not grow with catalog size. Households can carry
+thousands of SKUs and synonyms without slowing parsing down.
+
+Matched items come back in catalog order, as the old per-name scan returned them, not in
+the order the command mentions them. Words are matched whole, with a trailing plural "s"
+folded on both sides, so "detergents" still finds "detergent" (the old scan matched it as
+a substring) and "paper towel" now finds "paper towels".
+
+Catalog file (HALO_ITEM_CATALOG_PATH, JSON):
+
+    {
+      "default": [{"name": "paper towels", "synonyms": ["kitchen roll"]}],
+      "households": {"hh-1": [{"name": "oat milk", "synonyms": ["oatly"]}]}
+    }
+
+A household's catalog is the default entries plus its own. The built-in default below is
+used when no file is configured.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+_DEFAULT_ENTRIES: tuple[dict, ...] = (
+    {"name": "paper towels", "synonyms": []},
+    {"name": "detergent", "synonyms": []},
+    {"name": "pet food", "synonyms": []},
+)
+
+
+def _tokens(text: str) -> list[str]:
+    return [_singular(t) for t in _TOKEN.findall(text.lower())]
+
+
+def _singular(token: str) -> str:
+    # Crude, but symmetric: catalog phrases and commands are folded the same way.
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+@dataclass(frozen=True, slots=True)
+class MatchedItem:
+    name: str
+    quantity: int
+
+
+class ItemCatalog:
+    def __init__(self, entries: list[dict] | tuple[dict, ...]) -> None:
+        self._root: dict = {}
+        self._depth = 0
+        self._rank: dict[str, int] = {}
+        self.names: list[str] = []
+        for entry in entries:
+            name = str(entry["name"]).strip().lower()
+            if not name:
+                continue
+            self.names.append(name)
+            self._rank.setdefault(name, len(self._rank))
+            for phrase in (name, *(str(s) for s in entry.get("synonyms") or ())):
+                self._insert(_tokens(phrase), name)
+
+    def _insert(self, tokens: list[str], name: str) -> None:
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        # First definition wins, so household entries cannot shadow the default names.
+        node.setdefault(None, name)
+        self._depth = max(self._depth, len(tokens))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def match(self, text: str) -> list[MatchedItem]:
+        """Catalog items mentioned in `text`, in catalog order, each with its leading number."""
+
+        tokens = _tokens(text)
+        found: dict[str, int] = {}
+        i = 0
+        while i < len(tokens):
+            node, name, end = self._root, None, i
+            for j in range(i, min(len(tokens), i + self._depth)):
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                if None in node:
+                    name, end = node[None], j + 1
+            if name is None:
+                i += 1
+                continue
+            qty = int(tokens[i - 1]) if i > 0 and tokens[i - 1].isdigit() else 1
+            found.setdefault(name, max(1, qty))
+            i = end
+        ordered = sorted(found, key=self._rank.__getitem__)
+        return [MatchedItem(name=n, quantity=found[n]) for n in ordered]
+
+
+class CatalogSet:
+    """Default catalog plus per-household extensions, compiled lazily and memoized."""
+
+    def __init__(self, default: list[dict] | tuple[dict, ...], households: dict[str, list[dict]]):
+        self._default_entries = tuple(default)
+        self._household_entries = households
+        self._default = ItemCatalog(self._default_entries)
+        self._compiled: dict[str, ItemCatalog] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CatalogSet":
+        path = os.getenv("HALO_ITEM_CATALOG_PATH", "").strip()
+        if not path:
+            return cls(_DEFAULT_ENTRIES, {})
+        return cls.load(Path(path))
+
+    @classmethod
+    def load(cls, path: Path) -> "CatalogSet":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(data.get("default") or _DEFAULT_ENTRIES, data.get("households") or {})
+
+    def for_household(self, household_id: str) -> ItemCatalog:
+        extra = self._household_entries.get(household_id)
+        if not extra:
+            return self._default
+        with self._lock:
+            catalog = self._compiled.get(household_id)
+            if catalog is None:
+                catalog = ItemCatalog((*self._default_entries, *extra))
+                self._compiled[household_id] = catalog
+            return catalog
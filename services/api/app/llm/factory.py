@@ -2,15 +2,30 @@ from __future__ import annotations
 
 import os
 
+from services.api.app.components import components
 from services.api.app.llm.base import IntentExtractor
 from services.api.app.llm.fake import FakeIntentExtractor
 
 
 def get_intent_extractor() -> IntentExtractor:
+    """The process-wide extractor, built once by `build_intent_extractor`."""
+
+    return components().get("intent_extractor", build_intent_extractor)
+
+
+def get_rule_extractor() -> FakeIntentExtractor:
+    """The deterministic rule extractor on its own, for cheap early signals (e.g. speculation)."""
+
+    return components().get("rule_extractor", FakeIntentExtractor)
+
+
+def build_intent_extractor() -> IntentExtractor:
     """Select the intent extractor.
 
     Default is deterministic fake to keep local dev and tests stable.
-    Set HALO_LLM_PROVIDER=openai and OPENAI_API_KEY to enable OpenAI.
+    Set HALO_LLM_PROVIDER=openai and OPENAI_API_KEY to enable OpenAI, or
+    HALO_LLM_PROVIDER=cascade to try the deterministic rules first and fall back to OpenAI.
+    Either way OpenAI sits behind a circuit breaker and latency budget (see llm.breaker).
     """
 
     provider = os.getenv("HALO_LLM_PROVIDER", "fake").strip().lower()
@@ -19,15 +34,39 @@ def get_intent_extractor() -> IntentExtractor:
         return FakeIntentExtractor()
 
     if provider == "openai":
-        from services.api.app.llm.openai_extractor import (
-            OpenAIIntentExtractor,
-            default_openai_model,
+        return _build_openai_extractor(provider)
+
+    if provider == "cascade":
+        from services.api.app.llm.cascade import CascadeConfig, CascadeIntentExtractor
+
+        return CascadeIntentExtractor(
+            rules=FakeIntentExtractor(),
+            llm=_build_openai_extractor(provider),
+            cfg=CascadeConfig.from_env(),
         )
 
-        api_key = os.getenv("OPENAI_API_KEY", "").strip()
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY is required when HALO_LLM_PROVIDER=openai")
+    raise ValueError(f"Unknown HALO_LLM_PROVIDER={provider!r}. Expected fake, openai or cascade.")
+
+
+def _build_openai_extractor(provider: str) -> IntentExtractor:
+    from services.api.app.llm.breaker import BreakerConfig, GuardedIntentExtractor
+    from services.api.app.llm.intent_cache import get_intent_cache
+    from services.api.app.llm.openai_extractor import (
+        OpenAIIntentExtractor,
+        default_openai_model,
+    )
 
-        return OpenAIIntentExtractor(api_key=api_key, model=default_openai_model())
+    api_key = os.getenv("OPENAI_API_KEY", "").strip()
+    if not api_key:
+        raise ValueError(f"OPENAI_API_KEY is required when HALO_LLM_PROVIDER={provider}")
 
-    raise ValueError(f"Unknown HALO_LLM_PROVIDER={provider!r}. Expected fake or openai.")
+    return GuardedIntentExtractor(
+        llm=OpenAIIntentExtractor(
+            api_key=api_key,
+            model=default_openai_model(),
+            cache=get_intent_cache(),
+            fail_closed=False,
+        ),
+        fallback=FakeIntentExtractor(),
+        cfg=BreakerConfig.from_env(),
+    )
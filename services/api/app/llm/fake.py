@@ -4,13 +4,28 @@ import re
 
 from packages.shared.schemas.intent import ClarificationQuestionV1, IntentV1, VerbV1
 
+from services.api.app.llm.catalog import CatalogSet
+
+# Keyword triggers, each one compiled alternation (plain substring semantics).
+_CANCEL_TRIGGER = re.compile(r"cancel|unsubscribe|stop")
+_BOOK_TRIGGER = re.compile(r"book|schedule|reservation|reserve")
+_REORDER_TRIGGER = re.compile(
+    r"reorder|order|buy|purchase|restock|usual|running low|low on|like last time"
+)
+_USUAL_TRIGGER = re.compile(r"usual|like last time|running low|low on")
+
 
 class FakeIntentExtractor:
     """Deterministic intent extractor for tests and local dev.
 
-    This is not intended to be "smart". In production, use the OpenAI extractor.
+    This is not intended to be "smart". In production, use the OpenAI extractor (or the
+    cascade, which puts these rules in front of it). Item names come from a loadable
+    per-household catalog; see services.api.app.llm.catalog.
     """
 
+    def __init__(self, catalogs: CatalogSet | None = None) -> None:
+        self._catalogs = catalogs or CatalogSet.from_env()
+
     def extract(
         self,
         *,
@@ -19,13 +34,13 @@ class FakeIntentExtractor:
         user_id: str,
         clarification_answers: dict[str, str] | None = None,
     ) -> IntentV1:
-        del household_id, user_id
+        del user_id
         clarification_answers = clarification_answers or {}
 
         text = (raw_command_text or "").strip().lower()
 
         # Cancel subscription
-        if any(k in text for k in ("cancel", "unsubscribe", "stop")):
+        if _CANCEL_TRIGGER.search(text):
             sub = _extract_subscription_name(text) or clarification_answers.get("q0", "").strip()
             if not sub:
                 return IntentV1(
@@ -53,7 +68,7 @@ class FakeIntentExtractor:
             )
 
         # Book appointment
-        if any(k in text for k in ("book", "schedule", "reservation", "reserve")):
+        if _BOOK_TRIGGER.search(text):
             service = _extract_service(text)
             time_pref = "next_week" if "next week" in text else "soon"
             return IntentV1(
@@ -66,21 +81,10 @@ class FakeIntentExtractor:
             )
 
         # Reorder / order
-        items = _extract_items(text)
-        reorder_trigger = any(
-            k in text
-            for k in (
-                "reorder",
-                "order",
-                "buy",
-                "purchase",
-                "restock",
-                "usual",
-                "running low",
-                "low on",
-                "like last time",
-            )
-        )
+        items = [
+            {"name": m.name, "quantity": m.quantity}
+            for m in self._catalogs.for_household(household_id).match(text)
+        ]
         if items:
             return IntentV1(
                 verb=VerbV1.REORDER,
@@ -91,11 +95,8 @@ class FakeIntentExtractor:
                 clarifications=[],
             )
 
-        if reorder_trigger:
-            implies_usual = any(
-                k in text for k in ("usual", "like last time", "running low", "low on")
-            )
-            if implies_usual:
+        if _REORDER_TRIGGER.search(text):
+            if _USUAL_TRIGGER.search(text):
                 return IntentV1(
                     verb=VerbV1.REORDER,
                     object="usual",
@@ -147,27 +148,3 @@ def _extract_service(text: str) -> str:
     if any(k in text for k in ("restaurant", "dinner", "resy")):
         return "restaurant"
     return "appointment"
-
-
-def _extract_items(text: str) -> list[dict[str, object]]:
-    # Very small deterministic parser for a few common household nouns.
-    catalog = [
-        "paper towels",
-        "detergent",
-        "pet food",
-    ]
-
-    items: list[dict[str, object]] = []
-    for name in catalog:
-        if name in text:
-            # Try to find a quantity immediately before the item name.
-            qty = 1
-            m = re.search(rf"(\d+)\s+{re.escape(name)}", text)
-            if m:
-                try:
-                    qty = max(1, int(m.group(1)))
-                except ValueError:
-                    qty = 1
-            items.append({"name": name, "quantity": qty})
-
-    return items
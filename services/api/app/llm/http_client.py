@@ -0,0 +1,255 @@
+"""Shared, pooled HTTP clients for LLM provider calls.
+
+One `httpx.Client` (and one `httpx.AsyncClient` for the async request path) per process
+keeps TCP+TLS connections alive between extractions instead of handshaking on every
+command. Requests that fail with 429/5xx or a connect error are retried with full-jitter
+exponential backoff; a `Retry-After` header is honored up to the backoff cap.
+
+Inside `llm_deadline(budget_s)` every attempt's timeout is clipped to the time left, and no
+retry is started that could not finish in it, so a request (retries included) cannot outlive
+its caller's latency budget; `LLMBudgetExceeded` is raised instead.
+
+Requests use paths relative to the provider's base URL, so an OpenAI-compatible endpoint
+(a proxy, or scripts/openai_standin.py for offline load tests) can take its place.
+
+Env vars:
+- OPENAI_BASE_URL (default: https://api.openai.com/v1)
+- HALO_LLM_CONNECT_TIMEOUT_S (default: 5)
+- HALO_LLM_READ_TIMEOUT_S (default: 45)
+- HALO_LLM_MAX_RETRIES (default: 2) retries after the first attempt
+- HALO_LLM_BACKOFF_BASE_S (default: 0.5)
+- HALO_LLM_BACKOFF_MAX_S (default: 8)
+- HALO_LLM_MAX_CONNECTIONS (default: 20)
+- HALO_LLM_MAX_KEEPALIVE (default: 10) idle connections kept open
+- HALO_LLM_HTTP2 (default: false) requires the `h2` package
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import anyio
+import httpx
+
+from services.api.app.metrics import registry
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class LLMHTTPError(RuntimeError):
+    def __init__(self, status_code: int, body: str) -> None:
+        super().__init__(f"OpenAI HTTP {status_code}: {body}")
+        self.status_code = status_code
+
+
+class LLMBudgetExceeded(TimeoutError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class LLMHTTPConfig:
+    base_url: str = "https://api.openai.com/v1"
+    connect_timeout_s: float = 5.0
+    read_timeout_s: float = 45.0
+    max_retries: int = 2
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 8.0
+    max_connections: int = 20
+    max_keepalive: int = 10
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "LLMHTTPConfig":
+        return cls(
+            base_url=os.getenv("OPENAI_BASE_URL", "").strip() or "https://api.openai.com/v1",
+            connect_timeout_s=float(os.getenv("HALO_LLM_CONNECT_TIMEOUT_S", "5")),
+            read_timeout_s=float(os.getenv("HALO_LLM_READ_TIMEOUT_S", "45")),
+            max_retries=int(os.getenv("HALO_LLM_MAX_RETRIES", "2")),
+            backoff_base_s=float(os.getenv("HALO_LLM_BACKOFF_BASE_S", "0.5")),
+            backoff_max_s=float(os.getenv("HALO_LLM_BACKOFF_MAX_S", "8")),
+            max_connections=int(os.getenv("HALO_LLM_MAX_CONNECTIONS", "20")),
+            max_keepalive=int(os.getenv("HALO_LLM_MAX_KEEPALIVE", "10")),
+            http2=_parse_bool(os.getenv("HALO_LLM_HTTP2", "false")),
+        )
+
+    def client_kwargs(self) -> dict:
+        if self.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ValueError("HALO_LLM_HTTP2=true requires the h2 package") from e
+
+        return {
+            "base_url": self.base_url,
+            "timeout": self.timeout(),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+            ),
+            "http2": self.http2,
+        }
+
+    def timeout(self, limit_s: float | None = None) -> httpx.Timeout:
+        read_s, connect_s = self.read_timeout_s, self.connect_timeout_s
+        if limit_s is not None:
+            read_s, connect_s = min(read_s, limit_s), min(connect_s, limit_s)
+        return httpx.Timeout(read_s, connect=connect_s, pool=connect_s)
+
+    def backoff_s(self, attempt: int, response: httpx.Response | None) -> float:
+        cap = min(self.backoff_max_s, self.backoff_base_s * (2**attempt))
+        retry_after = _retry_after_s(response)
+        if retry_after is not None:
+            return min(self.backoff_max_s, retry_after)
+        return random.uniform(0, cap)
+
+
+def _retry_after_s(response: httpx.Response | None) -> float | None:
+    if response is None:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("retry-after", "")))
+    except ValueError:
+        return None
+
+
+_LOCK = threading.Lock()
+_CONFIG: LLMHTTPConfig | None = None
+_CLIENT: httpx.Client | None = None
+_ASYNC_CLIENT: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
+
+def _config() -> LLMHTTPConfig:
+    global _CONFIG
+
+    if _CONFIG is None:
+        _CONFIG = LLMHTTPConfig.from_env()
+    return _CONFIG
+
+
+def get_llm_client() -> httpx.Client:
+    global _CLIENT
+
+    with _LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(**_config().client_kwargs())
+        return _CLIENT
+
+
+def get_async_llm_client() -> httpx.AsyncClient:
+    """Pooled async client for the running event loop.
+
+    Async connections belong to the loop that opened them; a client left over from another
+    loop (e.g. a previous TestClient) is dropped rather than reused.
+    """
+
+    global _ASYNC_CLIENT
+
+    loop = asyncio.get_running_loop()
+    with _LOCK:
+        if _ASYNC_CLIENT is None or _ASYNC_CLIENT[0] is not loop:
+            _ASYNC_CLIENT = (loop, httpx.AsyncClient(**_config().client_kwargs()))
+        return _ASYNC_CLIENT[1]
+
+
+async def close_llm_clients() -> None:
+    """Close pooled connections; the next call builds fresh clients from env."""
+
+    global _CONFIG, _CLIENT, _ASYNC_CLIENT
+
+    with _LOCK:
+        client, async_client = _CLIENT, _ASYNC_CLIENT
+        _CONFIG = _CLIENT = _ASYNC_CLIENT = None
+    if client is not None:
+        client.close()
+    if async_client is not None and async_client[0] is asyncio.get_running_loop():
+        await async_client[1].aclose()
+
+
+_DEADLINE: ContextVar[float | None] = ContextVar("halo_llm_deadline", default=None)
+
+
+@contextlib.contextmanager
+def llm_deadline(budget_s: float) -> Iterator[None]:
+    """Bound every LLM request made in this context to `budget_s` seconds from now."""
+
+    token = _DEADLINE.set(time.monotonic() + budget_s)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def _attempt_timeout(cfg: LLMHTTPConfig) -> httpx.Timeout:
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return cfg.timeout()
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise LLMBudgetExceeded("LLM latency budget exhausted")
+    return cfg.timeout(left)
+
+
+def _backoff_within_deadline(
+    cfg: LLMHTTPConfig, attempt: int, response: httpx.Response | None
+) -> float:
+    delay = cfg.backoff_s(attempt, response)
+    deadline = _DEADLINE.get()
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        raise LLMBudgetExceeded("LLM latency budget exhausted before retry")
+    return delay
+
+
+def post_json(url: str, *, headers: dict[str, str], body: dict) -> dict:
+    cfg = _config()
+    client = get_llm_client()
+    for attempt in range(cfg.max_retries + 1):
+        response = None
+        try:
+            response = client.post(url, headers=headers, json=body, timeout=_attempt_timeout(cfg))
+        except httpx.ConnectError:
+            if attempt == cfg.max_retries:
+                raise
+        else:
+            if response.status_code < 400:
+                return response.json()
+            if response.status_code not in _RETRY_STATUSES or attempt == cfg.max_retries:
+                raise LLMHTTPError(response.status_code, response.text)
+        delay = _backoff_within_deadline(cfg, attempt, response)
+        registry.inc("llm_http_retries_total")
+        time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+async def apost_json(url: str, *, headers: dict[str, str], body: dict) -> dict:
+    cfg = _config()
+    client = get_async_llm_client()
+    for attempt in range(cfg.max_retries + 1):
+        response = None
+        try:
+            response = await client.post(
+                url, headers=headers, json=body, timeout=_attempt_timeout(cfg)
+            )
+        except httpx.ConnectError:
+            if attempt == cfg.max_retries:
+                raise
+        else:
+            if response.status_code < 400:
+                return response.json()
+            if response.status_code not in _RETRY_STATUSES or attempt == cfg.max_retries:
+                raise LLMHTTPError(response.status_code, response.text)
+        delay = _backoff_within_deadline(cfg, attempt, response)
+        registry.inc("llm_http_retries_total")
+        await anyio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
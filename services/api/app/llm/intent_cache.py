@@ -0,0 +1,219 @@
+"""Two-tier cache for LLM intent extraction.
+
+Extraction is a pure function of the command text, the clarification answers, the model
+and the system prompt, so its result can be reused across households. Lookups try a
+process-local TTL/LRU map first, then the shared `intent_cache_entries` table so every
+replica benefits from one replica's LLM call. Entries are keyed by a hash of the
+normalized command, answers, model name and prompt hash; editing the prompt or switching
+models therefore starts from an empty cache without any explicit invalidation.
+
+Env vars:
+- HALO_INTENT_CACHE_ENABLED (default: true)
+- HALO_INTENT_CACHE_SIZE (default: 2048) entries held in memory per process
+- HALO_INTENT_CACHE_TTL_S (default: 86400) lifetime of an entry in both tiers
+- HALO_INTENT_CACHE_DB (default: true) consult and fill the shared table
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from packages.shared.schemas.intent import IntentV1
+from sqlalchemy import select
+
+from services.api.app.db.database import db_session, insert_or_update
+from services.api.app.db.models import IntentCacheEntry
+from services.api.app.llm.base import IntentExtractor
+from services.api.app.metrics import registry
+from services.api.app.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class IntentCacheConfig:
+    enabled: bool = True
+    max_entries: int = 2048
+    ttl_s: float = 86_400.0
+    db_tier: bool = True
+
+    @classmethod
+    def from_env(cls) -> "IntentCacheConfig":
+        return cls(
+            enabled=_parse_bool(os.getenv("HALO_INTENT_CACHE_ENABLED", "true")),
+            max_entries=int(os.getenv("HALO_INTENT_CACHE_SIZE", "2048")),
+            ttl_s=float(os.getenv("HALO_INTENT_CACHE_TTL_S", "86400")),
+            db_tier=_parse_bool(os.getenv("HALO_INTENT_CACHE_DB", "true")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class IntentCacheOutcome:
+    """How one extraction was served; recorded on the INTENT_EXTRACTED event.
+
+    `llm_ms` is the latency of the LLM call that produced the intent. On a hit that call
+    happened earlier, so it is the latency this request saved.
+    """
+
+    hit: bool
+    tier: str | None  # "memory" | "db" | None on a miss
+    llm_ms: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Cached:
+    intent: IntentV1
+    llm_ms: int
+
+
+def intent_cache_key(
+    *,
+    raw_command_text: str,
+    clarification_answers: dict[str, str],
+    model: str,
+    system_prompt: str,
+) -> str:
+    normalized = _WHITESPACE.sub(" ", raw_command_text).strip().casefold()
+    material = json.dumps(
+        [
+            normalized,
+            sorted(clarification_answers.items()),
+            model,
+            hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class IntentCache:
+    def __init__(self, cfg: IntentCacheConfig) -> None:
+        self._cfg = cfg
+        self._memory: TTLCache[str, _Cached] = TTLCache(
+            max_entries=cfg.max_entries, ttl_s=cfg.ttl_s
+        )
+
+    def get(self, key: str) -> tuple[IntentV1, IntentCacheOutcome] | None:
+        cached = self._memory.get(key)
+        if cached is not None:
+            return self._hit(cached, "memory")
+
+        if self._cfg.db_tier:
+            cached = self._db_get(key)
+            if cached is not None:
+                self._memory.put(key, cached)
+                return self._hit(cached, "db")
+
+        registry.inc("intent_cache_total", labels={"result": "miss"})
+        return None
+
+    def put(self, key: str, *, model: str, intent: IntentV1, llm_ms: int) -> None:
+        self._memory.put(key, _Cached(intent=intent.model_copy(deep=True), llm_ms=llm_ms))
+        if self._cfg.db_tier:
+            self._db_put(key, model=model, intent=intent, llm_ms=llm_ms)
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    def _hit(self, cached: _Cached, tier: str) -> tuple[IntentV1, IntentCacheOutcome]:
+        registry.inc("intent_cache_total", labels={"result": tier})
+        registry.inc("intent_cache_saved_ms_total", cached.llm_ms)
+        # Callers may mutate params; never hand out the cached instance itself.
+        outcome = IntentCacheOutcome(hit=True, tier=tier, llm_ms=cached.llm_ms)
+        return cached.intent.model_copy(deep=True), outcome
+
+    # The shared tier is best effort: a failing lookup or write costs an LLM call, never
+    # the command. Each uses its own short session, so no transaction spans the LLM call.
+
+    def _db_get(self, key: str) -> _Cached | None:
+        try:
+            with db_session() as db:
+                row = db.execute(
+                    select(IntentCacheEntry.intent_json, IntentCacheEntry.extract_ms).where(
+                        IntentCacheEntry.key == key,
+                        IntentCacheEntry.expires_at > datetime.utcnow(),
+                    )
+                ).first()
+        except Exception:
+            logger.warning("intent cache lookup failed", exc_info=True)
+            return None
+        if row is None:
+            return None
+        return _Cached(intent=IntentV1.model_validate(row.intent_json), llm_ms=row.extract_ms)
+
+    def _db_put(self, key: str, *, model: str, intent: IntentV1, llm_ms: int) -> None:
+        now = datetime.utcnow()
+        row = {
+            "key": key,
+            "model": model,
+            "intent_json": intent.model_dump(mode="json"),
+            "extract_ms": llm_ms,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=self._cfg.ttl_s),
+        }
+        try:
+            with db_session() as db:
+                db.execute(insert_or_update(db, IntentCacheEntry, row, key=["key"]))
+                db.commit()
+        except Exception:
+            logger.warning("intent cache write failed", exc_info=True)
+
+
+_CACHE: IntentCache | None = None
+
+
+def get_intent_cache() -> IntentCache | None:
+    """Process-wide cache, or None when HALO_INTENT_CACHE_ENABLED=false."""
+
+    global _CACHE
+
+    cfg = IntentCacheConfig.from_env()
+    if not cfg.enabled:
+        return None
+    if _CACHE is None:
+        _CACHE = IntentCache(cfg)
+    return _CACHE
+
+
+def clear_intent_cache() -> None:
+    global _CACHE
+
+    if _CACHE is not None:
+        # Memoized extractors still hold this instance; empty it rather than orphan it.
+        _CACHE.clear_memory()
+    _CACHE = None
+
+
+_OUTCOME: ContextVar[IntentCacheOutcome | None] = ContextVar("halo_intent_cache_outcome")
+
+
+def record_cache_outcome(outcome: IntentCacheOutcome) -> None:
+    _OUTCOME.set(outcome)
+
+
+def extract_observing_cache(
+    extractor: IntentExtractor, **kwargs: object
+) -> tuple[IntentV1, IntentCacheOutcome | None]:
+    """Run `extractor.extract(**kwargs)` and report how its cache served it.
+
+    The outcome is None for extractors without a cache (e.g. the fake extractor).
+    """
+
+    token = _OUTCOME.set(None)
+    try:
+        intent = extractor.extract(**kwargs)
+        return intent, _OUTCOME.get()
+    finally:
+        _OUTCOME.reset(token)
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
@@ -2,21 +2,44 @@ from __future__ import annotations
 
 import json
 import os
-import urllib.error
-import urllib.request
+import time
 
+import anyio
 from packages.shared.schemas.intent import ClarificationQuestionV1, IntentV1, VerbV1
 
+from services.api.app.llm.http_client import apost_json, post_json
+from services.api.app.llm.intent_cache import (
+    IntentCache,
+    IntentCacheOutcome,
+    intent_cache_key,
+    record_cache_outcome,
+)
+
+# Relative to OPENAI_BASE_URL (see http_client).
+_CHAT_COMPLETIONS_URL = "chat/completions"
+
 
 class OpenAIIntentExtractor:
     """Intent extraction via OpenAI.
 
-    This uses a strict JSON-only response and validates against IntentV1.
+    This uses a strict JSON-only response and validates against IntentV1. `aextract` is the
+    event-loop variant used by the async API; both share the pooled clients in http_client.
+    With `fail_closed=False` provider and validation errors are raised instead of being turned
+    into an UNSUPPORTED intent, so a caller (see llm.breaker) can tell them apart.
     """
 
-    def __init__(self, *, api_key: str, model: str) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        model: str,
+        cache: IntentCache | None = None,
+        fail_closed: bool = True,
+    ) -> None:
         self._api_key = api_key
         self._model = model
+        self._cache = cache
+        self._fail_closed = fail_closed
 
     def extract(
         self,
@@ -29,40 +52,141 @@ class OpenAIIntentExtractor:
         del household_id, user_id
         clarification_answers = clarification_answers or {}
 
-        system = _SYSTEM_PROMPT
-        user_payload = {
-            "command": raw_command_text,
-            "clarification_answers": clarification_answers,
-        }
+        cache_key = self._cache_key(raw_command_text, clarification_answers)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            intent, outcome = cached
+            record_cache_outcome(outcome)
+            return intent
 
         try:
+            started = time.perf_counter()
             content = _openai_chat_json(
                 api_key=self._api_key,
                 model=self._model,
-                system_prompt=system,
-                user_json=user_payload,
+                system_prompt=_SYSTEM_PROMPT,
+                user_json=_user_payload(raw_command_text, clarification_answers),
             )
-            data = json.loads(content)
-            return IntentV1.model_validate(data)
+            intent = IntentV1.model_validate(json.loads(content))
         except Exception as e:
-            # Fail closed: do not guess execution details.
-            return IntentV1(
-                verb=VerbV1.UNSUPPORTED,
-                object="",
-                params={"error": str(e)},
-                confidence=0.0,
-                routine_key="UNSUPPORTED",
-                clarifications=[
-                    ClarificationQuestionV1(
-                        id="q0",
-                        prompt=(
-                            "Which action do you want Halo to take?"
-                            " (Supported: REORDER, CANCEL_SUBSCRIPTION, BOOK_APPOINTMENT)"
-                        ),
-                        choices=["REORDER", "CANCEL_SUBSCRIPTION", "BOOK_APPOINTMENT"],
-                    )
-                ],
+            if not self._fail_closed:
+                raise
+            return _fail_closed(e)
+
+        outcome = self._store(cache_key, intent, started)
+        if outcome is not None:
+            record_cache_outcome(outcome)
+        return intent
+
+    async def aextract(
+        self,
+        *,
+        raw_command_text: str,
+        household_id: str,
+        user_id: str,
+        clarification_answers: dict[str, str] | None = None,
+    ) -> IntentV1:
+        del household_id, user_id
+        clarification_answers = clarification_answers or {}
+
+        # The shared cache tier is a sync DB call; keep it off the event loop.
+        cache_key = self._cache_key(raw_command_text, clarification_answers)
+        cached = await anyio.to_thread.run_sync(self._cached, cache_key)
+        if cached is not None:
+            intent, outcome = cached
+            record_cache_outcome(outcome)
+            return intent
+
+        try:
+            started = time.perf_counter()
+            content = await _aopenai_chat_json(
+                api_key=self._api_key,
+                model=self._model,
+                system_prompt=_SYSTEM_PROMPT,
+                user_json=_user_payload(raw_command_text, clarification_answers),
             )
+            intent = IntentV1.model_validate(json.loads(content))
+        except Exception as e:
+            if not self._fail_closed:
+                raise
+            return _fail_closed(e)
+
+        outcome = await anyio.to_thread.run_sync(self._store, cache_key, intent, started)
+        if outcome is not None:
+            record_cache_outcome(outcome)
+        return intent
+
+    def _cache_key(self, raw_command_text: str, clarification_answers: dict[str, str]) -> str:
+        return intent_cache_key(
+            raw_command_text=raw_command_text,
+            clarification_answers=clarification_answers,
+            model=self._model,
+            system_prompt=_SYSTEM_PROMPT,
+        )
+
+    def _cached(self, cache_key: str) -> tuple[IntentV1, IntentCacheOutcome] | None:
+        if self._cache is None:
+            return None
+        return self._cache.get(cache_key)
+
+    def _store(self, cache_key: str, intent: IntentV1, started: float) -> IntentCacheOutcome | None:
+        # Only validated model output is cached; the fail-closed intent never is.
+        if self._cache is None:
+            return None
+        llm_ms = int((time.perf_counter() - started) * 1000)
+        self._cache.put(cache_key, model=self._model, intent=intent, llm_ms=llm_ms)
+        return IntentCacheOutcome(hit=False, tier=None, llm_ms=llm_ms)
+
+
+def _user_payload(raw_command_text: str, clarification_answers: dict[str, str]) -> dict:
+    return {
+        "command": raw_command_text,
+        "clarification_answers": clarification_answers,
+    }
+
+
+def _fail_closed(e: Exception) -> IntentV1:
+    # Fail closed: do not guess execution details.
+    return IntentV1(
+        verb=VerbV1.UNSUPPORTED,
+        object="",
+        params={"error": str(e)},
+        confidence=0.0,
+        routine_key="UNSUPPORTED",
+        clarifications=[
+            ClarificationQuestionV1(
+                id="q0",
+                prompt=(
+                    "Which action do you want Halo to take?"
+                    " (Supported: REORDER, CANCEL_SUBSCRIPTION, BOOK_APPOINTMENT)"
+                ),
+                choices=["REORDER", "CANCEL_SUBSCRIPTION", "BOOK_APPOINTMENT"],
+            )
+        ],
+    )
+
+
+def _chat_request(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> dict:
+    return {
+        "headers": {"Authorization": f"Bearer {api_key}"},
+        "body": {
+            "model": model,
+            "temperature": 0,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": json.dumps(user_json)},
+            ],
+            # Ask for JSON object only.
+            "response_format": {"type": "json_object"},
+        },
+    }
+
+
+def _chat_content(payload: dict) -> str:
+    try:
+        return payload["choices"][0]["message"]["content"]
+    except Exception as e:
+        raise RuntimeError(f"Unexpected OpenAI response shape: {payload!r}") from e
 
 
 def _openai_chat_json(
@@ -72,34 +196,23 @@ def _openai_chat_json(
     system_prompt: str,
     user_json: dict,
 ) -> str:
-    url = "https://api.openai.com/v1/chat/completions"
-
-    body = {
-        "model": model,
-        "temperature": 0,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(user_json)},
-        ],
-        # Ask for JSON object only.
-        "response_format": {"type": "json_object"},
-    }
-
-    req = urllib.request.Request(url, method="POST")
-    req.add_header("Authorization", f"Bearer {api_key}")
-    req.add_header("Content-Type", "application/json")
+    request = _chat_request(
+        api_key=api_key, model=model, system_prompt=system_prompt, user_json=user_json
+    )
+    return _chat_content(post_json(_CHAT_COMPLETIONS_URL, **request))
 
-    try:
-        with urllib.request.urlopen(req, data=json.dumps(body).encode("utf-8"), timeout=45) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        raw = e.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"OpenAI HTTP {e.code}: {raw}") from e
 
-    try:
-        return payload["choices"][0]["message"]["content"]
-    except Exception as e:
-        raise RuntimeError(f"Unexpected OpenAI response shape: {payload!r}") from e
+async def _aopenai_chat_json(
+    *,
+    api_key: str,
+    model: str,
+    system_prompt: str,
+    user_json: dict,
+) -> str:
+    request = _chat_request(
+        api_key=api_key, model=model, system_prompt=system_prompt, user_json=user_json
+    )
+    return _chat_content(await apost_json(_CHAT_COMPLETIONS_URL, **request))
 
 
 _SYSTEM_PROMPT = """You are an intent extraction engine for Halo.
@@ -1,26 +1,76 @@
-"""Halo API service entrypoint."""
+"""Halo API service entrypoint.
+
+HALO_API_MODE selects the router implementation:
+- sync (default): every endpoint is a sync `def` on a sync Session (tests, local dev).
+- async: reads run on the event loop via AsyncSession; command/draft pipelines run on a
+  dedicated bounded limiter so slow LLM/browser calls cannot starve them.
+"""
+
+import os
 
 from fastapi import FastAPI
 
+from services.api.app.components import reload_components, start_components
+from services.api.app.concurrency import install_slow_path_limiter
+from services.api.app.db.database import dispose_async_engine
+from services.api.app.db.event_sink import start_event_sink, stop_event_sink
 from services.api.app.db.init_db import init_db
-from services.api.app.routers.audit import router as audit_router
-from services.api.app.routers.command import router as command_router
-from services.api.app.routers.draft import router as draft_router
+from services.api.app.llm.http_client import close_llm_clients
+from services.api.app.metrics import registry as metrics_registry
 from services.api.app.routers.order import router as order_router
+from services.api.app.routers.vendors import router as vendors_router
+
+
+def api_mode() -> str:
+    mode = os.getenv("HALO_API_MODE", "sync").strip().lower()
+    if mode not in {"sync", "async"}:
+        raise ValueError(f"Unknown HALO_API_MODE={mode!r}. Expected sync or async.")
+    return mode
+
+
+def create_app() -> FastAPI:
+    mode = api_mode()
+    app = FastAPI(title="Halo API")
+    app.state.api_mode = mode
+
+    if mode == "async":
+        from services.api.app.routers.audit_async import router as audit_router
+        from services.api.app.routers.command_async import router as command_router
+        from services.api.app.routers.draft_async import router as draft_router
+    else:
+        from services.api.app.routers.audit import router as audit_router
+        from services.api.app.routers.command import router as command_router
+        from services.api.app.routers.draft import router as draft_router
+
+    app.include_router(order_router)
+    app.include_router(command_router)
+    app.include_router(draft_router)
+    app.include_router(audit_router)
+    app.include_router(vendors_router)
+
+    @app.on_event("startup")
+    def _startup() -> None:
+        init_db()
+        install_slow_path_limiter(app)
+        start_event_sink()
+        start_components()
 
-app = FastAPI(title="Halo API")
+    @app.on_event("shutdown")
+    async def _shutdown() -> None:
+        stop_event_sink()
+        reload_components()
+        await close_llm_clients()
+        await dispose_async_engine()
 
-app.include_router(order_router)
-app.include_router(command_router)
-app.include_router(draft_router)
-app.include_router(audit_router)
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "ok"}
 
+    @app.get("/metrics")
+    def metrics() -> dict:
+        return metrics_registry.snapshot()
 
-@app.on_event("startup")
-def _startup() -> None:
-    init_db()
+    return app
 
 
-@app.get("/health")
-def health() -> dict:
-    return {"status": "ok"}
+app = create_app()
@@ -0,0 +1,132 @@
+"""Process-local metrics registry.
+
+Deliberately tiny: counters, gauges (set directly or computed at snapshot time) and
+latency histograms, keyed by name plus optional labels. `GET /metrics` returns
+`registry.snapshot()` as JSON so operations can size pools and tune caches from data.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+
+_RESERVOIR_SIZE = 1024
+
+
+def _series_key(name: str, labels: dict[str, str] | None) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{rendered}}}"
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "min", "max", "_recent")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self._recent: deque[float] = deque(maxlen=_RESERVOIR_SIZE)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self._recent.append(value)
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        recent = sorted(self._recent)
+        return {
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "min": self.min,
+            "max": self.max,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": _quantile(recent, 0.50),
+            "p95": _quantile(recent, 0.95),
+            "p99": _quantile(recent, 0.99),
+        }
+
+
+def _quantile(sorted_values: list[float], q: float) -> float | None:
+    if not sorted_values:
+        return None
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._gauge_callbacks: dict[str, Callable[[], float | None]] = {}
+        self._histograms: dict[str, _Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, *, labels: dict[str, str] | None = None) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, *, labels: dict[str, str] | None = None) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def gauge_callback(
+        self,
+        name: str,
+        fn: Callable[[], float | None],
+        *,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        """Register a gauge evaluated lazily on every snapshot (replaces any previous one)."""
+
+        key = _series_key(name, labels)
+        with self._lock:
+            self._gauge_callbacks[key] = fn
+
+    def observe(self, name: str, value: float, *, labels: dict[str, str] | None = None) -> None:
+        key = _series_key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = _Histogram()
+            hist.observe(value)
+
+    def counter_value(self, name: str, *, labels: dict[str, str] | None = None) -> float:
+        with self._lock:
+            return self._counters.get(_series_key(name, labels), 0)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+            histograms = {k: h.snapshot() for k, h in self._histograms.items()}
+
+        for key, fn in callbacks.items():
+            try:
+                value = fn()
+            except Exception:
+                # Metrics must never break the caller.
+                continue
+            if value is not None:
+                gauges[key] = value
+
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    def reset(self) -> None:
+        """Drop all recorded values. Gauge callbacks stay registered."""
+
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+registry = MetricsRegistry()
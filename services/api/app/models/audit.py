@@ -42,3 +42,17 @@ class ExecutionDetail(BaseModel):
     error_message: str | None = None
 
     receipts: list[ReceiptArtifactOut] = Field(default_factory=list)
+
+
+# Upper bound on ids per POST /v1/executions:batchGet.
+MAX_BATCH_GET_IDS = 50
+
+
+class ExecutionBatchGetRequest(BaseModel):
+    execution_ids: list[str] = Field(..., min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class ExecutionBatchGetResponse(BaseModel):
+    # In request order (duplicates collapsed); unknown ids are listed in missing_ids.
+    executions: list[ExecutionDetail] = Field(default_factory=list)
+    missing_ids: list[str] = Field(default_factory=list)
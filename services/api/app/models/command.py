@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from packages.shared.schemas.intent import IntentV1
 from pydantic import BaseModel, Field
 
 
@@ -11,3 +12,20 @@ class CommandParseRequest(BaseModel):
 
     # Map of clarification question id -> answer.
     clarification_answers: dict[str, str] = Field(default_factory=dict)
+
+
+class CommandParseBatchRequest(BaseModel):
+    commands: list[CommandParseRequest] = Field(..., min_length=1)
+
+
+class CommandParseBatchResult(BaseModel):
+    # Position in the request's `commands`; results are returned in the same order.
+    index: int
+    elapsed_ms: float
+    intent: IntentV1 | None = None
+    error: str | None = None
+
+
+class CommandParseBatchResponse(BaseModel):
+    results: list[CommandParseBatchResult]
+    elapsed_ms: float
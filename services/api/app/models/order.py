@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -20,6 +22,8 @@ class OrderItemPriced(BaseModel):
     unit_price_cents: int
     line_total_cents: int
     product_url: str | None = None
+    # When unit_price_cents was read from the vendor; older than the draft if it was cached.
+    priced_at: datetime | None = None
 
 
 class OrderDraftResponse(BaseModel):
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class VendorWindowHealth(BaseModel):
+    attempts: int
+    failures: int
+    failure_rate: float
+
+
+class VendorHealth(BaseModel):
+    vendor: str
+    # Keyed by window name: "1h", "24h", "7d".
+    windows: dict[str, VendorWindowHealth] = Field(default_factory=dict)
+
+
+class VendorHealthResponse(BaseModel):
+    household_id: str | None = None
+    vendors: list[VendorHealth] = Field(default_factory=list)
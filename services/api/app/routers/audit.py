@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from services.api.app.db.deps import get_db
 from services.api.app.db.models import (
     Confirmation,
@@ -9,82 +15,227 @@ from services.api.app.db.models import (
     ExecutionRequest,
     ReceiptArtifact,
 )
-from services.api.app.models.audit import ExecutionDetail, ExecutionListItem, ReceiptArtifactOut
+from services.api.app.models.audit import (
+    ExecutionBatchGetRequest,
+    ExecutionBatchGetResponse,
+    ExecutionDetail,
+    ExecutionListItem,
+    ReceiptArtifactOut,
+)
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 
-
-@router.get("/v1/executions", response_model=list[ExecutionListItem])
-def list_executions(household_id: str, db: Session = Depends(get_db)) -> list[ExecutionListItem]:
-    rows = (
-        db.query(Execution, Draft, ExecutionRequest)
-        .join(Draft, Draft.id == Execution.draft_id)
-        .join(ExecutionRequest, ExecutionRequest.id == Draft.execution_request_id)
-        .filter(ExecutionRequest.household_id == household_id)
-        .order_by(Execution.started_at.desc())
-        .limit(200)
-        .all()
+# Before pagination the list returned up to 200 rows; keep that for clients that ignore the
+# cursor.
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 200
+
+# Opaque keyset cursor for the next page; absent on the last page. Sent as a header so the
+# response body stays a plain list for existing clients.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True, slots=True)
+class _ExecutionListQuery:
+    household_id: str
+    limit: int
+    after: tuple[datetime, str] | None = None
+    verb: str | None = None
+    status: str | None = None
+    vendor: str | None = None
+    started_from: datetime | None = None
+    started_to: datetime | None = None
+
+
+def _execution_list_query(
+    household_id: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    verb: str | None = None,
+    status: str | None = None,
+    vendor: str | None = None,
+    started_from: datetime | None = None,
+    started_to: datetime | None = None,
+) -> _ExecutionListQuery:
+    return _ExecutionListQuery(
+        household_id=household_id,
+        limit=limit,
+        after=_decode_cursor(cursor) if cursor else None,
+        verb=verb,
+        status=status,
+        vendor=vendor,
+        started_from=started_from,
+        started_to=started_to,
     )
 
-    out: list[ExecutionListItem] = []
-    for execution, draft, _req in rows:
-        out.append(
-            ExecutionListItem(
-                execution_id=execution.id,
-                draft_id=draft.id,
-                verb=draft.verb,
-                status=execution.status,
-                started_at=execution.started_at.isoformat(),
-                finished_at=execution.finished_at.isoformat() if execution.finished_at else None,
-                vendor=draft.vendor,
-                final_cost_cents=execution.final_cost_cents,
-            )
-        )
 
-    return out
+@router.get("/v1/executions", response_model=list[ExecutionListItem])
+def list_executions(
+    response: Response,
+    q: _ExecutionListQuery = Depends(_execution_list_query),
+    db: Session = Depends(get_db),
+) -> list[ExecutionListItem]:
+    rows = db.execute(_list_executions_stmt(q)).all()
+    return _list_page(rows, q, response)
 
 
 @router.get("/v1/executions/{execution_id}", response_model=ExecutionDetail)
 def get_execution(execution_id: str, db: Session = Depends(get_db)) -> ExecutionDetail:
-    row = (
-        db.query(Execution, Draft, ExecutionRequest)
+    details = _execution_details(db.execute(_execution_details_stmt([execution_id])).all())
+    if execution_id not in details:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return details[execution_id]
+
+
+@router.post("/v1/executions:batchGet", response_model=ExecutionBatchGetResponse)
+def batch_get_executions(
+    payload: ExecutionBatchGetRequest, db: Session = Depends(get_db)
+) -> ExecutionBatchGetResponse:
+    ids = list(dict.fromkeys(payload.execution_ids))
+    details = _execution_details(db.execute(_execution_details_stmt(ids)).all())
+    return _batch_get_response(ids, details)
+
+
+@router.get("/v1/receipts/{execution_id}", response_model=list[ReceiptArtifactOut])
+def get_receipts(execution_id: str, db: Session = Depends(get_db)) -> list[ReceiptArtifactOut]:
+    receipts = db.scalars(_receipts_stmt(execution_id)).all()
+    return [_receipt_out(r) for r in receipts]
+
+
+# Statements and row mapping are shared with the async router (audit_async.py).
+
+
+def _list_executions_stmt(q: _ExecutionListQuery) -> Select:
+    # Served by ix_executions_household_id_started_at_id; one extra row detects a next page.
+    stmt = (
+        select(Execution, Draft)
+        .join(Draft, Draft.id == Execution.draft_id)
+        .where(Execution.household_id == q.household_id)
+        .order_by(Execution.started_at.desc(), Execution.id.desc())
+        .limit(q.limit + 1)
+    )
+    if q.after is not None:
+        stmt = stmt.where(tuple_(Execution.started_at, Execution.id) < tuple_(*q.after))
+    if q.status is not None:
+        stmt = stmt.where(Execution.status == q.status)
+    if q.verb is not None:
+        stmt = stmt.where(Draft.verb == q.verb)
+    if q.vendor is not None:
+        stmt = stmt.where(Draft.vendor == q.vendor)
+    if q.started_from is not None:
+        stmt = stmt.where(Execution.started_at >= q.started_from)
+    if q.started_to is not None:
+        stmt = stmt.where(Execution.started_at < q.started_to)
+    return stmt
+
+
+def _list_page(rows: list, q: _ExecutionListQuery, response: Response) -> list[ExecutionListItem]:
+    if len(rows) > q.limit:
+        rows = rows[: q.limit]
+        last = rows[-1][0]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(last.started_at, last.id)
+    return [_list_item(execution, draft) for execution, draft in rows]
+
+
+def _encode_cursor(started_at: datetime, execution_id: str) -> str:
+    raw = json.dumps([started_at.isoformat(), execution_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        started_at, execution_id = json.loads(raw)
+        return datetime.fromisoformat(started_at), str(execution_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _execution_details_stmt(execution_ids: list[str]) -> Select:
+    """Everything ExecutionDetail needs, for any number of ids, in one round trip.
+
+    Receipts are LEFT JOINed (one row per receipt; executions have very few) and the latest
+    confirmation latency is a correlated subquery on ix_confirmations_draft_id_confirmed_at.
+    """
+
+    latest_latency = (
+        select(Confirmation.confirmation_latency_ms)
+        .where(Confirmation.draft_id == Draft.id)
+        .order_by(Confirmation.confirmed_at.desc())
+        .limit(1)
+        .correlate(Draft)
+        .scalar_subquery()
+    )
+    return (
+        select(Execution, Draft, ExecutionRequest, latest_latency, ReceiptArtifact)
         .join(Draft, Draft.id == Execution.draft_id)
         .join(ExecutionRequest, ExecutionRequest.id == Draft.execution_request_id)
-        .filter(Execution.id == execution_id)
-        .first()
+        .outerjoin(ReceiptArtifact, ReceiptArtifact.execution_id == Execution.id)
+        .where(Execution.id.in_(execution_ids))
+        .order_by(Execution.id, ReceiptArtifact.created_at.desc())
     )
 
-    if row is None:
-        raise HTTPException(status_code=404, detail="Execution not found")
 
-    execution, draft, req = row
+def _receipts_stmt(execution_id: str) -> Select:
+    return (
+        select(ReceiptArtifact)
+        .where(ReceiptArtifact.execution_id == execution_id)
+        .order_by(ReceiptArtifact.created_at.desc())
+    )
+
 
-    confirmation = (
-        db.query(Confirmation)
-        .filter(Confirmation.draft_id == draft.id)
-        .order_by(Confirmation.confirmed_at.desc())
-        .first()
+def _list_item(execution: Execution, draft: Draft) -> ExecutionListItem:
+    return ExecutionListItem(
+        execution_id=execution.id,
+        draft_id=draft.id,
+        verb=draft.verb,
+        status=execution.status,
+        started_at=execution.started_at.isoformat(),
+        finished_at=execution.finished_at.isoformat() if execution.finished_at else None,
+        vendor=draft.vendor,
+        final_cost_cents=execution.final_cost_cents,
     )
 
-    receipts = (
-        db.query(ReceiptArtifact)
-        .filter(ReceiptArtifact.execution_id == execution.id)
-        .order_by(ReceiptArtifact.created_at.desc())
-        .all()
+
+def _receipt_out(r: ReceiptArtifact) -> ReceiptArtifactOut:
+    return ReceiptArtifactOut(
+        id=r.id,
+        type=r.type,
+        content_text=r.content_text,
+        external_reference_id=r.external_reference_id,
+        created_at=r.created_at.isoformat(),
+    )
+
+
+def _execution_details(rows: list) -> dict[str, ExecutionDetail]:
+    """Fold rows from _execution_details_stmt() into details keyed by execution id."""
+
+    grouped: dict[str, tuple[Execution, Draft, ExecutionRequest, int | None, list]] = {}
+    for execution, draft, req, latency_ms, receipt in rows:
+        entry = grouped.setdefault(execution.id, (execution, draft, req, latency_ms, []))
+        if receipt is not None:
+            entry[4].append(receipt)
+    return {execution_id: _execution_detail(*entry) for execution_id, entry in grouped.items()}
+
+
+def _batch_get_response(
+    ids: list[str], details: dict[str, ExecutionDetail]
+) -> ExecutionBatchGetResponse:
+    return ExecutionBatchGetResponse(
+        executions=[details[i] for i in ids if i in details],
+        missing_ids=[i for i in ids if i not in details],
     )
 
-    receipt_out = [
-        ReceiptArtifactOut(
-            id=r.id,
-            type=r.type,
-            content_text=r.content_text,
-            external_reference_id=r.external_reference_id,
-            created_at=r.created_at.isoformat(),
-        )
-        for r in receipts
-    ]
 
+def _execution_detail(
+    execution: Execution,
+    draft: Draft,
+    req: ExecutionRequest,
+    confirmation_latency_ms: int | None,
+    receipts: list[ReceiptArtifact],
+) -> ExecutionDetail:
     return ExecutionDetail(
         execution_id=execution.id,
         draft_id=draft.id,
@@ -95,29 +246,8 @@ def get_execution(execution_id: str, db: Session = Depends(get_db)) -> Execution
         raw_command_text=req.raw_command_text,
         normalized_intent_json=req.normalized_intent_json,
         draft_payload_json=draft.draft_payload_json,
-        confirmation_latency_ms=confirmation.confirmation_latency_ms if confirmation else None,
+        confirmation_latency_ms=confirmation_latency_ms,
         execution_payload_json=execution.execution_payload_json,
         error_message=execution.error_message,
-        receipts=receipt_out,
-    )
-
-
-@router.get("/v1/receipts/{execution_id}", response_model=list[ReceiptArtifactOut])
-def get_receipts(execution_id: str, db: Session = Depends(get_db)) -> list[ReceiptArtifactOut]:
-    receipts = (
-        db.query(ReceiptArtifact)
-        .filter(ReceiptArtifact.execution_id == execution_id)
-        .order_by(ReceiptArtifact.created_at.desc())
-        .all()
+        receipts=[_receipt_out(r) for r in receipts],
     )
-
-    return [
-        ReceiptArtifactOut(
-            id=r.id,
-            type=r.type,
-            content_text=r.content_text,
-            external_reference_id=r.external_reference_id,
-            created_at=r.created_at.isoformat(),
-        )
-        for r in receipts
-    ]
@@ -0,0 +1,69 @@
+"""Async audit endpoints (HALO_API_MODE=async).
+
+These are cheap indexed reads; serving them on the event loop keeps the activity feed
+responsive while slow draft/confirm work occupies worker threads.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from services.api.app.db.deps import get_async_db
+from services.api.app.models.audit import (
+    ExecutionBatchGetRequest,
+    ExecutionBatchGetResponse,
+    ExecutionDetail,
+    ExecutionListItem,
+    ReceiptArtifactOut,
+)
+from services.api.app.routers.audit import (
+    _batch_get_response,
+    _execution_details,
+    _execution_details_stmt,
+    _execution_list_query,
+    _ExecutionListQuery,
+    _list_executions_stmt,
+    _list_page,
+    _receipt_out,
+    _receipts_stmt,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter()
+
+
+@router.get("/v1/executions", response_model=list[ExecutionListItem])
+async def list_executions(
+    response: Response,
+    q: _ExecutionListQuery = Depends(_execution_list_query),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[ExecutionListItem]:
+    rows = (await db.execute(_list_executions_stmt(q))).all()
+    return _list_page(list(rows), q, response)
+
+
+@router.get("/v1/executions/{execution_id}", response_model=ExecutionDetail)
+async def get_execution(
+    execution_id: str, db: AsyncSession = Depends(get_async_db)
+) -> ExecutionDetail:
+    rows = (await db.execute(_execution_details_stmt([execution_id]))).all()
+    details = _execution_details(list(rows))
+    if execution_id not in details:
+        raise HTTPException(status_code=404, detail="Execution not found")
+    return details[execution_id]
+
+
+@router.post("/v1/executions:batchGet", response_model=ExecutionBatchGetResponse)
+async def batch_get_executions(
+    payload: ExecutionBatchGetRequest, db: AsyncSession = Depends(get_async_db)
+) -> ExecutionBatchGetResponse:
+    ids = list(dict.fromkeys(payload.execution_ids))
+    rows = (await db.execute(_execution_details_stmt(ids))).all()
+    return _batch_get_response(ids, _execution_details(list(rows)))
+
+
+@router.get("/v1/receipts/{execution_id}", response_model=list[ReceiptArtifactOut])
+async def get_receipts(
+    execution_id: str, db: AsyncSession = Depends(get_async_db)
+) -> list[ReceiptArtifactOut]:
+    receipts = (await db.scalars(_receipts_stmt(execution_id))).all()
+    return [_receipt_out(r) for r in receipts]
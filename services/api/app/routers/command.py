@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Sequence
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from uuid import uuid4
 
@@ -11,20 +14,27 @@ from packages.shared.schemas.card_v1 import (
     CardV1,
 )
 from packages.shared.schemas.intent import ClarificationQuestionV1, IntentV1, VerbV1
+from services.api.app.db.database import release_connection
 from services.api.app.db.deps import get_db
+from services.api.app.db.event_sink import log_event
+from services.api.app.db.household_bootstrap import ensure_household_user
 from services.api.app.db.models import (
     BookingVendor,
     Draft,
-    EventLog,
     ExecutionRequest,
-    Household,
-    Preference,
     Subscription,
-    User,
     UsualItem,
 )
-from services.api.app.llm.factory import get_intent_extractor
-from services.api.app.models.command import CommandParseRequest
+from services.api.app.llm.base import IntentExtractor
+from services.api.app.llm.batch import BatchParseConfig, extract_batch
+from services.api.app.llm.factory import get_intent_extractor, get_rule_extractor
+from services.api.app.llm.fake import FakeIntentExtractor
+from services.api.app.llm.intent_cache import IntentCacheOutcome, extract_observing_cache
+from services.api.app.models.command import (
+    CommandParseBatchRequest,
+    CommandParseBatchResponse,
+    CommandParseRequest,
+)
 from services.api.app.models.order import OrderItemInput
 from services.api.app.services.amazon_base import (
     AmazonAdapterError,
@@ -40,6 +50,7 @@ from services.api.app.services.booking_base import (
     BookingPlaywrightMissingError,
 )
 from services.api.app.services.booking_factory import get_booking_adapter
+from services.api.app.services.draft_speculation import SpeculativeDraft, get_speculation_pool
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -60,56 +71,65 @@ def parse_command(payload: CommandParseRequest) -> IntentV1:
     )
 
 
-@router.post("/v1/command", response_model=CardV1)
-def submit_command(payload: CommandParseRequest, db: Session = Depends(get_db)) -> CardV1:
-    _ensure_household_user(db, payload.household_id, payload.user_id)
-
+@router.post("/v1/command/parse:batch", response_model=CommandParseBatchResponse)
+def parse_command_batch(payload: CommandParseBatchRequest) -> CommandParseBatchResponse:
+    cfg = batch_config_or_422(payload)
     try:
         extractor = get_intent_extractor()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    intent = extractor.extract(
-        raw_command_text=payload.raw_command_text,
-        household_id=payload.household_id,
-        user_id=payload.user_id,
-        clarification_answers=payload.clarification_answers,
+    started = time.perf_counter()
+    results = extract_batch(extractor, payload.commands, concurrency=cfg.concurrency)
+    return CommandParseBatchResponse(
+        results=results, elapsed_ms=round((time.perf_counter() - started) * 1000, 3)
     )
 
-    execution_request_id = uuid4().hex
-    db.add(
-        ExecutionRequest(
-            id=execution_request_id,
+
+def batch_config_or_422(payload: CommandParseBatchRequest) -> BatchParseConfig:
+    cfg = BatchParseConfig.from_env()
+    if len(payload.commands) > cfg.max_items:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {cfg.max_items} commands per batch (got {len(payload.commands)})",
+        )
+    return cfg
+
+
+@router.post("/v1/command", response_model=CardV1)
+def submit_command(payload: CommandParseRequest, db: Session = Depends(get_db)) -> CardV1:
+    try:
+        extractor = get_intent_extractor()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    speculation = _speculate_reorder(db, payload, extractor)
+    try:
+        intent, cache_outcome = extract_observing_cache(
+            extractor,
+            raw_command_text=payload.raw_command_text,
             household_id=payload.household_id,
             user_id=payload.user_id,
-            channel=payload.channel,
-            raw_command_text=payload.raw_command_text,
-            normalized_intent_json=intent.model_dump(mode="json"),
+            clarification_answers=payload.clarification_answers,
         )
-    )
+        return _route_command(db, payload, intent, cache_outcome, speculation)
+    finally:
+        if speculation is not None:
+            speculation.discard()
 
-    _log_event(
-        db,
-        household_id=payload.household_id,
-        user_id=payload.user_id,
-        entity_type="ExecutionRequest",
-        entity_id=execution_request_id,
-        event_type="COMMAND_RECEIVED",
-        event_payload={"channel": payload.channel, "raw_command_text": payload.raw_command_text},
-    )
-    _log_event(
-        db,
-        household_id=payload.household_id,
-        user_id=payload.user_id,
-        entity_type="ExecutionRequest",
-        entity_id=execution_request_id,
-        event_type="INTENT_EXTRACTED",
-        event_payload=intent.model_dump(mode="json"),
-    )
-    db.commit()
+
+def _route_command(
+    db: Session,
+    payload: CommandParseRequest,
+    intent: IntentV1,
+    cache_outcome: IntentCacheOutcome | None,
+    speculation: SpeculativeDraft | None,
+) -> CardV1:
+    # Every path below ends in exactly one commit; nothing is written before the LLM call.
+    execution_request_id = uuid4().hex
 
     if intent.clarifications:
-        return CardV1(
+        card = CardV1(
             type=CardTypeV1.CLARIFY,
             title="Clarify",
             summary="I need 1-2 quick answers before I can draft this.",
@@ -126,9 +146,8 @@ def submit_command(payload: CommandParseRequest, db: Session = Depends(get_db))
             ],
             warnings=[],
         )
-
-    if intent.verb == VerbV1.UNSUPPORTED or intent.confidence < 0.55:
-        return CardV1(
+    elif intent.verb == VerbV1.UNSUPPORTED or intent.confidence < 0.55:
+        card = CardV1(
             type=CardTypeV1.UNSUPPORTED,
             title="Not supported yet",
             summary="Halo can’t do that digitally yet in MVP.",
@@ -147,47 +166,142 @@ def submit_command(payload: CommandParseRequest, db: Session = Depends(get_db))
             actions=[],
             warnings=[],
         )
+    elif intent.verb == VerbV1.REORDER:
+        return _draft_reorder(db, payload, execution_request_id, intent, cache_outcome, speculation)
+    elif intent.verb == VerbV1.CANCEL_SUBSCRIPTION:
+        return _draft_cancel_subscription(db, payload, execution_request_id, intent, cache_outcome)
+    elif intent.verb == VerbV1.BOOK_APPOINTMENT:
+        return _draft_book_appointment(db, payload, execution_request_id, intent, cache_outcome)
+    else:
+        # Should be unreachable due to schema validation, but fail closed.
+        card = CardV1(
+            type=CardTypeV1.UNSUPPORTED,
+            title="Not supported yet",
+            summary="Halo can’t do that digitally yet in MVP.",
+            household_id=payload.household_id,
+            user_id=payload.user_id,
+            body={"intent": intent.model_dump(mode="json")},
+            actions=[],
+            warnings=[],
+        )
 
-    if intent.verb == VerbV1.REORDER:
-        return _draft_reorder(db, payload, execution_request_id, intent)
+    _record_command(db, payload, execution_request_id, intent, cache_outcome)
+    db.commit()
+    return card
 
-    if intent.verb == VerbV1.CANCEL_SUBSCRIPTION:
-        return _draft_cancel_subscription(db, payload, execution_request_id, intent)
 
-    if intent.verb == VerbV1.BOOK_APPOINTMENT:
-        return _draft_book_appointment(db, payload, execution_request_id, intent)
+def _record_command(
+    db: Session,
+    payload: CommandParseRequest,
+    execution_request_id: str,
+    intent: IntentV1,
+    cache_outcome: IntentCacheOutcome | None,
+    seed_rows: Sequence[object] = (),
+) -> None:
+    """Stage the request row, its audit events and any default seeding; the caller commits."""
 
-    # Should be unreachable due to schema validation, but fail closed.
-    return CardV1(
-        type=CardTypeV1.UNSUPPORTED,
-        title="Not supported yet",
-        summary="Halo can’t do that digitally yet in MVP.",
+    ensure_household_user(db, payload.household_id, payload.user_id)
+    db.add(
+        ExecutionRequest(
+            id=execution_request_id,
+            household_id=payload.household_id,
+            user_id=payload.user_id,
+            channel=payload.channel,
+            raw_command_text=payload.raw_command_text,
+            normalized_intent_json=intent.model_dump(mode="json"),
+            verb=intent.verb.value,
+            routine_key=intent.routine_key.strip() or None,
+        )
+    )
+    db.add_all(seed_rows)
+    # Drafts reference the request but have no relationship() for the flush to order by.
+    db.flush()
+
+    log_event(
+        db,
+        household_id=payload.household_id,
+        user_id=payload.user_id,
+        entity_type="ExecutionRequest",
+        entity_id=execution_request_id,
+        event_type="COMMAND_RECEIVED",
+        event_payload={"channel": payload.channel, "raw_command_text": payload.raw_command_text},
+    )
+    log_event(
+        db,
         household_id=payload.household_id,
         user_id=payload.user_id,
-        body={"intent": intent.model_dump(mode="json")},
-        actions=[],
-        warnings=[],
+        entity_type="ExecutionRequest",
+        entity_id=execution_request_id,
+        event_type="INTENT_EXTRACTED",
+        event_payload=_intent_event_payload(intent, cache_outcome),
     )
 
 
+def _intent_event_payload(intent: IntentV1, cache_outcome: IntentCacheOutcome | None) -> dict:
+    event_payload = intent.model_dump(mode="json")
+    if cache_outcome is not None:
+        event_payload["intent_cache"] = asdict(cache_outcome)
+    return event_payload
+
+
+def _speculate_reorder(
+    db: Session, payload: CommandParseRequest, extractor: IntentExtractor
+) -> SpeculativeDraft | None:
+    """Start pricing a reorder the rule pass already recognizes; see services.draft_speculation."""
+
+    if isinstance(extractor, FakeIntentExtractor):
+        return None  # the rules are the final intent; nothing to overlap
+    pool = get_speculation_pool()
+    if not pool.cfg.enabled:
+        return None
+
+    ruled = get_rule_extractor().extract(
+        raw_command_text=payload.raw_command_text,
+        household_id=payload.household_id,
+        user_id=payload.user_id,
+        clarification_answers=payload.clarification_answers,
+    )
+    if ruled.verb != VerbV1.REORDER or ruled.clarifications:
+        return None
+    try:
+        adapter = get_amazon_adapter()
+    except ValueError:
+        return None
+
+    items, _ = _reorder_items_from_intent_or_usual(db, payload.household_id, ruled)
+    # Do not hold a pooled connection across the LLM call.
+    release_connection(db, read_only=True)
+    return pool.submit(adapter, payload.household_id, items)
+
+
 def _draft_reorder(
     db: Session,
     payload: CommandParseRequest,
     execution_request_id: str,
     intent: IntentV1,
+    cache_outcome: IntentCacheOutcome | None,
+    speculation: SpeculativeDraft | None = None,
 ) -> CardV1:
     try:
         adapter = get_amazon_adapter()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    items = _reorder_items_from_intent_or_usual(db, payload.household_id, intent)
+    items, seed_rows = _reorder_items_from_intent_or_usual(db, payload.household_id, intent)
+
+    # Browser drafts can take tens of seconds; do not hold a pooled connection meanwhile.
+    release_connection(db, read_only=True)
 
     try:
-        draft = adapter.build_draft(payload.household_id, items)
+        draft = speculation.take(items) if speculation is not None else None
+        if draft is None:
+            draft = adapter.build_draft(payload.household_id, items)
     except Exception as e:
+        _record_command(db, payload, execution_request_id, intent, cache_outcome, seed_rows)
+        db.commit()
         _raise_adapter_http_error(e)
 
+    _record_command(db, payload, execution_request_id, intent, cache_outcome, seed_rows)
     draft_id = uuid4().hex
 
     draft_payload = {
@@ -206,13 +320,14 @@ def _draft_reorder(
             id=draft_id,
             execution_request_id=execution_request_id,
             verb="REORDER",
+            routine_key=intent.routine_key.strip() or None,
             vendor=adapter.vendor,
             estimated_cost_cents=draft.estimated_total_cents,
             draft_payload_json=draft_payload,
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=payload.household_id,
         user_id=payload.user_id,
@@ -252,9 +367,8 @@ def _draft_cancel_subscription(
     payload: CommandParseRequest,
     execution_request_id: str,
     intent: IntentV1,
+    cache_outcome: IntentCacheOutcome | None,
 ) -> CardV1:
-    _ensure_default_subscriptions(db, payload.household_id)
-
     sub_name = (
         str(intent.params.get("subscription_name") or "").strip() or (intent.object or "").strip()
     )
@@ -265,6 +379,12 @@ def _draft_cancel_subscription(
         .order_by(Subscription.name.asc())
         .all()
     )
+    seed_rows: list[Subscription] = []
+    if not subs:
+        seed_rows = _default_subscriptions(payload.household_id)
+        subs = sorted(seed_rows, key=lambda s: s.name)
+
+    _record_command(db, payload, execution_request_id, intent, cache_outcome, seed_rows)
 
     match = None
     for s in subs:
@@ -280,6 +400,7 @@ def _draft_cancel_subscription(
                 choices=[s.name for s in subs][:8],
             )
         ]
+        db.commit()
         return CardV1(
             type=CardTypeV1.CLARIFY,
             title="Clarify: cancel subscription",
@@ -326,13 +447,14 @@ def _draft_cancel_subscription(
             id=draft_id,
             execution_request_id=execution_request_id,
             verb="CANCEL_SUBSCRIPTION",
+            routine_key=intent.routine_key.strip() or None,
             vendor="MOCK_SUBS",
             estimated_cost_cents=None,
             draft_payload_json=draft_payload,
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=payload.household_id,
         user_id=payload.user_id,
@@ -347,7 +469,7 @@ def _draft_cancel_subscription(
     return CardV1(
         type=CardTypeV1.DRAFT,
         title="Draft: CANCEL SUBSCRIPTION",
-        summary=f"I will cancel {match.name}.",
+        summary=f"I will cancel {draft_payload['subscription']['name']}.",
         household_id=payload.household_id,
         user_id=payload.user_id,
         draft_id=draft_id,
@@ -371,8 +493,20 @@ def _draft_book_appointment(
     payload: CommandParseRequest,
     execution_request_id: str,
     intent: IntentV1,
+    cache_outcome: IntentCacheOutcome | None,
 ) -> CardV1:
-    vendor = _ensure_default_booking_vendor(db, payload.household_id)
+    vendor = (
+        db.query(BookingVendor)
+        .filter(BookingVendor.household_id == payload.household_id)
+        .order_by(BookingVendor.created_at.asc())
+        .first()
+    )
+    seed_rows: list[BookingVendor] = []
+    if vendor is None:
+        vendor = _default_booking_vendor(payload.household_id)
+        seed_rows = [vendor]
+    vendor_name = vendor.name
+    vendor_price_estimate_cents = vendor.price_estimate_cents
 
     service_type = str(
         intent.params.get("service_type") or intent.object or vendor.default_service_type
@@ -384,17 +518,22 @@ def _draft_book_appointment(
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    release_connection(db, read_only=True)
+
     try:
         draft = adapter.build_draft(
             payload.household_id,
-            vendor_name=vendor.name,
+            vendor_name=vendor_name,
             service_type=service_type,
-            price_estimate_cents=vendor.price_estimate_cents,
+            price_estimate_cents=vendor_price_estimate_cents,
             params=dict(intent.params or {}),
         )
     except Exception as e:
+        _record_command(db, payload, execution_request_id, intent, cache_outcome, seed_rows)
+        db.commit()
         _raise_booking_http_error(e)
 
+    _record_command(db, payload, execution_request_id, intent, cache_outcome, seed_rows)
     draft_id = uuid4().hex
     draft_payload = {
         "verb": "BOOK_APPOINTMENT",
@@ -413,13 +552,14 @@ def _draft_book_appointment(
             id=draft_id,
             execution_request_id=execution_request_id,
             verb="BOOK_APPOINTMENT",
+            routine_key=intent.routine_key.strip() or None,
             vendor=adapter.vendor,
             estimated_cost_cents=draft.price_estimate_cents,
             draft_payload_json=draft_payload,
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=payload.household_id,
         user_id=payload.user_id,
@@ -456,96 +596,56 @@ def _draft_book_appointment(
     )
 
 
-def _ensure_household_user(db: Session, household_id: str, user_id: str) -> None:
-    household = db.get(Household, household_id)
-    if household is None:
-        db.add(Household(id=household_id, name=household_id))
+# Default seeding builds transient rows; they are written by `_record_command` in the
+# command's own transaction rather than committed separately.
 
-    user = db.get(User, user_id)
-    if user is None:
-        db.add(User(id=user_id, household_id=household_id, display_name=user_id))
-
-    pref = db.get(Preference, household_id)
-    if pref is None:
-        db.add(
-            Preference(
-                household_id=household_id,
-                default_merchant="amazon",
-                default_booking_vendor=None,
-            )
-        )
-
-    db.commit()
-
-
-def _ensure_default_usual_items(db: Session, household_id: str) -> None:
-    if db.query(UsualItem).filter(UsualItem.household_id == household_id).limit(1).count() > 0:
-        return
 
+def _default_usual_items(household_id: str) -> list[UsualItem]:
     defaults = [
         ("paper towels", 1),
         ("detergent", 1),
     ]
-    for name, qty in defaults:
-        db.add(UsualItem(id=uuid4().hex, household_id=household_id, name=name, quantity=qty))
-
-    db.commit()
-
+    return [
+        UsualItem(id=uuid4().hex, household_id=household_id, name=name, quantity=qty)
+        for name, qty in defaults
+    ]
 
-def _ensure_default_subscriptions(db: Session, household_id: str) -> None:
-    existing = (
-        db.query(Subscription).filter(Subscription.household_id == household_id).limit(1).count()
-    )
-    if existing > 0:
-        return
 
+def _default_subscriptions(household_id: str) -> list[Subscription]:
     now = datetime.utcnow()
     defaults = [
         ("Netflix", 1599, now + timedelta(days=15)),
         ("Spotify", 1099, now + timedelta(days=7)),
     ]
-
-    for name, cost, renewal in defaults:
-        db.add(
-            Subscription(
-                id=uuid4().hex,
-                household_id=household_id,
-                name=name,
-                monthly_cost_cents=cost,
-                renewal_date=renewal,
-            )
+    return [
+        Subscription(
+            id=uuid4().hex,
+            household_id=household_id,
+            name=name,
+            monthly_cost_cents=cost,
+            renewal_date=renewal,
         )
+        for name, cost, renewal in defaults
+    ]
 
-    db.commit()
-
-
-def _ensure_default_booking_vendor(db: Session, household_id: str) -> BookingVendor:
-    vendor = (
-        db.query(BookingVendor)
-        .filter(BookingVendor.household_id == household_id)
-        .order_by(BookingVendor.created_at.asc())
-        .first()
-    )
-    if vendor is not None:
-        return vendor
 
-    vendor = BookingVendor(
+def _default_booking_vendor(household_id: str) -> BookingVendor:
+    return BookingVendor(
         id=uuid4().hex,
         household_id=household_id,
         name="Mock Cleaner Co",
         default_service_type="cleaning",
         price_estimate_cents=12000,
     )
-    db.add(vendor)
-    db.commit()
-    return vendor
 
 
 def _reorder_items_from_intent_or_usual(
     db: Session,
     household_id: str,
     intent: IntentV1,
-) -> list[OrderItemInput]:
+) -> tuple[list[OrderItemInput], list[UsualItem]]:
+    """Return the items to draft plus any default usual items that still need writing."""
+
     raw_items = intent.params.get("items") if isinstance(intent.params, dict) else None
 
     if isinstance(raw_items, list) and raw_items:
@@ -559,40 +659,19 @@ def _reorder_items_from_intent_or_usual(
                 continue
             out.append(OrderItemInput(name=name, quantity=max(1, qty)))
         if out:
-            return out
+            return out, []
 
-    _ensure_default_usual_items(db, household_id)
     usual = (
         db.query(UsualItem)
         .filter(UsualItem.household_id == household_id)
         .order_by(UsualItem.created_at.asc())
         .all()
     )
+    seed_rows: list[UsualItem] = []
+    if not usual:
+        usual = seed_rows = _default_usual_items(household_id)
 
-    return [OrderItemInput(name=u.name, quantity=u.quantity) for u in usual]
-
-
-def _log_event(
-    db: Session,
-    *,
-    household_id: str,
-    user_id: str | None,
-    entity_type: str,
-    entity_id: str,
-    event_type: str,
-    event_payload: dict,
-) -> None:
-    db.add(
-        EventLog(
-            id=uuid4().hex,
-            household_id=household_id,
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            event_type=event_type,
-            event_payload_json=event_payload,
-        )
-    )
+    return [OrderItemInput(name=u.name, quantity=u.quantity) for u in usual], seed_rows
 
 
 def _default_time_windows() -> list[dict[str, str]]:
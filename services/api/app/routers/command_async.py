@@ -0,0 +1,66 @@
+"""Async command endpoints (HALO_API_MODE=async).
+
+Drafting calls blocking vendor SDKs, so the sync handlers from routers/command.py run on
+the slow-path limiter (see services.api.app.concurrency). Parsing awaits the extractor's
+`aextract` directly when it has one; batches run on the event loop too (see llm.batch).
+"""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import APIRouter, HTTPException, Request
+from packages.shared.schemas.card_v1 import CardV1
+from packages.shared.schemas.intent import IntentV1
+from services.api.app.concurrency import run_slow_path
+from services.api.app.db.deps import call_with_db
+from services.api.app.llm.base import AsyncIntentExtractor
+from services.api.app.llm.batch import aextract_batch
+from services.api.app.llm.factory import get_intent_extractor
+from services.api.app.models.command import (
+    CommandParseBatchRequest,
+    CommandParseBatchResponse,
+    CommandParseRequest,
+)
+from services.api.app.routers import command as sync_command
+
+router = APIRouter()
+
+
+@router.post("/v1/command/parse", response_model=IntentV1)
+async def parse_command(payload: CommandParseRequest, request: Request) -> IntentV1:
+    try:
+        extractor = get_intent_extractor()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    if not isinstance(extractor, AsyncIntentExtractor):
+        return await run_slow_path(request, sync_command.parse_command, payload)
+
+    # Parse touches no DB session, so a native async extractor can stay on the event loop.
+    return await extractor.aextract(
+        raw_command_text=payload.raw_command_text,
+        household_id=payload.household_id,
+        user_id=payload.user_id,
+        clarification_answers=payload.clarification_answers,
+    )
+
+
+@router.post("/v1/command/parse:batch", response_model=CommandParseBatchResponse)
+async def parse_command_batch(payload: CommandParseBatchRequest) -> CommandParseBatchResponse:
+    cfg = sync_command.batch_config_or_422(payload)
+    try:
+        extractor = get_intent_extractor()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    started = time.perf_counter()
+    results = await aextract_batch(extractor, payload.commands, concurrency=cfg.concurrency)
+    return CommandParseBatchResponse(
+        results=results, elapsed_ms=round((time.perf_counter() - started) * 1000, 3)
+    )
+
+
+@router.post("/v1/command", response_model=CardV1)
+async def submit_command(payload: CommandParseRequest, request: Request) -> CardV1:
+    return await run_slow_path(request, call_with_db, sync_command.submit_command, payload)
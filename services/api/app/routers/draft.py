@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid4
 
@@ -10,11 +11,12 @@ from packages.shared.schemas.card_v1 import (
     CardTypeV1,
     CardV1,
 )
+from services.api.app.db.database import release_connection
 from services.api.app.db.deps import get_db
+from services.api.app.db.event_sink import log_event
 from services.api.app.db.models import (
     Confirmation,
     Draft,
-    EventLog,
     Execution,
     ExecutionRequest,
     ReceiptArtifact,
@@ -35,10 +37,43 @@ from services.api.app.services.booking_base import (
     BookingPlaywrightMissingError,
 )
 from services.api.app.services.booking_factory import get_booking_adapter
+from services.api.app.services.routine_stats import (
+    draft_routine_key,
+    item_quantities,
+    lock_routine_stats,
+    mean_cost_cents,
+    mean_interval_ms,
+    record_completion,
+)
+from services.api.app.services.vendor_health import (
+    WindowCounts,
+    record_vendor_outcome,
+    vendor_health,
+)
 from sqlalchemy.orm import Session
 
 router = APIRouter()
 
+# Household-scoped vendor health window reported in AUTOPILOT_SIGNAL_COMPUTED.
+_ADAPTER_SIGNAL_WINDOW = "7d"
+
+
+@dataclass(frozen=True, slots=True)
+class _ConfirmContext:
+    """Plain-data view of a confirmed draft.
+
+    Vendor calls run with the DB connection released, so they must not touch ORM state.
+    """
+
+    draft_id: str
+    execution_id: str
+    verb: str
+    vendor: str
+    estimated_cost_cents: int | None
+    draft_payload: dict
+    household_id: str
+    request_user_id: str
+
 
 @router.post("/v1/draft/modify", response_model=CardV1)
 def modify_draft(payload: DraftModifyRequest, db: Session = Depends(get_db)) -> CardV1:
@@ -85,6 +120,7 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
     execution = Execution(
         id=execution_id,
         draft_id=draft.id,
+        household_id=household_id or None,
         status="IN_PROGRESS",
         finished_at=None,
         final_cost_cents=None,
@@ -93,7 +129,7 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
     )
     db.add(execution)
 
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=payload.user_id,
@@ -102,7 +138,7 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
         event_type="DRAFT_CONFIRMED",
         event_payload={"confirmation_id": confirmation_id, "latency_ms": latency_ms},
     )
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=payload.user_id,
@@ -112,17 +148,29 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
         event_payload={"draft_id": draft.id, "verb": draft.verb},
     )
 
-    db.commit()
+    ctx = _ConfirmContext(
+        draft_id=draft.id,
+        execution_id=execution_id,
+        verb=draft.verb,
+        vendor=draft.vendor,
+        estimated_cost_cents=draft.estimated_cost_cents,
+        draft_payload=dict(draft.draft_payload_json or {}),
+        household_id=household_id,
+        request_user_id=request_user_id,
+    )
+
+    # Return the connection to the pool before any (potentially multi-minute) vendor call.
+    release_connection(db)
 
     try:
-        if draft.verb == "REORDER":
-            done = _execute_reorder(db, draft, execution)
-        elif draft.verb == "CANCEL_SUBSCRIPTION":
-            done = _execute_cancel_subscription(db, draft, execution)
-        elif draft.verb == "BOOK_APPOINTMENT":
-            done = _execute_book_appointment(db, draft, execution)
+        if ctx.verb == "REORDER":
+            done = _execute_reorder(db, ctx)
+        elif ctx.verb == "CANCEL_SUBSCRIPTION":
+            done = _execute_cancel_subscription(db, ctx)
+        elif ctx.verb == "BOOK_APPOINTMENT":
+            done = _execute_book_appointment(db, ctx)
         else:
-            raise HTTPException(status_code=409, detail=f"Unknown draft verb: {draft.verb}")
+            raise HTTPException(status_code=409, detail=f"Unknown draft verb: {ctx.verb}")
 
         done.household_id = household_id
         done.user_id = payload.user_id or request_user_id
@@ -130,12 +178,15 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
     except HTTPException:
         raise
     except Exception as e:
+        db.rollback()
+        draft, execution = _load_for_result(db, ctx)
+
         execution.status = "FAILED"
         execution.finished_at = datetime.utcnow()
         execution.error_message = str(e)
         execution.execution_payload_json = {"error": str(e)}
 
-        _log_event(
+        log_event(
             db,
             household_id=household_id,
             user_id=payload.user_id,
@@ -155,14 +206,14 @@ def confirm_draft(payload: DraftConfirmRequest, db: Session = Depends(get_db)) -
 
         return CardV1(
             type=CardTypeV1.FAILED,
-            title=f"Failed: {draft.verb}",
+            title=f"Failed: {ctx.verb}",
             summary=str(e),
             household_id=household_id,
             user_id=payload.user_id or request_user_id,
-            draft_id=draft.id,
-            execution_id=execution.id,
-            vendor=draft.vendor,
-            estimated_cost_cents=draft.estimated_cost_cents,
+            draft_id=ctx.draft_id,
+            execution_id=ctx.execution_id,
+            vendor=ctx.vendor,
+            estimated_cost_cents=ctx.estimated_cost_cents,
             body={"error": str(e)},
             actions=[
                 CardActionV1(type=CardActionTypeV1.RETRY, label="Retry", payload={}),
@@ -178,7 +229,7 @@ def get_draft(draft_id: str, db: Session = Depends(get_db)) -> CardV1:
         raise HTTPException(status_code=404, detail="Draft not found")
 
     household_id, request_user_id = _draft_context(db, draft)
-    return _draft_to_card(db, draft, household_id, request_user_id)
+    return _draft_to_card(draft, household_id, request_user_id)
 
 
 def _modify_reorder(db: Session, draft: Draft, modifications: dict) -> CardV1:
@@ -194,7 +245,7 @@ def _modify_reorder(db: Session, draft: Draft, modifications: dict) -> CardV1:
 
     raw_items = modifications.get("items")
     if not isinstance(raw_items, list) or not raw_items:
-        return _draft_to_card(db, draft, household_id, request_user_id)
+        return _draft_to_card(draft, household_id, request_user_id)
 
     items: list[OrderItemInput] = []
     for it in raw_items:
@@ -207,13 +258,20 @@ def _modify_reorder(db: Session, draft: Draft, modifications: dict) -> CardV1:
         items.append(OrderItemInput(name=name, quantity=max(1, qty)))
 
     if not items:
-        return _draft_to_card(db, draft, household_id, request_user_id)
+        return _draft_to_card(draft, household_id, request_user_id)
+
+    draft_id = draft.id
+    release_connection(db)
 
     try:
         draft_result = adapter.build_draft(household_id, items)
     except Exception as e:
         _raise_adapter_http_error(e)
 
+    draft = db.get(Draft, draft_id)
+    if draft is None:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
     draft.estimated_cost_cents = draft_result.estimated_total_cents
     payload = dict(draft.draft_payload_json or {})
     payload.update(
@@ -227,19 +285,26 @@ def _modify_reorder(db: Session, draft: Draft, modifications: dict) -> CardV1:
     )
     draft.draft_payload_json = payload
 
-    _log_event(
+    _record_modification(db, draft, household_id, request_user_id, modifications)
+
+    db.commit()
+    return _draft_to_card(draft, household_id, request_user_id)
+
+
+def _record_modification(
+    db: Session, draft: Draft, household_id: str, user_id: str, modifications: dict
+) -> None:
+    draft.modify_count = Draft.modify_count + 1
+    log_event(
         db,
         household_id=household_id,
-        user_id=request_user_id,
+        user_id=user_id,
         entity_type="Draft",
         entity_id=draft.id,
         event_type="DRAFT_MODIFIED",
         event_payload={"modifications": modifications},
     )
 
-    db.commit()
-    return _draft_to_card(db, draft, household_id, request_user_id)
-
 
 def _modify_cancel_subscription(db: Session, draft: Draft, modifications: dict) -> CardV1:
     household_id, request_user_id = _draft_context(db, draft)
@@ -251,7 +316,7 @@ def _modify_cancel_subscription(db: Session, draft: Draft, modifications: dict)
     new_id = str(modifications.get("subscription_id") or "").strip()
 
     if not new_name and not new_id:
-        return _draft_to_card(db, draft, household_id, request_user_id)
+        return _draft_to_card(draft, household_id, request_user_id)
 
     if new_name:
         sub["name"] = new_name
@@ -261,18 +326,10 @@ def _modify_cancel_subscription(db: Session, draft: Draft, modifications: dict)
     payload["subscription"] = sub
     draft.draft_payload_json = payload
 
-    _log_event(
-        db,
-        household_id=household_id,
-        user_id=request_user_id,
-        entity_type="Draft",
-        entity_id=draft.id,
-        event_type="DRAFT_MODIFIED",
-        event_payload={"modifications": modifications},
-    )
+    _record_modification(db, draft, household_id, request_user_id, modifications)
 
     db.commit()
-    return _draft_to_card(db, draft, household_id, request_user_id)
+    return _draft_to_card(draft, household_id, request_user_id)
 
 
 def _modify_book_appointment(db: Session, draft: Draft, modifications: dict) -> CardV1:
@@ -285,39 +342,30 @@ def _modify_book_appointment(db: Session, draft: Draft, modifications: dict) ->
         payload["selected_time_window_index"] = idx
         draft.draft_payload_json = payload
 
-        _log_event(
-            db,
-            household_id=household_id,
-            user_id=request_user_id,
-            entity_type="Draft",
-            entity_id=draft.id,
-            event_type="DRAFT_MODIFIED",
-            event_payload={"modifications": modifications},
-        )
+        _record_modification(db, draft, household_id, request_user_id, modifications)
         db.commit()
 
-    return _draft_to_card(db, draft, household_id, request_user_id)
+    return _draft_to_card(draft, household_id, request_user_id)
 
 
-def _execute_reorder(db: Session, draft: Draft, execution: Execution) -> CardV1:
-    household_id, request_user_id = _draft_context(db, draft)
+def _execute_reorder(db: Session, ctx: _ConfirmContext) -> CardV1:
+    household_id, request_user_id = ctx.household_id, ctx.request_user_id
 
     try:
         adapter = get_amazon_adapter()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    if draft.vendor != adapter.vendor:
+    if ctx.vendor != adapter.vendor:
         raise HTTPException(status_code=409, detail="Draft vendor mismatch")
 
-    payload = draft.draft_payload_json or {}
-    raw_items = payload.get("items")
+    raw_items = ctx.draft_payload.get("items")
 
     if not isinstance(raw_items, list) or not raw_items:
         raise HTTPException(status_code=409, detail="Draft missing items")
 
     items: list[OrderItemPriced] = [OrderItemPriced.model_validate(it) for it in raw_items]
-    expected_total = int(draft.estimated_cost_cents or 0)
+    expected_total = int(ctx.estimated_cost_cents or 0)
 
     try:
         result = adapter.execute(
@@ -326,8 +374,11 @@ def _execute_reorder(db: Session, draft: Draft, execution: Execution) -> CardV1:
             expected_total_cents=expected_total,
         )
     except Exception as e:
+        _record_adapter_failure(db, ctx)
         _raise_adapter_http_error(e)
 
+    draft, execution = _load_for_result(db, ctx)
+
     execution.status = "DONE"
     execution.finished_at = datetime.utcnow()
     execution.final_cost_cents = result.total_cents
@@ -348,7 +399,7 @@ def _execute_reorder(db: Session, draft: Draft, execution: Execution) -> CardV1:
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -357,7 +408,7 @@ def _execute_reorder(db: Session, draft: Draft, execution: Execution) -> CardV1:
         event_type="EXECUTION_DONE",
         event_payload=execution.execution_payload_json,
     )
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -396,17 +447,18 @@ def _execute_reorder(db: Session, draft: Draft, execution: Execution) -> CardV1:
     )
 
 
-def _execute_cancel_subscription(db: Session, draft: Draft, execution: Execution) -> CardV1:
-    household_id, request_user_id = _draft_context(db, draft)
+def _execute_cancel_subscription(db: Session, ctx: _ConfirmContext) -> CardV1:
+    household_id, request_user_id = ctx.household_id, ctx.request_user_id
 
-    payload = draft.draft_payload_json or {}
-    sub = payload.get("subscription") or {}
+    sub = ctx.draft_payload.get("subscription") or {}
 
     name = str(sub.get("name") or "subscription")
 
     confirmation_id = f"cancel_{uuid4().hex[:10]}"
     content = f"Cancellation confirmed for {name}. Confirmation: {confirmation_id}"
 
+    draft, execution = _load_for_result(db, ctx)
+
     execution.status = "DONE"
     execution.finished_at = datetime.utcnow()
     execution.final_cost_cents = None
@@ -426,7 +478,7 @@ def _execute_cancel_subscription(db: Session, draft: Draft, execution: Execution
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -435,7 +487,7 @@ def _execute_cancel_subscription(db: Session, draft: Draft, execution: Execution
         event_type="EXECUTION_DONE",
         event_payload=execution.execution_payload_json,
     )
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -470,24 +522,27 @@ def _execute_cancel_subscription(db: Session, draft: Draft, execution: Execution
     )
 
 
-def _execute_book_appointment(db: Session, draft: Draft, execution: Execution) -> CardV1:
-    household_id, request_user_id = _draft_context(db, draft)
+def _execute_book_appointment(db: Session, ctx: _ConfirmContext) -> CardV1:
+    household_id, request_user_id = ctx.household_id, ctx.request_user_id
 
-    payload = draft.draft_payload_json or {}
+    payload = ctx.draft_payload
 
     try:
         adapter = get_booking_adapter()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-    if draft.vendor != adapter.vendor:
+    if ctx.vendor != adapter.vendor:
         raise HTTPException(status_code=409, detail="Draft vendor mismatch")
 
     try:
         result = adapter.execute(household_id, draft_payload=payload)
     except Exception as e:
+        _record_adapter_failure(db, ctx)
         _raise_booking_http_error(e)
 
+    draft, execution = _load_for_result(db, ctx)
+
     idx = int(payload.get("selected_time_window_index") or 0)
     windows = payload.get("time_windows") or []
     selected = windows[idx] if isinstance(windows, list) and len(windows) > idx else {}
@@ -515,7 +570,7 @@ def _execute_book_appointment(db: Session, draft: Draft, execution: Execution) -
         )
     )
 
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -524,7 +579,7 @@ def _execute_book_appointment(db: Session, draft: Draft, execution: Execution) -
         event_type="EXECUTION_DONE",
         event_payload=execution.execution_payload_json,
     )
-    _log_event(
+    log_event(
         db,
         household_id=household_id,
         user_id=request_user_id,
@@ -565,7 +620,7 @@ def _execute_book_appointment(db: Session, draft: Draft, execution: Execution) -
     )
 
 
-def _draft_to_card(db: Session, draft: Draft, household_id: str, request_user_id: str) -> CardV1:
+def _draft_to_card(draft: Draft, household_id: str, request_user_id: str) -> CardV1:
     payload = draft.draft_payload_json or {}
 
     if draft.verb == "REORDER":
@@ -645,6 +700,16 @@ def _draft_to_card(db: Session, draft: Draft, household_id: str, request_user_id
     raise HTTPException(status_code=409, detail=f"Unknown draft verb: {draft.verb}")
 
 
+def _load_for_result(db: Session, ctx: _ConfirmContext) -> tuple[Draft, Execution]:
+    """Re-load the draft and execution in a fresh, short transaction after the vendor call."""
+
+    draft = db.get(Draft, ctx.draft_id)
+    execution = db.get(Execution, ctx.execution_id)
+    if draft is None or execution is None:
+        raise RuntimeError(f"Execution {ctx.execution_id} vanished while executing")
+    return draft, execution
+
+
 def _draft_context(db: Session, draft: Draft) -> tuple[str, str]:
     req = db.get(ExecutionRequest, draft.execution_request_id)
     if req is None:
@@ -652,27 +717,27 @@ def _draft_context(db: Session, draft: Draft) -> tuple[str, str]:
     return (req.household_id, req.user_id)
 
 
-def _log_event(
-    db: Session,
-    *,
-    household_id: str,
-    user_id: str | None,
-    entity_type: str,
-    entity_id: str,
-    event_type: str,
-    event_payload: dict,
-) -> None:
-    db.add(
-        EventLog(
-            id=uuid4().hex,
-            household_id=household_id,
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            event_type=event_type,
-            event_payload_json=event_payload,
-        )
+def _record_adapter_failure(db: Session, ctx: _ConfirmContext) -> None:
+    # Best-effort, like the autopilot signal: never mask the adapter error being raised.
+    _record_vendor_outcome_quietly(
+        db, vendor=ctx.vendor, household_id=ctx.household_id, failed=True
     )
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+
+
+def _record_vendor_outcome_quietly(
+    db: Session, *, vendor: str, household_id: str, failed: bool
+) -> None:
+    """Count the outcome in its own savepoint; a failure loses the count, not the caller's work."""
+
+    try:
+        with db.begin_nested():
+            record_vendor_outcome(db, vendor=vendor, household_id=household_id, failed=failed)
+    except Exception:
+        return
 
 
 def _emit_autopilot_signal(
@@ -685,179 +750,111 @@ def _emit_autopilot_signal(
 ) -> None:
     """Best-effort autopilot-readiness telemetry.
 
-    This must never block user-visible execution flow.
+    This must never block user-visible execution flow: its writes run in a savepoint that
+    is rolled back on any error.
     """
 
     try:
-        db.flush()
-
-        routine_key = _routine_key_from_draft(draft)
-
-        rows = (
-            db.query(Execution, Draft, ExecutionRequest)
-            .join(Draft, Draft.id == Execution.draft_id)
-            .join(ExecutionRequest, ExecutionRequest.id == Draft.execution_request_id)
-            .filter(ExecutionRequest.household_id == household_id)
-            .order_by(Execution.started_at.asc())
-            .all()
-        )
-
-        routine_done: list[tuple[Execution, Draft]] = []
-        adapter_total = 0
-        adapter_failed = 0
-
-        for hist_execution, hist_draft, hist_req in rows:
-            if hist_draft.vendor == draft.vendor:
-                adapter_total += 1
-                if hist_execution.status == "FAILED":
-                    adapter_failed += 1
-
-            hist_key = str((hist_req.normalized_intent_json or {}).get("routine_key") or "")
-            if hist_key != routine_key or hist_execution.id == execution.id:
-                continue
-
-            if hist_execution.status == "DONE" and hist_execution.finished_at is not None:
-                routine_done.append((hist_execution, hist_draft))
-
-        repeats_count = len(routine_done) + (1 if execution.status == "DONE" else 0)
-
-        completed_times = [hist_execution.finished_at for hist_execution, _ in routine_done]
-        completed_times = [t for t in completed_times if t is not None]
-        completed_times.sort()
-
-        reference_time = (
-            execution.finished_at if execution.status == "DONE" else execution.started_at
-        )
-        time_since_last_completion_ms: int | None = None
-        if completed_times and reference_time is not None:
-            time_since_last_completion_ms = int(
-                (reference_time - completed_times[-1]).total_seconds() * 1000
+        # A savepoint, so a failure here cannot abort the caller's transaction (on Postgres
+        # any failed statement does) and fail the commit that records the execution.
+        with db.begin_nested():
+            routine_key = draft_routine_key(draft)
+
+            _record_vendor_outcome_quietly(
+                db,
+                vendor=draft.vendor,
+                household_id=household_id,
+                failed=execution.status == "FAILED",
             )
-
-        series = list(completed_times)
-        if execution.status == "DONE" and execution.finished_at is not None:
-            series.append(execution.finished_at)
-
-        average_interval_ms: int | None = None
-        if len(series) >= 2:
-            intervals = [
-                int((series[i] - series[i - 1]).total_seconds() * 1000)
-                for i in range(1, len(series))
-            ]
-            average_interval_ms = int(sum(intervals) / len(intervals))
-
-        current_items = _item_quantities_from_payload(draft.draft_payload_json or {})
-        prev_items = (
-            _item_quantities_from_payload(routine_done[-1][1].draft_payload_json or {})
-            if routine_done
-            else {}
-        )
-        item_changes_count = (
-            _item_change_count(current_items, prev_items) if current_items else None
-        )
-
-        previous_costs = [
-            hist_execution.final_cost_cents
-            for hist_execution, _ in routine_done
-            if hist_execution.final_cost_cents is not None
-        ]
-        baseline_cost_cents = (
-            int(sum(previous_costs) / len(previous_costs)) if previous_costs else None
-        )
-        cost_deviation_cents: int | None = None
-        if execution.final_cost_cents is not None and baseline_cost_cents is not None:
-            cost_deviation_cents = execution.final_cost_cents - baseline_cost_cents
-
-        confirmation = (
-            db.query(Confirmation)
-            .filter(Confirmation.draft_id == draft.id)
-            .order_by(Confirmation.confirmed_at.desc())
-            .first()
-        )
-        confirmation_latency_ms = confirmation.confirmation_latency_ms if confirmation else None
-
-        modify_count = (
-            db.query(EventLog)
-            .filter(
-                EventLog.entity_type == "Draft",
-                EventLog.entity_id == draft.id,
-                EventLog.event_type == "DRAFT_MODIFIED",
+            adapter_health = vendor_health(db, household_id=household_id, vendor=draft.vendor)
+            adapter_window = adapter_health.get(draft.vendor, {}).get(
+                _ADAPTER_SIGNAL_WINDOW, WindowCounts()
             )
-            .count()
-        )
 
-        failure_rate = round(adapter_failed / adapter_total, 4) if adapter_total else 0.0
+            stats = lock_routine_stats(db, household_id, routine_key)
+            repeats_count = stats.completed_count + (1 if execution.status == "DONE" else 0)
 
-        signal_payload = {
-            "routine_key": routine_key,
-            "status": execution.status,
-            "repeats_count": repeats_count,
-            "cadence": {
-                "time_since_last_completion_ms": time_since_last_completion_ms,
-                "average_interval_ms": average_interval_ms,
-            },
-            "variance": {
-                "item_changes_count": item_changes_count,
-                "baseline_cost_cents": baseline_cost_cents,
-                "cost_deviation_cents": cost_deviation_cents,
-            },
-            "trust": {
-                "confirmation_latency_ms": confirmation_latency_ms,
-                "modify_count_before_confirm": modify_count,
-            },
-            "adapter": {
-                "vendor": draft.vendor,
-                "failed_executions": adapter_failed,
-                "total_executions": adapter_total,
-                "failure_rate": failure_rate,
-            },
-        }
-
-        _log_event(
-            db,
-            household_id=household_id,
-            user_id=user_id,
-            entity_type="Execution",
-            entity_id=execution.id,
-            event_type="AUTOPILOT_SIGNAL_COMPUTED",
-            event_payload=signal_payload,
-        )
+            reference_time = (
+                execution.finished_at if execution.status == "DONE" else execution.started_at
+            )
+            time_since_last_completion_ms: int | None = None
+            if stats.last_completed_at is not None and reference_time is not None:
+                time_since_last_completion_ms = int(
+                    (reference_time - stats.last_completed_at).total_seconds() * 1000
+                )
+
+            current_items = item_quantities(draft.draft_payload_json or {})
+            prev_items = stats.last_items_json or {}
+            item_changes_count = (
+                _item_change_count(current_items, prev_items) if current_items else None
+            )
+            baseline_cost_cents = mean_cost_cents(stats)
+
+            if execution.status == "DONE" and execution.finished_at is not None:
+                record_completion(
+                    stats,
+                    finished_at=execution.finished_at,
+                    final_cost_cents=execution.final_cost_cents,
+                    items=current_items,
+                )
+            average_interval_ms = mean_interval_ms(stats)
+
+            cost_deviation_cents: int | None = None
+            if execution.final_cost_cents is not None and baseline_cost_cents is not None:
+                cost_deviation_cents = execution.final_cost_cents - baseline_cost_cents
+
+            confirmation = (
+                db.query(Confirmation)
+                .filter(Confirmation.draft_id == draft.id)
+                .order_by(Confirmation.confirmed_at.desc())
+                .first()
+            )
+            confirmation_latency_ms = confirmation.confirmation_latency_ms if confirmation else None
+
+            # Not counted from event_log: in async sink mode the DRAFT_MODIFIED rows of a
+            # quick modify -> confirm may still be in the spool.
+            modify_count = draft.modify_count
+
+            signal_payload = {
+                "routine_key": routine_key,
+                "status": execution.status,
+                "repeats_count": repeats_count,
+                "cadence": {
+                    "time_since_last_completion_ms": time_since_last_completion_ms,
+                    "average_interval_ms": average_interval_ms,
+                },
+                "variance": {
+                    "item_changes_count": item_changes_count,
+                    "baseline_cost_cents": baseline_cost_cents,
+                    "cost_deviation_cents": cost_deviation_cents,
+                },
+                "trust": {
+                    "confirmation_latency_ms": confirmation_latency_ms,
+                    "modify_count_before_confirm": modify_count,
+                },
+                "adapter": {
+                    "vendor": draft.vendor,
+                    "window": _ADAPTER_SIGNAL_WINDOW,
+                    "failed_executions": adapter_window.failures,
+                    "total_executions": adapter_window.attempts,
+                    "failure_rate": adapter_window.failure_rate,
+                },
+            }
+
+            log_event(
+                db,
+                household_id=household_id,
+                user_id=user_id,
+                entity_type="Execution",
+                entity_id=execution.id,
+                event_type="AUTOPILOT_SIGNAL_COMPUTED",
+                event_payload=signal_payload,
+            )
     except Exception:
         # Telemetry is best-effort; user-facing flow should never fail because of it.
         return
 
 
-def _routine_key_from_draft(draft: Draft) -> str:
-    payload = draft.draft_payload_json or {}
-    intent = payload.get("intent") if isinstance(payload, dict) else {}
-    if isinstance(intent, dict):
-        rk = str(intent.get("routine_key") or "").strip()
-        if rk:
-            return rk
-    return f"{draft.verb}:UNKNOWN"
-
-
-def _item_quantities_from_payload(payload: dict) -> dict[str, int]:
-    out: dict[str, int] = {}
-    raw_items = payload.get("items") if isinstance(payload, dict) else None
-    if not isinstance(raw_items, list):
-        return out
-
-    for raw in raw_items:
-        if not isinstance(raw, dict):
-            continue
-        name = str(raw.get("name") or "").strip().lower()
-        if not name:
-            continue
-        try:
-            qty = max(1, int(raw.get("quantity") or 1))
-        except Exception:
-            qty = 1
-        out[name] = qty
-
-    return out
-
-
 def _item_change_count(current: dict[str, int], previous: dict[str, int]) -> int:
     keys = set(current) | set(previous)
     return sum(abs(current.get(k, 0) - previous.get(k, 0)) for k in keys)
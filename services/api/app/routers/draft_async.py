@@ -0,0 +1,40 @@
+"""Async draft endpoints (HALO_API_MODE=async).
+
+Draft rehydration is a pair of primary-key reads and runs on the event loop. Modify and
+confirm may re-price or execute through a browser adapter, so the sync handlers from
+routers/draft.py run on the slow-path limiter.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from packages.shared.schemas.card_v1 import CardV1
+from services.api.app.concurrency import run_slow_path
+from services.api.app.db.deps import call_with_db, get_async_db
+from services.api.app.db.models import Draft, ExecutionRequest
+from services.api.app.models.draft import DraftConfirmRequest, DraftModifyRequest
+from services.api.app.routers import draft as sync_draft
+from sqlalchemy.ext.asyncio import AsyncSession
+
+router = APIRouter()
+
+
+@router.post("/v1/draft/modify", response_model=CardV1)
+async def modify_draft(payload: DraftModifyRequest, request: Request) -> CardV1:
+    return await run_slow_path(request, call_with_db, sync_draft.modify_draft, payload)
+
+
+@router.post("/v1/draft/confirm", response_model=CardV1)
+async def confirm_draft(payload: DraftConfirmRequest, request: Request) -> CardV1:
+    return await run_slow_path(request, call_with_db, sync_draft.confirm_draft, payload)
+
+
+@router.get("/v1/drafts/{draft_id}", response_model=CardV1)
+async def get_draft(draft_id: str, db: AsyncSession = Depends(get_async_db)) -> CardV1:
+    draft = await db.get(Draft, draft_id)
+    if draft is None:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
+    req = await db.get(ExecutionRequest, draft.execution_request_id)
+    household_id, request_user_id = (req.household_id, req.user_id) if req else ("", "")
+    return sync_draft._draft_to_card(draft, household_id, request_user_id)
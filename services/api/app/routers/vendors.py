@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from services.api.app.db.deps import get_db
+from services.api.app.models.vendors import VendorHealth, VendorHealthResponse, VendorWindowHealth
+from services.api.app.services.vendor_health import ALL_HOUSEHOLDS, vendor_health
+from sqlalchemy.orm import Session
+
+router = APIRouter()
+
+
+@router.get("/v1/vendors/health", response_model=VendorHealthResponse)
+def get_vendor_health(
+    household_id: str | None = None,
+    vendor: str | None = None,
+    db: Session = Depends(get_db),
+) -> VendorHealthResponse:
+    health = vendor_health(db, household_id=household_id or ALL_HOUSEHOLDS, vendor=vendor)
+    return VendorHealthResponse(
+        household_id=household_id,
+        vendors=[
+            VendorHealth(
+                vendor=name,
+                windows={
+                    window: VendorWindowHealth(
+                        attempts=counts.attempts,
+                        failures=counts.failures,
+                        failure_rate=counts.failure_rate,
+                    )
+                    for window, counts in windows.items()
+                },
+            )
+            for name, windows in sorted(health.items())
+        ],
+    )
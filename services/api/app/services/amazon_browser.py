@@ -3,9 +3,11 @@ from __future__ import annotations
 import os
 import re
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from urllib.parse import quote_plus, urljoin
 
 from services.api.app.models.order import OrderItemInput, OrderItemPriced
@@ -18,6 +20,15 @@ from services.api.app.services.amazon_base import (
     DraftResult,
     ExecuteResult,
 )
+from services.api.app.services.browser_pool import BrowserPool, BrowserPoolConfig
+from services.api.app.services.price_cache import CachedPrice, PriceCache, PriceCacheConfig
+from services.api.app.services.product_resolution import (
+    ProductResolutionCache,
+    ProductResolutionConfig,
+    asin_from_url,
+)
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,6 +40,13 @@ class _BrowserConfig:
     artifacts_dir: Path
     dry_run: bool
     max_total_drift_ratio: float
+    pool: BrowserPoolConfig = field(default_factory=BrowserPoolConfig)
+    pricing_concurrency: int = 3
+    pricing_concurrency_by_household: dict[str, int] = field(default_factory=dict)
+
+    def pricing_pages(self, household_id: str) -> int:
+        cap = self.pricing_concurrency_by_household.get(household_id, self.pricing_concurrency)
+        return max(1, cap)
 
 
 class AmazonBrowserAdapter:
@@ -52,12 +70,40 @@ class AmazonBrowserAdapter:
     - HALO_AMAZON_ARTIFACTS_DIR (default: .local/amazon_artifacts)
     - HALO_AMAZON_DRY_RUN (default: true)
     - HALO_AMAZON_MAX_TOTAL_DRIFT_RATIO (default: 0.05)
+    - HALO_AMAZON_BROWSER_POOL_SIZE / _BROWSER_MAX_USES / _BROWSER_POOL_WARM
+      (see services.browser_pool)
+    - HALO_AMAZON_PRICING_CONCURRENCY (default: 3) pages priced at once per draft
+    - HALO_AMAZON_PRICING_CONCURRENCY_BY_HOUSEHOLD (e.g. "hh-1=1,hh-2=4") per-household caps
+    - HALO_AMAZON_RESOLUTION_CACHE / _RESOLUTION_TTL_S (see services.product_resolution)
+    - HALO_AMAZON_PRICE_TTL_S / _PRICE_CACHE_SIZE (see services.price_cache)
+
+    Drafts and executions lease a warm browser from the pool and run in a fresh context
+    loaded with the household's storage_state; the context is closed afterwards. Item names
+    the household has ordered before skip the search page via the resolution cache, and
+    recently read prices skip the product page; a draft needing neither leases no browser.
     """
 
     vendor = "AMAZON_BROWSER"
 
-    def __init__(self, cfg: _BrowserConfig) -> None:
+    def __init__(
+        self,
+        cfg: _BrowserConfig,
+        browsers: BrowserPool | None = None,
+        resolutions: ProductResolutionCache | None = None,
+        prices: PriceCache | None = None,
+    ) -> None:
         self._cfg = cfg
+        self._browsers = browsers or BrowserPool(
+            cfg.pool, lambda: _launch_chromium(cfg), name="amazon"
+        )
+        self._resolutions = resolutions
+        self._prices = prices
+
+    def start(self) -> None:
+        self._browsers.start()
+
+    def close(self) -> None:
+        self._browsers.close()
 
     @classmethod
     def from_env(cls) -> "AmazonBrowserAdapter":
@@ -73,6 +119,12 @@ class AmazonBrowserAdapter:
         dry_run = _parse_bool(os.getenv("HALO_AMAZON_DRY_RUN", "true"))
         slow_mo_ms = int(os.getenv("HALO_AMAZON_SLOW_MO_MS", "0"))
         max_total_drift_ratio = float(os.getenv("HALO_AMAZON_MAX_TOTAL_DRIFT_RATIO", "0.05"))
+        pricing_concurrency = int(os.getenv("HALO_AMAZON_PRICING_CONCURRENCY", "3"))
+        pricing_concurrency_by_household = _parse_household_caps(
+            os.getenv("HALO_AMAZON_PRICING_CONCURRENCY_BY_HOUSEHOLD", "")
+        )
+        resolution_cfg = ProductResolutionConfig.from_env()
+        price_cfg = PriceCacheConfig.from_env()
 
         return cls(
             _BrowserConfig(
@@ -83,61 +135,78 @@ class AmazonBrowserAdapter:
                 artifacts_dir=artifacts_dir,
                 dry_run=dry_run,
                 max_total_drift_ratio=max_total_drift_ratio,
-            )
+                pool=BrowserPoolConfig.from_env("HALO_AMAZON"),
+                pricing_concurrency=pricing_concurrency,
+                pricing_concurrency_by_household=pricing_concurrency_by_household,
+            ),
+            resolutions=ProductResolutionCache(resolution_cfg) if resolution_cfg.enabled else None,
+            prices=PriceCache(price_cfg) if price_cfg.enabled else None,
         )
 
     def build_draft(self, household_id: str, items: list[OrderItemInput]) -> DraftResult:
         state_path = self._storage_state_path(household_id)
-        run_dir = self._new_run_dir(household_id)
-
-        warnings: list[str] = []
-        priced: list[OrderItemPriced] = []
 
-        with _sync_playwright() as p:
-            browser = p.chromium.launch(headless=self._cfg.headless, slow_mo=self._cfg.slow_mo_ms)
-            context = browser.new_context(storage_state=str(state_path))
-            page = context.new_page()
+        known = self._known_product_urls(household_id, items)
+        resolved = {
+            i: url
+            for i, item in enumerate(items)
+            if (url := self._product_or_search_url(item.name)[0] or known.get(item.name))
+        }
+        cached = self._cached_prices(resolved)
+        if len(cached) == len(items):
+            draft = _draft_result(items, [resolved[i] for i in range(len(items))], cached)
+        else:
+            run_dir = self._new_run_dir(household_id)
+            pages = min(self._cfg.pricing_pages(household_id), len(items) - len(cached))
+            draft = self._browsers.run(
+                lambda browser: self._build_draft_in(
+                    browser, state_path, run_dir, items, pages, resolved, cached
+                )
+            )
+        self._learn_from_draft(household_id, items, draft, known)
+        return draft
 
-            try:
-                for item in items:
-                    product_url = self._resolve_product_url(page, item.name)
-                    unit_price_cents = self._get_unit_price_cents(page, product_url)
-                    if unit_price_cents <= 0:
-                        warnings.append(
-                            f"Could not determine a price for {item.name!r}. "
-                            "Total may differ at checkout."
-                        )
-
-                    line_total_cents = max(unit_price_cents, 0) * item.quantity
-                    priced.append(
-                        OrderItemPriced(
-                            name=item.name,
-                            quantity=item.quantity,
-                            unit_price_cents=max(unit_price_cents, 0),
-                            line_total_cents=line_total_cents,
-                            product_url=product_url,
-                        )
-                    )
-            except Exception as e:
-                artifact = _write_debug_artifacts(page, run_dir, prefix="draft_error")
-                if _is_bot_check(page):
-                    raise AmazonBotCheckError(artifact) from e
-                raise AmazonAdapterError(
-                    f"Amazon browser draft failed: {type(e).__name__}: {e}. Artifact: {artifact}"
-                ) from e
-            finally:
-                browser.close()
-
-        estimated_total_cents = sum(i.line_total_cents for i in priced)
-
-        # Best-effort. We avoid entering checkout during draft.
-        return DraftResult(
-            items=priced,
-            estimated_total_cents=estimated_total_cents,
-            delivery_window="See Amazon",
-            payment_method_masked="Amazon default",
-            warnings=warnings,
-        )
+    def _build_draft_in(
+        self,
+        browser: Any,
+        state_path: Path,
+        run_dir: Path,
+        items: list[OrderItemInput],
+        pages: int,
+        resolved: dict[int, str],
+        cached: dict[int, CachedPrice],
+    ) -> DraftResult:
+        """Price `items`; `resolved` product URLs skip the search, `cached` prices the page."""
+
+        context = browser.new_context(storage_state=str(state_path))
+        page = context.new_page()
+
+        try:
+            tabs = [page, *(context.new_page() for _ in range(pages - 1))]
+            product_urls = self._resolve_product_urls(tabs, items, resolved)
+            searched = {i: url for i, url in enumerate(product_urls) if i not in resolved}
+            cached = {**cached, **self._cached_prices(searched)}
+            priced_at = datetime.utcnow()
+            unit_prices = _in_waves(
+                tabs,
+                [(i, url) for i, url in enumerate(product_urls) if i not in cached],
+                lambda tab, _: self._read_unit_price_cents(tab),
+            )
+            fresh = {i: CachedPrice(cents, priced_at) for i, cents in unit_prices.items()}
+            self._cache_prices(product_urls, fresh)
+        except Exception as e:
+            failed_page, error = (e.page, e.error) if isinstance(e, _PageFailed) else (page, e)
+            artifact = _write_debug_artifacts(failed_page, run_dir, prefix="draft_error")
+            if _is_bot_check(failed_page):
+                raise AmazonBotCheckError(artifact) from error
+            raise AmazonAdapterError(
+                f"Amazon browser draft failed: {type(error).__name__}: {error}. "
+                f"Artifact: {artifact}"
+            ) from error
+        finally:
+            _close_quietly(context)
+
+        return _draft_result(items, product_urls, {**cached, **fresh})
 
     def execute(
         self,
@@ -148,56 +217,86 @@ class AmazonBrowserAdapter:
         state_path = self._storage_state_path(household_id)
         run_dir = self._new_run_dir(household_id)
 
-        with _sync_playwright() as p:
-            browser = p.chromium.launch(headless=self._cfg.headless, slow_mo=self._cfg.slow_mo_ms)
-            context = browser.new_context(storage_state=str(state_path))
-            page = context.new_page()
+        carted: dict[str, str] = {}
+        try:
+            result = self._browsers.run(
+                lambda browser: self._execute_in(
+                    browser, state_path, run_dir, items, expected_total_cents, carted
+                )
+            )
+        except AmazonCheckoutTotalDriftError:
+            # Some price in the draft was off; re-read all of this order's on the redraft.
+            if self._prices is not None:
+                self._prices.invalidate(
+                    [asin for url in carted.values() if (asin := asin_from_url(url))]
+                )
+            raise
+        if self._resolutions is not None:
+            self._resolutions.remember(household_id, self._searchable(carted), source="execute")
+        return result
 
-            try:
-                self._empty_cart(page)
-
-                for item in items:
-                    product_url = item.product_url or self._resolve_product_url(page, item.name)
-                    self._add_to_cart(page, product_url, item.quantity)
-
-                page.goto(f"{self._cfg.base_url}/gp/cart/view.html", wait_until="domcontentloaded")
-                self._proceed_to_checkout(page)
-
-                actual_total_cents = self._best_effort_read_total_cents(page)
-                if actual_total_cents is not None and expected_total_cents > 0:
-                    drift = _drift_ratio(actual_total_cents, expected_total_cents)
-                    if drift > self._cfg.max_total_drift_ratio:
-                        raise AmazonCheckoutTotalDriftError(
-                            expected_total_cents=expected_total_cents,
-                            actual_total_cents=actual_total_cents,
-                        )
-
-                if self._cfg.dry_run:
-                    page.screenshot(path=str(run_dir / "checkout.png"), full_page=True)
-                    return ExecuteResult(
-                        receipt_id=f"dryrun_{int(time.time())}",
-                        total_cents=actual_total_cents or expected_total_cents,
-                        summary=f"Dry run: stopped at checkout. Screenshot: {run_dir}/checkout.png",
-                    )
+    def _execute_in(
+        self,
+        browser: Any,
+        state_path: Path,
+        run_dir: Path,
+        items: list[OrderItemPriced],
+        expected_total_cents: int,
+        carted: dict[str, str],
+    ) -> ExecuteResult:
+        """Check out `items`; fills `carted` (item name -> product URL) as items are added."""
+
+        context = browser.new_context(storage_state=str(state_path))
+        page = context.new_page()
 
-                self._place_order(page)
-                page.screenshot(path=str(run_dir / "confirmation.png"), full_page=True)
+        try:
+            self._empty_cart(page)
 
-                receipt_id = _extract_order_number(page) or f"amz_{int(time.time())}"
+            for item in items:
+                product_url = item.product_url or self._resolve_product_url(page, item.name)
+                self._add_to_cart(page, product_url, item.quantity)
+                carted[item.name] = product_url
+
+            page.goto(f"{self._cfg.base_url}/gp/cart/view.html", wait_until="domcontentloaded")
+            self._proceed_to_checkout(page)
+
+            actual_total_cents = self._best_effort_read_total_cents(page)
+            if actual_total_cents is not None and expected_total_cents > 0:
+                drift = _drift_ratio(actual_total_cents, expected_total_cents)
+                if drift > self._cfg.max_total_drift_ratio:
+                    raise AmazonCheckoutTotalDriftError(
+                        expected_total_cents=expected_total_cents,
+                        actual_total_cents=actual_total_cents,
+                    )
+
+            if self._cfg.dry_run:
+                page.screenshot(path=str(run_dir / "checkout.png"), full_page=True)
                 return ExecuteResult(
-                    receipt_id=receipt_id,
+                    receipt_id=f"dryrun_{int(time.time())}",
                     total_cents=actual_total_cents or expected_total_cents,
-                    summary="Order placed",
+                    summary=f"Dry run: stopped at checkout. Screenshot: {run_dir}/checkout.png",
                 )
-            except Exception as e:
-                artifact = _write_debug_artifacts(page, run_dir, prefix="execute_error")
-                if _is_bot_check(page):
-                    raise AmazonBotCheckError(artifact) from e
-                raise AmazonAdapterError(
-                    f"Amazon browser execute failed: {type(e).__name__}: {e}. Artifact: {artifact}"
-                ) from e
-            finally:
-                browser.close()
+
+            self._place_order(page)
+            page.screenshot(path=str(run_dir / "confirmation.png"), full_page=True)
+
+            receipt_id = _extract_order_number(page) or f"amz_{int(time.time())}"
+            return ExecuteResult(
+                receipt_id=receipt_id,
+                total_cents=actual_total_cents or expected_total_cents,
+                summary="Order placed",
+            )
+        except AmazonCheckoutTotalDriftError:
+            raise
+        except Exception as e:
+            artifact = _write_debug_artifacts(page, run_dir, prefix="execute_error")
+            if _is_bot_check(page):
+                raise AmazonBotCheckError(artifact) from e
+            raise AmazonAdapterError(
+                f"Amazon browser execute failed: {type(e).__name__}: {e}. Artifact: {artifact}"
+            ) from e
+        finally:
+            _close_quietly(context)
 
     def _storage_state_path(self, household_id: str) -> Path:
         state_path = (self._cfg.storage_state_dir / f"{household_id}.json").expanduser()
@@ -212,18 +311,105 @@ class AmazonBrowserAdapter:
         return run_dir
 
     def _resolve_product_url(self, page: Any, raw: str) -> str:
+        direct_url, search_url = self._product_or_search_url(raw)
+        if direct_url is not None:
+            return direct_url
+
+        page.goto(search_url, wait_until="domcontentloaded")
+        return self._first_search_result_url(page, raw)
+
+    def _resolve_product_urls(
+        self, tabs: list[Any], items: list[OrderItemInput], resolved: dict[int, str]
+    ) -> list[str]:
+        """Product URL per item, in item order.
+
+        Items missing from `resolved` (index -> URL) are searched in waves across `tabs`.
+        """
+
+        urls = dict(resolved)
+        searches = [
+            (i, self._product_or_search_url(item.name)[1])
+            for i, item in enumerate(items)
+            if i not in resolved
+        ]
+        urls.update(
+            _in_waves(
+                tabs, searches, lambda tab, i: self._first_search_result_url(tab, items[i].name)
+            )
+        )
+        return [urls[i] for i in range(len(items))]
+
+    def _known_product_urls(self, household_id: str, items: list[OrderItemInput]) -> dict[str, str]:
+        if self._resolutions is None:
+            return {}
+        names = list(self._searchable({item.name: "" for item in items}))
+        return self._resolutions.lookup(household_id, names)
+
+    def _learn_from_draft(
+        self,
+        household_id: str,
+        items: list[OrderItemInput],
+        draft: DraftResult,
+        known: dict[str, str],
+    ) -> None:
+        if self._resolutions is None:
+            return
+
+        searched: dict[str, str] = {}
+        stale: list[str] = []
+        for item, priced in zip(items, draft.items):
+            if item.name in known:
+                if priced.unit_price_cents <= 0:
+                    # The remembered product no longer shows a price (unavailable, delisted).
+                    stale.append(item.name)
+            elif priced.product_url and priced.unit_price_cents > 0:
+                searched[item.name] = priced.product_url
+        self._resolutions.remember(household_id, self._searchable(searched), source="draft")
+        self._resolutions.forget(household_id, stale)
+
+    def _cached_prices(self, product_urls: dict[int, str]) -> dict[int, CachedPrice]:
+        if self._prices is None:
+            return {}
+
+        cached: dict[int, CachedPrice] = {}
+        for i, url in product_urls.items():
+            asin = asin_from_url(url)
+            if asin is not None and (price := self._prices.get(asin)) is not None:
+                cached[i] = price
+        return cached
+
+    def _cache_prices(self, product_urls: list[str], fresh: dict[int, CachedPrice]) -> None:
+        if self._prices is None:
+            return
+
+        for i, price in fresh.items():
+            asin = asin_from_url(product_urls[i])
+            if asin is not None and price.unit_price_cents > 0:
+                self._prices.put(asin, price.unit_price_cents, price.priced_at)
+
+    def _searchable(self, product_urls: dict[str, str]) -> dict[str, str]:
+        """The entries whose name needs a search (not an ASIN or URL already)."""
+
+        return {
+            name: url
+            for name, url in product_urls.items()
+            if self._product_or_search_url(name)[0] is None
+        }
+
+    def _product_or_search_url(self, raw: str) -> tuple[str | None, str]:
         raw = raw.strip()
 
         asin = _maybe_asin(raw)
         if asin is not None:
-            return f"{self._cfg.base_url}/dp/{asin}"
+            return f"{self._cfg.base_url}/dp/{asin}", ""
 
         if raw.startswith("http://") or raw.startswith("https://"):
-            return raw
+            return raw, ""
 
-        search_url = f"{self._cfg.base_url}/s?k={quote_plus(raw)}"
+        return None, f"{self._cfg.base_url}/s?k={quote_plus(raw)}"
 
-        page.goto(search_url, wait_until="domcontentloaded")
+    def _first_search_result_url(self, page: Any, raw: str) -> str:
+        raw = raw.strip()
         # Amazon's markup changes frequently. Prefer grabbing the first result element, then
         # extracting a product link or falling back to the result ASIN.
         page.wait_for_selector(
@@ -257,9 +443,7 @@ class AmazonBrowserAdapter:
 
         raise RuntimeError(f"No search results found for: {raw!r}")
 
-    def _get_unit_price_cents(self, page: Any, product_url: str) -> int:
-        page.goto(product_url, wait_until="domcontentloaded")
-
+    def _read_unit_price_cents(self, page: Any) -> int:
         selectors = [
             "#corePriceDisplay_desktop_feature_div span.a-offscreen",
             "#corePrice_feature_div span.a-offscreen",
@@ -405,6 +589,123 @@ def _sync_playwright() -> Any:
     return sync_playwright()
 
 
+def _launch_chromium(cfg: _BrowserConfig) -> tuple[Any, Callable[[], None]]:
+    """Start a Playwright driver and Chromium on the calling (pool worker) thread."""
+
+    p = _sync_playwright().start()
+    try:
+        browser = p.chromium.launch(headless=cfg.headless, slow_mo=cfg.slow_mo_ms)
+    except Exception:
+        p.stop()
+        raise
+
+    def _stop() -> None:
+        try:
+            browser.close()
+        finally:
+            p.stop()
+
+    return browser, _stop
+
+
+class _PageFailed(Exception):
+    """Carries the tab an item failed on, so artifacts capture that page."""
+
+    def __init__(self, page: Any, error: Exception) -> None:
+        super().__init__(str(error))
+        self.page = page
+        self.error = error
+
+
+def _in_waves(
+    tabs: list[Any], jobs: list[tuple[int, str]], read: Callable[[Any, int], T]
+) -> dict[int, T]:
+    """Load `jobs` (index, url) across `tabs` and `read` each page once it is ready.
+
+    The sync API cannot drive pages from several threads, so each wave starts every tab's
+    navigation first (returning once the response starts) and only then waits on each
+    tab in turn: the page loads overlap in the browser while Python reads them in order.
+    """
+
+    results: dict[int, T] = {}
+    for start in range(0, len(jobs), len(tabs)):
+        wave = list(zip(tabs, jobs[start : start + len(tabs)]))
+        for tab, (_, url) in wave:
+            try:
+                tab.goto(url, wait_until="commit")
+            except Exception as e:
+                raise _PageFailed(tab, e) from e
+        for tab, (index, _) in wave:
+            try:
+                tab.wait_for_load_state("domcontentloaded")
+                results[index] = read(tab, index)
+            except Exception as e:
+                raise _PageFailed(tab, e) from e
+    return results
+
+
+def _draft_result(
+    items: list[OrderItemInput], product_urls: list[str], prices: dict[int, CachedPrice]
+) -> DraftResult:
+    warnings: list[str] = []
+    priced: list[OrderItemPriced] = []
+
+    for i, item in enumerate(items):
+        unit_price_cents = max(prices[i].unit_price_cents, 0)
+        if unit_price_cents <= 0:
+            warnings.append(
+                f"Could not determine a price for {item.name!r}. Total may differ at checkout."
+            )
+
+        priced.append(
+            OrderItemPriced(
+                name=item.name,
+                quantity=item.quantity,
+                unit_price_cents=unit_price_cents,
+                line_total_cents=unit_price_cents * item.quantity,
+                product_url=product_urls[i],
+                priced_at=prices[i].priced_at,
+            )
+        )
+
+    now = datetime.utcnow()
+    ages = [now - p.priced_at for p in prices.values() if now - p.priced_at >= _STALE_PRICE_AGE]
+    if ages:
+        warnings.append(
+            f"Prices for {len(ages)} item(s) were last checked {_format_age(max(ages))} ago. "
+            "The checkout total is verified before ordering."
+        )
+
+    # Best-effort. We avoid entering checkout during draft.
+    return DraftResult(
+        items=priced,
+        estimated_total_cents=sum(i.line_total_cents for i in priced),
+        delivery_window="See Amazon",
+        payment_method_masked="Amazon default",
+        warnings=warnings,
+    )
+
+
+# Prices read during this draft are "now"; older ones came from the price cache.
+_STALE_PRICE_AGE = timedelta(minutes=1)
+
+
+def _format_age(age: timedelta) -> str:
+    minutes = int(age.total_seconds() // 60)
+    if minutes < 60:
+        return f"{minutes} min"
+    return f"{minutes // 60} h {minutes % 60} min"
+
+
+def _close_quietly(context: Any) -> None:
+    # The pooled browser outlives the request; a context that fails to close is only logged
+    # by Playwright, and a crashed browser is replaced on the next lease.
+    try:
+        context.close()
+    except Exception:
+        pass
+
+
 def _write_debug_artifacts(page: Any, run_dir: Path, prefix: str) -> Path:
     screenshot_path = run_dir / f"{prefix}.png"
     html_path = run_dir / f"{prefix}.html"
@@ -452,6 +753,15 @@ def _maybe_asin(value: str) -> str | None:
     return None
 
 
+def _parse_household_caps(value: str) -> dict[str, int]:
+    caps: dict[str, int] = {}
+    for pair in value.split(","):
+        household_id, sep, cap = pair.partition("=")
+        if sep and household_id.strip():
+            caps[household_id.strip()] = int(cap)
+    return caps
+
+
 def _parse_bool(value: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "y", "on"}
 
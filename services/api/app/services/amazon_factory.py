@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import os
 
+from services.api.app.components import components
 from services.api.app.services.amazon_base import AmazonAdapter
 from services.api.app.services.amazon_mock import AmazonMockAdapter
 
 
 def get_amazon_adapter() -> AmazonAdapter:
+    """The process-wide adapter, built once by `build_amazon_adapter`."""
+
+    return components().get("amazon_adapter", build_amazon_adapter)
+
+
+def build_amazon_adapter() -> AmazonAdapter:
     """Select an adapter based on env vars.
 
     Defaults to the mock adapter so tests and local dev are deterministic unless explicitly
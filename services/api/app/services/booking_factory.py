@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import os
 
+from services.api.app.components import components
 from services.api.app.services.booking_base import BookingAdapter
 from services.api.app.services.booking_mock import MockBookingAdapter
 
 
 def get_booking_adapter() -> BookingAdapter:
+    """The process-wide adapter, built once by `build_booking_adapter`."""
+
+    return components().get("booking_adapter", build_booking_adapter)
+
+
+def build_booking_adapter() -> BookingAdapter:
     provider = os.getenv("HALO_BOOKING_ADAPTER", "mock").strip().lower()
 
     if provider in ("mock", "demo"):
@@ -15,6 +22,6 @@ def get_booking_adapter() -> BookingAdapter:
     if provider in ("resy", "resy_browser"):
         from services.api.app.services.resy_browser import ResyBrowserBookingAdapter
 
-        return ResyBrowserBookingAdapter()
+        return ResyBrowserBookingAdapter.from_env()
 
     raise ValueError(f"Unknown HALO_BOOKING_ADAPTER={provider!r}. Expected mock or resy.")
@@ -0,0 +1,194 @@
+"""Pool of warm, long-lived Playwright browsers for the browser vendor adapters.
+
+A cold Chromium launch costs hundreds of milliseconds to seconds, which adapters used to pay
+on every draft and execution. The pool keeps `size` browsers running instead. A caller leases
+one with `run(fn)`, opens a fresh per-household context inside `fn`, and closes that context
+before returning, so no cookies or storage leak between households or requests.
+
+Playwright's sync API only works on the thread that started it, so each browser belongs to
+one worker thread, and leasing a browser means running `fn` on that worker. Each worker
+checks its browser before every lease:
+- It launches a browser if it has none yet (reason `cold`).
+- It relaunches one that disconnected or crashed (reason `crash`).
+- It replaces one that has served `max_uses` leases (reason `recycle`), to bound memory
+  growth.
+
+Metrics (labelled pool=<name>):
+- browser_pool_lease_wait_ms: queueing time before a worker picked up the lease
+- browser_pool_busy / browser_pool_waiting gauges: leases running / queued
+- browser_pool_launches_total{reason=cold|crash|recycle}
+
+Env vars (per adapter prefix, e.g. HALO_AMAZON):
+- <PREFIX>_BROWSER_POOL_SIZE (default: 2)
+- <PREFIX>_BROWSER_MAX_USES (default: 50)
+- <PREFIX>_BROWSER_POOL_WARM (default: true) launch browsers when the adapter starts
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from services.api.app.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# A launcher returns a connected browser plus a callable that shuts it (and its driver) down.
+Launcher = Callable[[], tuple[Any, Callable[[], None]]]
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserPoolConfig:
+    size: int = 2
+    max_uses: int = 50
+    warm: bool = True
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "BrowserPoolConfig":
+        return cls(
+            size=max(1, int(os.getenv(f"{prefix}_BROWSER_POOL_SIZE", "2"))),
+            max_uses=max(1, int(os.getenv(f"{prefix}_BROWSER_MAX_USES", "50"))),
+            warm=_parse_bool(os.getenv(f"{prefix}_BROWSER_POOL_WARM", "true")),
+        )
+
+
+@dataclass(slots=True)
+class _Lease(Generic[T]):
+    fn: Callable[[Any], T]
+    future: Future[T]
+    enqueued_at: float
+
+
+class _Browser:
+    __slots__ = ("browser", "stop", "uses")
+
+    def __init__(self, browser: Any, stop: Callable[[], None]) -> None:
+        self.browser = browser
+        self.stop = stop
+        self.uses = 0
+
+    def healthy(self) -> bool:
+        try:
+            return bool(self.browser.is_connected())
+        except Exception:
+            return False
+
+
+class BrowserPool:
+    def __init__(self, cfg: BrowserPoolConfig, launch: Launcher, *, name: str) -> None:
+        self.cfg = cfg
+        self._launch = launch
+        self._labels = {"pool": name}
+        self._leases: queue.Queue[_Lease[Any] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: list[threading.Thread] = []
+        self._busy = 0
+        registry.gauge_callback("browser_pool_busy", lambda: self._busy, labels=self._labels)
+        registry.gauge_callback("browser_pool_waiting", self._leases.qsize, labels=self._labels)
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent); with `warm`, each launches its browser now."""
+
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(self.cfg.size):
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"halo-browser-{self._labels['pool']}-{i}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def run(self, fn: Callable[[Any], T]) -> T:
+        """Run `fn(browser)` on a pooled browser and return its result (or raise its error)."""
+
+        self.start()
+        lease: _Lease[T] = _Lease(fn=fn, future=Future(), enqueued_at=time.perf_counter())
+        self._leases.put(lease)
+        return lease.future.result()
+
+    def close(self, timeout_s: float = 10.0) -> None:
+        """Let queued leases finish, then shut every browser down."""
+
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._leases.put(None)
+        for worker in workers:
+            worker.join(timeout_s)
+
+    def _work(self) -> None:
+        current: _Browser | None = None
+        if self.cfg.warm:
+            try:
+                current = self._relaunch(None, "cold")
+            except Exception:
+                logger.warning("browser warm-up failed", exc_info=True)
+
+        while True:
+            lease = self._leases.get()
+            if lease is None:
+                break
+            if not lease.future.set_running_or_notify_cancel():
+                continue
+            registry.observe(
+                "browser_pool_lease_wait_ms",
+                (time.perf_counter() - lease.enqueued_at) * 1000,
+                labels=self._labels,
+            )
+            try:
+                current = self._checked(current)
+                with self._lock:
+                    self._busy += 1
+                try:
+                    current.uses += 1
+                    result = lease.fn(current.browser)
+                finally:
+                    with self._lock:
+                        self._busy -= 1
+            except BaseException as e:
+                lease.future.set_exception(e)
+            else:
+                lease.future.set_result(result)
+
+        if current is not None:
+            _stop(current)
+
+    def _checked(self, current: _Browser | None) -> _Browser:
+        if current is None:
+            return self._relaunch(None, "cold")
+        if not current.healthy():
+            return self._relaunch(current, "crash")
+        if current.uses >= self.cfg.max_uses:
+            return self._relaunch(current, "recycle")
+        return current
+
+    def _relaunch(self, old: _Browser | None, reason: str) -> _Browser:
+        if old is not None:
+            _stop(old)
+        browser, stop = self._launch()
+        registry.inc("browser_pool_launches_total", labels={**self._labels, "reason": reason})
+        return _Browser(browser, stop)
+
+
+def _stop(current: _Browser) -> None:
+    try:
+        current.stop()
+    except Exception:
+        # A crashed browser often cannot be closed cleanly; the driver is gone either way.
+        logger.debug("browser shutdown failed", exc_info=True)
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
@@ -0,0 +1,136 @@
+"""Speculative REORDER drafts priced while the LLM extracts the intent.
+
+The two slow steps of `POST /v1/command` are LLM extraction (seconds) and
+`AmazonAdapter.build_draft` (seconds to tens of seconds with the browser adapter). Without
+speculation they run one after the other. The deterministic rule pass takes microseconds and
+already recognizes most reorders ("reorder the usual", named catalog items). For those,
+pricing starts on a small worker pool before the LLM is called.
+
+Once the final intent is known:
+- If it drafts the same items (names up to case and surrounding whitespace, quantities, in
+  order), the speculative draft is used, with item names taken from the final intent. Any
+  remaining pricing time is awaited. If speculative pricing raised, that error
+  is handled as if the draft had been built after extraction.
+- Otherwise the speculative draft is thrown away. If it has not started yet, it is cancelled.
+
+Metrics:
+- draft_speculation_total{outcome=hit|wasted}
+- draft_speculation_head_start_ms: on a hit, the pricing time that overlapped extraction,
+  i.e. the end-to-end latency saved
+
+Env vars:
+- HALO_DRAFT_SPECULATION (default: true)
+- HALO_DRAFT_SPECULATION_WORKERS (default: 4) speculative drafts priced at once
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+
+from services.api.app.components import components
+from services.api.app.metrics import registry
+from services.api.app.models.order import OrderItemInput
+from services.api.app.services.amazon_base import AmazonAdapter, DraftResult
+
+
+@dataclass(frozen=True, slots=True)
+class SpeculationConfig:
+    enabled: bool = True
+    workers: int = 4
+
+    @classmethod
+    def from_env(cls) -> "SpeculationConfig":
+        return cls(
+            enabled=_parse_bool(os.getenv("HALO_DRAFT_SPECULATION", "true")),
+            workers=max(1, int(os.getenv("HALO_DRAFT_SPECULATION_WORKERS", "4"))),
+        )
+
+
+class SpeculativeDraft:
+    def __init__(self, items: list[OrderItemInput], future: Future[DraftResult]) -> None:
+        self.items = items
+        self._future = future
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self._settled = False
+        self._lock = threading.Lock()
+        future.add_done_callback(self._mark_finished)
+
+    def _mark_finished(self, _: Future[DraftResult]) -> None:
+        self._finished = time.perf_counter()
+
+    def take(self, items: list[OrderItemInput]) -> DraftResult | None:
+        """The speculative draft if it priced `items`; otherwise discard it.
+
+        Item names on the returned draft are those of `items`, not of the rule pass.
+        Re-raises whatever the speculative `build_draft` raised.
+        """
+
+        if not _same_items(self.items, items):
+            self.discard()
+            return None
+        if not self._settle():
+            return None
+
+        now = time.perf_counter()
+        head_start_ms = (min(now, self._finished or now) - self._started) * 1000
+        registry.inc("draft_speculation_total", labels={"outcome": "hit"})
+        registry.observe("draft_speculation_head_start_ms", head_start_ms)
+        draft = self._future.result()
+        return replace(
+            draft,
+            items=[
+                priced.model_copy(update={"name": item.name})
+                for priced, item in zip(draft.items, items, strict=True)
+            ],
+        )
+
+    def discard(self) -> None:
+        """Throw the speculative draft away unless it was taken. Idempotent."""
+
+        if self._settle():
+            self._future.cancel()
+            registry.inc("draft_speculation_total", labels={"outcome": "wasted"})
+
+    def _settle(self) -> bool:
+        with self._lock:
+            first, self._settled = not self._settled, True
+            return first
+
+
+class SpeculationPool:
+    def __init__(self, cfg: SpeculationConfig) -> None:
+        self.cfg = cfg
+        self._executor = ThreadPoolExecutor(
+            max_workers=cfg.workers, thread_name_prefix="halo-speculate"
+        )
+
+    def submit(
+        self, adapter: AmazonAdapter, household_id: str, items: list[OrderItemInput]
+    ) -> SpeculativeDraft:
+        return SpeculativeDraft(
+            items, self._executor.submit(adapter.build_draft, household_id, items)
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_speculation_pool() -> SpeculationPool:
+    return components().get(
+        "draft_speculation", lambda: SpeculationPool(SpeculationConfig.from_env())
+    )
+
+
+def _same_items(a: list[OrderItemInput], b: list[OrderItemInput]) -> bool:
+    return [(i.name.strip().lower(), i.quantity) for i in a] == [
+        (i.name.strip().lower(), i.quantity) for i in b
+    ]
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
@@ -0,0 +1,73 @@
+"""Short-lived cache of Amazon unit prices, keyed by ASIN.
+
+Every draft, and every `/v1/draft/modify`, used to load each product page just to read its
+price. Prices of household staples rarely move within hours. A price read within the TTL is
+therefore reused, and the item carries `priced_at` so the card can show how old it is.
+
+Spend stays protected: confirm still compares the checkout total against the draft estimate
+(`HALO_AMAZON_MAX_TOTAL_DRIFT_RATIO`). When that check fails, the adapter invalidates the
+prices of every item in the order, so the redraft reads fresh ones.
+
+Prices are not household-specific, so one process-local map serves every household. Each
+replica keeps its own. An invalidation only reaches the replica that saw the drift; the
+others age out within the TTL.
+
+Metrics:
+- price_cache_total{result=hit|miss}: per product priced by a draft
+- price_cache_invalidated_total: entries dropped after a checkout total drift
+
+Env vars:
+- HALO_AMAZON_PRICE_TTL_S (default: 21600, 6 hours; 0 disables the cache)
+- HALO_AMAZON_PRICE_CACHE_SIZE (default: 4096) ASINs held per process
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+from services.api.app.metrics import registry
+from services.api.app.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class PriceCacheConfig:
+    ttl_s: float = 21_600.0
+    max_entries: int = 4096
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0
+
+    @classmethod
+    def from_env(cls) -> "PriceCacheConfig":
+        return cls(
+            ttl_s=float(os.getenv("HALO_AMAZON_PRICE_TTL_S", "21600")),
+            max_entries=int(os.getenv("HALO_AMAZON_PRICE_CACHE_SIZE", "4096")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPrice:
+    unit_price_cents: int
+    priced_at: datetime
+
+
+class PriceCache:
+    def __init__(self, cfg: PriceCacheConfig) -> None:
+        self._prices: TTLCache[str, CachedPrice] = TTLCache(
+            max_entries=cfg.max_entries, ttl_s=cfg.ttl_s
+        )
+
+    def get(self, asin: str) -> CachedPrice | None:
+        cached = self._prices.get(asin)
+        registry.inc("price_cache_total", labels={"result": "miss" if cached is None else "hit"})
+        return cached
+
+    def put(self, asin: str, unit_price_cents: int, priced_at: datetime) -> None:
+        self._prices.put(asin, CachedPrice(unit_price_cents=unit_price_cents, priced_at=priced_at))
+
+    def invalidate(self, asins: list[str]) -> None:
+        dropped = sum(self._prices.pop(asin) is not None for asin in set(asins))
+        registry.inc("price_cache_invalidated_total", dropped)
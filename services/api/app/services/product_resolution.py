@@ -0,0 +1,187 @@
+"""Per-household cache of which product a plain item name resolves to.
+
+Resolving "paper towels" costs the browser adapter a search page load per item, on every
+draft, although a household's usual items land on the same ASIN week after week. The
+`product_resolutions` table remembers the answer per (household, normalized item name):
+- A successful draft records every item it had to search for and managed to price.
+- A successful execution records every product it put in the cart, refreshing the TTL.
+- A cached product that no longer shows a price is forgotten, so the next draft searches
+  again.
+- Pinned rows (scripts/pin_product.py) never expire and are never overwritten by the
+  above, so a household can insist on a specific product.
+
+Like the intent cache's shared tier, every read and write is best effort and runs in its
+own short session: a database problem costs a search, never the draft.
+
+Metrics:
+- product_resolution_total{result=hit|miss}: per searchable item looked up; the hit rate
+  is hit / (hit + miss)
+
+Env vars:
+- HALO_AMAZON_RESOLUTION_CACHE (default: true)
+- HALO_AMAZON_RESOLUTION_TTL_S (default: 2592000, 30 days) lifetime of unpinned rows
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from services.api.app.db.database import db_session, insert_or_update
+from services.api.app.db.models import ProductResolution
+from services.api.app.metrics import registry
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_DP_ASIN = re.compile(r"/(?:dp|gp/product)/([A-Z0-9]{10})(?:[/?]|$)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class ProductResolutionConfig:
+    enabled: bool = True
+    ttl_s: float = 2_592_000.0
+
+    @classmethod
+    def from_env(cls) -> "ProductResolutionConfig":
+        return cls(
+            enabled=_parse_bool(os.getenv("HALO_AMAZON_RESOLUTION_CACHE", "true")),
+            ttl_s=float(os.getenv("HALO_AMAZON_RESOLUTION_TTL_S", "2592000")),
+        )
+
+
+def item_key(name: str) -> str:
+    return _WHITESPACE.sub(" ", name).strip().casefold()
+
+
+def asin_from_url(product_url: str) -> str | None:
+    match = _DP_ASIN.search(product_url)
+    return match.group(1).upper() if match else None
+
+
+class ProductResolutionCache:
+    def __init__(self, cfg: ProductResolutionConfig) -> None:
+        self._cfg = cfg
+
+    def lookup(self, household_id: str, names: list[str]) -> dict[str, str]:
+        """Product URL per item name, for the names with a live (or pinned) resolution."""
+
+        keys = {item_key(name) for name in names}
+        if not keys:
+            return {}
+
+        try:
+            with db_session() as db:
+                rows = db.execute(
+                    select(ProductResolution.item_key, ProductResolution.product_url).where(
+                        ProductResolution.household_id == household_id,
+                        ProductResolution.item_key.in_(keys),
+                        or_(
+                            ProductResolution.pinned.is_(True),
+                            ProductResolution.expires_at > datetime.utcnow(),
+                        ),
+                    )
+                ).all()
+        except Exception:
+            logger.warning("product resolution lookup failed", exc_info=True)
+            rows = []
+
+        found = {row.item_key: row.product_url for row in rows}
+        resolved = {name: found[item_key(name)] for name in names if item_key(name) in found}
+        registry.inc("product_resolution_total", len(resolved), labels={"result": "hit"})
+        registry.inc(
+            "product_resolution_total", len(names) - len(resolved), labels={"result": "miss"}
+        )
+        return resolved
+
+    def remember(self, household_id: str, product_urls: dict[str, str], *, source: str) -> None:
+        """Record (or refresh) name -> product URL; pinned rows are left as they are."""
+
+        if not product_urls:
+            return
+
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self._cfg.ttl_s)
+        try:
+            with db_session() as db:
+                for name, product_url in product_urls.items():
+                    row = _row(household_id, name, product_url, source=source, now=now)
+                    db.execute(
+                        insert_or_update(
+                            db,
+                            ProductResolution,
+                            {**row, "expires_at": expires_at},
+                            key=["household_id", "item_key"],
+                            where=ProductResolution.pinned.is_(False),
+                        )
+                    )
+                db.commit()
+        except Exception:
+            logger.warning("product resolution write failed", exc_info=True)
+
+    def forget(self, household_id: str, names: list[str]) -> None:
+        """Drop unpinned resolutions for `names`, so their next draft searches again."""
+
+        if not names:
+            return
+
+        try:
+            with db_session() as db:
+                db.execute(
+                    delete(ProductResolution).where(
+                        ProductResolution.household_id == household_id,
+                        ProductResolution.item_key.in_({item_key(name) for name in names}),
+                        ProductResolution.pinned.is_(False),
+                    )
+                )
+                db.commit()
+        except Exception:
+            logger.warning("product resolution delete failed", exc_info=True)
+
+
+def pin_product(db: Session, household_id: str, name: str, product_url: str) -> None:
+    """Resolve `name` to `product_url` for this household until unpinned."""
+
+    row = _row(household_id, name, product_url, source="pinned", now=datetime.utcnow())
+    db.execute(
+        insert_or_update(
+            db,
+            ProductResolution,
+            {**row, "pinned": True, "expires_at": None},
+            key=["household_id", "item_key"],
+        )
+    )
+
+
+def unpin_product(db: Session, household_id: str, name: str) -> bool:
+    """Remove a pinned resolution; returns whether there was one."""
+
+    result = db.execute(
+        delete(ProductResolution).where(
+            ProductResolution.household_id == household_id,
+            ProductResolution.item_key == item_key(name),
+            ProductResolution.pinned.is_(True),
+        )
+    )
+    return bool(result.rowcount)
+
+
+def _row(household_id: str, name: str, product_url: str, *, source: str, now: datetime) -> dict:
+    return {
+        "household_id": household_id,
+        "item_key": item_key(name),
+        "product_url": product_url,
+        "asin": asin_from_url(product_url),
+        "source": source,
+        "pinned": False,
+        "resolved_at": now,
+    }
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
@@ -80,8 +80,12 @@ class ResyBrowserBookingAdapter(BookingAdapter):
 
     vendor = "RESY_BROWSER"
 
-    def __init__(self) -> None:
-        self._cfg = _ResyConfig.from_env()
+    def __init__(self, cfg: _ResyConfig) -> None:
+        self._cfg = cfg
+
+    @classmethod
+    def from_env(cls) -> "ResyBrowserBookingAdapter":
+        return cls(_ResyConfig.from_env())
 
     def build_draft(
         self,
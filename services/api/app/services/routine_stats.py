@@ -0,0 +1,143 @@
+"""Per-routine autopilot rollup (`routine_stats`).
+
+One row per (household_id, routine_key), folded forward on each DONE execution so the
+autopilot signal reads a single row instead of the routine's execution history.
+
+The mean completion interval is derived rather than stored: the mean of consecutive gaps
+over a sorted series telescopes to (last - first) / (count - 1), so tracking the first and
+last completion keeps it exact without a running float.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from services.api.app.db.database import insert_ignoring_conflicts
+from services.api.app.db.models import Draft, Execution, ExecutionRequest, RoutineStats
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+
+def lock_routine_stats(db: Session, household_id: str, routine_key: str) -> RoutineStats:
+    """Return the routine's rollup row, creating it if needed, locked for update."""
+
+    db.execute(insert_ignoring_conflicts(db, RoutineStats, [_empty_row(household_id, routine_key)]))
+    return db.execute(
+        select(RoutineStats)
+        .where(
+            RoutineStats.household_id == household_id,
+            RoutineStats.routine_key == routine_key,
+        )
+        .with_for_update()
+    ).scalar_one()
+
+
+def record_completion(
+    stats: RoutineStats,
+    *,
+    finished_at: datetime,
+    final_cost_cents: int | None,
+    items: dict[str, int],
+) -> None:
+    stats.completed_count += 1
+    if stats.first_completed_at is None or finished_at < stats.first_completed_at:
+        stats.first_completed_at = finished_at
+    if stats.last_completed_at is None or finished_at >= stats.last_completed_at:
+        stats.last_completed_at = finished_at
+        stats.last_items_json = items
+    if final_cost_cents is not None:
+        stats.cost_sum_cents += final_cost_cents
+        stats.cost_count += 1
+    stats.updated_at = datetime.utcnow()
+
+
+def mean_interval_ms(stats: RoutineStats) -> int | None:
+    if stats.completed_count < 2 or stats.first_completed_at is None:
+        return None
+    assert stats.last_completed_at is not None
+    span_s = (stats.last_completed_at - stats.first_completed_at).total_seconds()
+    return int(span_s * 1000 / (stats.completed_count - 1))
+
+
+def mean_cost_cents(stats: RoutineStats) -> int | None:
+    return int(stats.cost_sum_cents / stats.cost_count) if stats.cost_count else None
+
+
+def rebuild_routine_stats(db: Session, household_id: str | None = None) -> int:
+    """Recompute rollup rows from execution history. Returns the number of rows written."""
+
+    clear = delete(RoutineStats)
+    history = (
+        select(Execution, Draft, ExecutionRequest.household_id)
+        .join(Draft, Draft.id == Execution.draft_id)
+        .join(ExecutionRequest, ExecutionRequest.id == Draft.execution_request_id)
+        .where(Execution.status == "DONE", Execution.finished_at.is_not(None))
+        .order_by(Execution.finished_at.asc())
+    )
+    if household_id is not None:
+        clear = clear.where(RoutineStats.household_id == household_id)
+        history = history.where(ExecutionRequest.household_id == household_id)
+
+    db.execute(clear)
+    rollups: dict[tuple[str, str], RoutineStats] = {}
+    for execution, draft, hh_id in db.execute(history):
+        key = draft_routine_key(draft)
+        stats = rollups.get((hh_id, key))
+        if stats is None:
+            stats = rollups[(hh_id, key)] = RoutineStats(**_empty_row(hh_id, key))
+        record_completion(
+            stats,
+            finished_at=execution.finished_at,
+            final_cost_cents=execution.final_cost_cents,
+            items=item_quantities(draft.draft_payload_json or {}),
+        )
+
+    db.add_all(rollups.values())
+    db.flush()
+    return len(rollups)
+
+
+def draft_routine_key(draft: Draft) -> str:
+    """The rollup key for a draft; the live signal and the rebuild must agree on it."""
+
+    if draft.routine_key:
+        return draft.routine_key
+    payload = draft.draft_payload_json or {}
+    intent = payload.get("intent") if isinstance(payload, dict) else {}
+    if isinstance(intent, dict):
+        rk = str(intent.get("routine_key") or "").strip()
+        if rk:
+            return rk
+    return f"{draft.verb}:UNKNOWN"
+
+
+def item_quantities(payload: dict) -> dict[str, int]:
+    out: dict[str, int] = {}
+    raw_items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(raw_items, list):
+        return out
+
+    for raw in raw_items:
+        if not isinstance(raw, dict):
+            continue
+        name = str(raw.get("name") or "").strip().lower()
+        if not name:
+            continue
+        try:
+            qty = max(1, int(raw.get("quantity") or 1))
+        except Exception:
+            qty = 1
+        out[name] = qty
+
+    return out
+
+
+def _empty_row(household_id: str, routine_key: str) -> dict:
+    return {
+        "household_id": household_id,
+        "routine_key": routine_key,
+        "completed_count": 0,
+        "cost_sum_cents": 0,
+        "cost_count": 0,
+        "updated_at": datetime.utcnow(),
+    }
@@ -0,0 +1,156 @@
+"""Sliding-window vendor adapter health.
+
+Every terminal vendor call adds one attempt (and maybe one failure) to the current hourly
+bucket, both vendor-wide (household_id "") and for the household: two single-statement
+upserts. Reads sum at most one week of hourly buckets, so they are bounded regardless
+of history.
+
+Buckets older than RETENTION are deleted at most once per hour per process, by the first
+outcome recorded in a new bucket, so the confirm path does not pay for a DELETE on every
+execution. Reads ignore expired buckets anyway; pruning only bounds the table.
+
+Windows slide rather than snap to the hour: the oldest bucket a window only partly
+overlaps is weighted by the overlap (the usual sliding-window-counter estimate).
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from services.api.app.db.database import insert_or_increment
+from services.api.app.db.models import VendorHealthBucket
+from sqlalchemy import Select, delete, select
+from sqlalchemy.orm import Session
+
+ALL_HOUSEHOLDS = ""
+BUCKET = timedelta(hours=1)
+WINDOWS: tuple[tuple[str, timedelta], ...] = (
+    ("1h", timedelta(hours=1)),
+    ("24h", timedelta(hours=24)),
+    ("7d", timedelta(days=7)),
+)
+RETENTION = max(window for _, window in WINDOWS) + BUCKET
+
+_prune_lock = threading.Lock()
+_pruned_bucket: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WindowCounts:
+    attempts: int = 0
+    failures: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        return round(self.failures / self.attempts, 4) if self.attempts else 0.0
+
+
+def record_vendor_outcome(
+    db: Session, *, vendor: str, household_id: str, failed: bool, at: datetime | None = None
+) -> None:
+    bucket_start = _bucket_start(at or datetime.utcnow())
+    scopes = [ALL_HOUSEHOLDS] if household_id == ALL_HOUSEHOLDS else [ALL_HOUSEHOLDS, household_id]
+    for scope in scopes:
+        db.execute(
+            insert_or_increment(
+                db,
+                VendorHealthBucket,
+                {
+                    "vendor": vendor,
+                    "household_id": scope,
+                    "bucket_start": bucket_start,
+                    "attempts": 1,
+                    "failures": int(failed),
+                },
+                key=["vendor", "household_id", "bucket_start"],
+                increment=["attempts", "failures"],
+            )
+        )
+
+    if _prune_due(bucket_start):
+        prune_vendor_health(db, before=bucket_start - RETENTION)
+
+
+def prune_vendor_health(db: Session, *, before: datetime) -> int:
+    """Delete every bucket that started before `before`; returns the number deleted."""
+
+    result = db.execute(delete(VendorHealthBucket).where(VendorHealthBucket.bucket_start < before))
+    return result.rowcount or 0
+
+
+def _prune_due(bucket_start: datetime) -> bool:
+    global _pruned_bucket
+
+    with _prune_lock:
+        if bucket_start == _pruned_bucket:
+            return False
+        _pruned_bucket = bucket_start
+        return True
+
+
+def vendor_health_stmt(
+    *, household_id: str = ALL_HOUSEHOLDS, vendor: str | None = None, now: datetime | None = None
+) -> Select:
+    since = _bucket_start(now or datetime.utcnow()) - RETENTION + BUCKET
+    stmt = select(
+        VendorHealthBucket.vendor,
+        VendorHealthBucket.bucket_start,
+        VendorHealthBucket.attempts,
+        VendorHealthBucket.failures,
+    ).where(
+        VendorHealthBucket.household_id == household_id,
+        VendorHealthBucket.bucket_start >= since,
+    )
+    if vendor is not None:
+        stmt = stmt.where(VendorHealthBucket.vendor == vendor)
+    return stmt
+
+
+def summarize(
+    rows: list[tuple[str, datetime, int, int]], now: datetime | None = None
+) -> dict[str, dict[str, WindowCounts]]:
+    """Fold bucket rows from vendor_health_stmt() into {vendor: {window: counts}}."""
+
+    now = now or datetime.utcnow()
+    sums: dict[str, dict[str, list[float]]] = {}
+    for vendor, bucket_start, attempts, failures in rows:
+        per_window = sums.setdefault(vendor, {name: [0.0, 0.0] for name, _ in WINDOWS})
+        for name, window in WINDOWS:
+            weight = _overlap(bucket_start, now - window, now)
+            per_window[name][0] += attempts * weight
+            per_window[name][1] += failures * weight
+
+    return {
+        vendor: {
+            name: WindowCounts(attempts=round(a), failures=min(round(f), round(a)))
+            for name, (a, f) in per_window.items()
+        }
+        for vendor, per_window in sums.items()
+    }
+
+
+def vendor_health(
+    db: Session, *, household_id: str = ALL_HOUSEHOLDS, vendor: str | None = None
+) -> dict[str, dict[str, WindowCounts]]:
+    now = datetime.utcnow()
+    rows = db.execute(vendor_health_stmt(household_id=household_id, vendor=vendor, now=now)).all()
+    return summarize([tuple(r) for r in rows], now)
+
+
+def _bucket_start(at: datetime) -> datetime:
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def _overlap(bucket_start: datetime, window_start: datetime, window_end: datetime) -> float:
+    """Fraction of the bucket's events assumed to fall inside the window."""
+
+    # Compare naive UTC: SQLite hands back naive datetimes, Postgres aware ones.
+    bucket_start = bucket_start.replace(tzinfo=None)
+    # Events in the current bucket all happened before window_end, so it only spans that far.
+    bucket_end = min(bucket_start + BUCKET, window_end)
+    if bucket_end <= bucket_start:
+        return 0.0
+    inside = bucket_end - max(bucket_start, window_start)
+    return max(0.0, inside / (bucket_end - bucket_start))
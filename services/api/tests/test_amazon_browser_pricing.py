@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from services.api.app.models.order import OrderItemInput
+from services.api.app.services.amazon_base import (
+    AmazonAdapterError,
+    AmazonCheckoutTotalDriftError,
+)
+from services.api.app.services.amazon_browser import AmazonBrowserAdapter, _BrowserConfig
+from services.api.app.services.browser_pool import BrowserPool, BrowserPoolConfig
+from services.api.app.services.price_cache import PriceCache, PriceCacheConfig
+from services.api.app.services.product_resolution import (
+    ProductResolutionCache,
+    ProductResolutionConfig,
+)
+
+_LOAD_S = 0.1
+_BASE = "https://www.amazon.test"
+
+
+class _Site:
+    """Simulated Amazon: every page load takes _LOAD_S, however many tabs are loading."""
+
+    def __init__(self) -> None:
+        self.search = {"paper towels": "B00000TOWL", "detergent": "B00000DTRG"}
+        self.prices = {"B00000TOWL": "$5.00", "B00000DTRG": "$12.50", "B00000FOOD": "$30.00"}
+        self.visits: list[str] = []
+        self.loading = 0
+        self.peak_loading = 0
+        self._lock = threading.Lock()
+
+    def started(self, url: str) -> None:
+        with self._lock:
+            self.visits.append(url)
+            self.loading += 1
+            self.peak_loading = max(self.peak_loading, self.loading)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.loading -= 1
+
+
+class _Element:
+    def __init__(self, text: str = "", attrs: dict[str, str] | None = None) -> None:
+        self._text = text
+        self._attrs = attrs or {}
+
+    def inner_text(self) -> str:
+        return self._text
+
+    def get_attribute(self, name: str) -> str | None:
+        return self._attrs.get(name)
+
+    def query_selector(self, selector: str) -> _Element | None:
+        del selector
+        href = self._attrs.get("href")
+        return _Element(attrs={"href": href}) if href else None
+
+
+class _Tab:
+    def __init__(self, site: _Site) -> None:
+        self.site = site
+        self.url = ""
+        self._ready_at: float | None = None
+
+    def goto(self, url: str, wait_until: str) -> None:
+        self.url = url
+        self.site.started(url)
+        self._ready_at = time.perf_counter() + _LOAD_S
+        if wait_until != "commit":
+            self.wait_for_load_state(wait_until)
+
+    def wait_for_load_state(self, state: str) -> None:
+        del state
+        if self._ready_at is None:
+            return
+        time.sleep(max(0.0, self._ready_at - time.perf_counter()))
+        self._ready_at = None
+        self.site.finished()
+
+    def wait_for_selector(self, selector: str, timeout: int) -> None:
+        del selector, timeout
+
+    def query_selector_all(self, selector: str) -> list[_Element]:
+        del selector
+        query = parse_qs(urlparse(self.url).query).get("k", [""])[0]
+        asin = self.site.search.get(query)
+        if asin is None:
+            return []
+        return [_Element(attrs={"data-asin": asin, "href": f"/dp/{asin}"})]
+
+    def query_selector(self, selector: str) -> _Element | None:
+        price = self.site.prices.get(self.url.rsplit("/", 1)[-1])
+        if price is not None and "a-offscreen" in selector:
+            return _Element(price)
+        return None
+
+    def screenshot(self, path: str, full_page: bool) -> None:
+        del path, full_page
+
+    def content(self) -> str:
+        return ""
+
+    def title(self) -> str:
+        return "Amazon.test"
+
+
+class _Context:
+    def __init__(self, site: _Site) -> None:
+        self.site = site
+
+    def new_page(self) -> _Tab:
+        return _Tab(self.site)
+
+    def close(self) -> None:
+        pass
+
+
+class _Browser:
+    def __init__(self, site: _Site) -> None:
+        self.site = site
+
+    def is_connected(self) -> bool:
+        return True
+
+    def new_context(self, storage_state: str) -> _Context:
+        del storage_state
+        return _Context(self.site)
+
+
+@pytest.fixture()
+def site() -> _Site:
+    return _Site()
+
+
+def _adapter(
+    site: _Site,
+    tmp_path: Path,
+    resolutions: ProductResolutionCache | None = None,
+    prices: PriceCache | None = None,
+    **cfg: object,
+) -> AmazonBrowserAdapter:
+    sessions = tmp_path / "sessions"
+    sessions.mkdir(exist_ok=True)
+    for hh in ("hh-1", "hh-2"):
+        (sessions / f"{hh}.json").write_text("{}")
+    config = _BrowserConfig(
+        base_url=_BASE,
+        headless=True,
+        slow_mo_ms=0,
+        storage_state_dir=sessions,
+        artifacts_dir=tmp_path / "artifacts",
+        dry_run=True,
+        max_total_drift_ratio=0.05,
+        **cfg,
+    )
+    pool = BrowserPool(
+        BrowserPoolConfig(size=1), lambda: (_Browser(site), lambda: None), name="pricing-test"
+    )
+    return AmazonBrowserAdapter(config, pool, resolutions, prices)
+
+
+_ITEMS = [
+    OrderItemInput(name="paper towels", quantity=2),
+    OrderItemInput(name="B00000NOPE", quantity=1),
+    OrderItemInput(name="detergent", quantity=1),
+    OrderItemInput(name="B00000FOOD", quantity=3),
+]
+
+
+def _draft(adapter: AmazonBrowserAdapter, household_id: str = "hh-1"):
+    draft = adapter.build_draft(household_id, _ITEMS)
+    adapter.close()
+    return draft
+
+
+def _waves(site: _Site) -> list[str]:
+    return ["search" if "/s?" in url else "product" for url in site.visits]
+
+
+def test_items_are_priced_concurrently_in_input_order(site: _Site, tmp_path: Path) -> None:
+    draft = _draft(_adapter(site, tmp_path, pricing_concurrency=4))
+
+    assert [(i.name, i.unit_price_cents, i.line_total_cents) for i in draft.items] == [
+        ("paper towels", 500, 1000),
+        ("B00000NOPE", 0, 0),
+        ("detergent", 1250, 1250),
+        ("B00000FOOD", 3000, 9000),
+    ]
+    assert draft.items[0].product_url == f"{_BASE}/dp/B00000TOWL"
+    assert draft.estimated_total_cents == 11250
+    assert draft.warnings == [
+        "Could not determine a price for 'B00000NOPE'. Total may differ at checkout."
+    ]
+    # One search wave, then one product wave, with all four pages of a wave open at once.
+    assert _waves(site) == ["search"] * 2 + ["product"] * 4
+    assert site.peak_loading == 4
+
+
+def test_household_cap_limits_open_pages(site: _Site, tmp_path: Path) -> None:
+    adapter = _adapter(
+        site, tmp_path, pricing_concurrency=4, pricing_concurrency_by_household={"hh-2": 1}
+    )
+    draft = _draft(adapter, household_id="hh-2")
+
+    assert draft.estimated_total_cents == 11250
+    assert _waves(site) == ["search"] * 2 + ["product"] * 4
+    assert site.peak_loading == 1
+
+
+def test_failed_item_fails_the_draft_like_before(site: _Site, tmp_path: Path) -> None:
+    adapter = _adapter(site, tmp_path, pricing_concurrency=4)
+
+    with pytest.raises(AmazonAdapterError, match="No search results found for: 'mystery'"):
+        adapter.build_draft("hh-1", [*_ITEMS, OrderItemInput(name="mystery", quantity=1)])
+    adapter.close()
+
+
+def test_household_caps_parse_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HALO_AMAZON_PRICING_CONCURRENCY", "5")
+    monkeypatch.setenv("HALO_AMAZON_PRICING_CONCURRENCY_BY_HOUSEHOLD", "hh-1=1, hh-2=2")
+
+    cfg = AmazonBrowserAdapter.from_env()._cfg
+
+    assert [cfg.pricing_pages(hh) for hh in ("hh-1", "hh-2", "hh-3")] == [1, 2, 5]
+
+
+def test_resolution_cache_flag_accepts_the_usual_spellings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("HALO_AMAZON_RESOLUTION_CACHE", "0")
+    assert not ProductResolutionConfig.from_env().enabled
+
+    monkeypatch.setenv("HALO_AMAZON_RESOLUTION_CACHE", "yes")
+    assert ProductResolutionConfig.from_env().enabled
+
+
+@pytest.fixture()
+def resolution_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.db.init_db import init_db
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_resolve.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    init_db()
+
+
+@pytest.fixture()
+def resolutions(resolution_db: None) -> ProductResolutionCache:
+    return ProductResolutionCache(ProductResolutionConfig())
+
+
+def _searches(site: _Site) -> list[str]:
+    return [parse_qs(urlparse(url).query)["k"][0] for url in site.visits if "/s?" in url]
+
+
+def _resolution_lookups(result: str) -> float:
+    from services.api.app.metrics import registry
+
+    return registry.counter_value("product_resolution_total", labels={"result": result})
+
+
+def test_repeat_drafts_skip_the_search_page(
+    site: _Site, tmp_path: Path, resolutions: ProductResolutionCache
+) -> None:
+    adapter = _adapter(site, tmp_path, resolutions, pricing_concurrency=4)
+    hits, misses = _resolution_lookups("hit"), _resolution_lookups("miss")
+
+    first = adapter.build_draft("hh-1", _ITEMS)
+    assert _searches(site) == ["paper towels", "detergent"]
+    site.visits.clear()
+    second = adapter.build_draft("hh-1", _ITEMS)
+    adapter.build_draft("hh-2", _ITEMS[:1])
+    adapter.close()
+
+    assert [i.model_dump(exclude={"priced_at"}) for i in second.items] == [
+        i.model_dump(exclude={"priced_at"}) for i in first.items
+    ]
+    assert second.estimated_total_cents == 11250
+    assert _searches(site) == ["paper towels"]
+    assert _resolution_lookups("hit") - hits == 2
+    assert _resolution_lookups("miss") - misses == 3
+
+
+def test_pins_win_and_unpriced_resolutions_are_forgotten(
+    site: _Site, tmp_path: Path, resolutions: ProductResolutionCache
+) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.services.product_resolution import pin_product
+
+    with db_session() as db:
+        pin_product(db, "hh-1", "Paper  Towels", f"{_BASE}/dp/B00000FOOD")
+        db.commit()
+    resolutions.remember("hh-1", {"detergent": f"{_BASE}/dp/B00000GONE"}, source="draft")
+    adapter = _adapter(site, tmp_path, resolutions)
+
+    items = [OrderItemInput(name="paper towels", quantity=1), *_ITEMS[2:3]]
+    draft = adapter.build_draft("hh-1", items)
+    assert [i.unit_price_cents for i in draft.items] == [3000, 0]
+    assert _searches(site) == []
+
+    draft = adapter.build_draft("hh-1", items)
+    adapter.close()
+
+    assert [i.unit_price_cents for i in draft.items] == [3000, 1250]
+    assert _searches(site) == ["detergent"]
+    assert resolutions.lookup("hh-1", ["paper towels", "detergent"]) == {
+        "paper towels": f"{_BASE}/dp/B00000FOOD",
+        "detergent": f"{_BASE}/dp/B00000DTRG",
+    }
+
+
+def test_expired_resolutions_search_again(site: _Site, tmp_path: Path, resolution_db: None) -> None:
+    adapter = _adapter(site, tmp_path, ProductResolutionCache(ProductResolutionConfig(ttl_s=0)))
+
+    adapter.build_draft("hh-1", _ITEMS[:1])
+    adapter.build_draft("hh-1", _ITEMS[:1])
+    adapter.close()
+
+    assert _searches(site) == ["paper towels", "paper towels"]
+
+
+def _product_pages(site: _Site) -> list[str]:
+    return [url.rsplit("/", 1)[-1] for url in site.visits if "/dp/" in url]
+
+
+def test_recent_prices_skip_the_product_page(site: _Site, tmp_path: Path) -> None:
+    prices = PriceCache(PriceCacheConfig())
+    adapter = _adapter(site, tmp_path, prices=prices, pricing_concurrency=4)
+
+    first = adapter.build_draft("hh-1", _ITEMS)
+    site.visits.clear()
+    second = adapter.build_draft("hh-1", _ITEMS)
+    adapter.close()
+
+    assert second.estimated_total_cents == first.estimated_total_cents == 11250
+    # Searches still run without the resolution cache; only the unpriced item is re-read.
+    assert _searches(site) == ["paper towels", "detergent"]
+    assert _product_pages(site) == ["B00000NOPE"]
+    assert second.items[0].priced_at == first.items[0].priced_at
+    assert second.items[1].priced_at > first.items[1].priced_at
+    assert second.warnings == first.warnings
+
+
+def test_fully_cached_draft_needs_no_browser_and_reports_price_age(
+    site: _Site, tmp_path: Path
+) -> None:
+    prices = PriceCache(PriceCacheConfig())
+    checked_at = datetime.utcnow() - timedelta(hours=2, minutes=5)
+    prices.put("B00000FOOD", 2900, checked_at)
+    adapter = _adapter(site, tmp_path, prices=prices)
+
+    draft = adapter.build_draft("hh-1", [OrderItemInput(name="B00000FOOD", quantity=2)])
+    adapter.close()
+
+    assert site.visits == []
+    assert not (tmp_path / "artifacts").exists()
+    assert (draft.estimated_total_cents, draft.items[0].priced_at) == (5800, checked_at)
+    assert draft.warnings == [
+        "Prices for 1 item(s) were last checked 2 h 5 min ago. "
+        "The checkout total is verified before ordering."
+    ]
+
+
+def test_checkout_drift_invalidates_the_order_prices(
+    site: _Site, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prices = PriceCache(PriceCacheConfig())
+    adapter = _adapter(site, tmp_path, prices=prices, pricing_concurrency=4)
+    draft = adapter.build_draft("hh-1", _ITEMS)
+
+    def _drifting_checkout(browser, state_path, run_dir, items, expected, carted) -> None:
+        del browser, state_path, run_dir
+        carted.update({item.name: item.product_url for item in items[:3]})
+        raise AmazonCheckoutTotalDriftError(expected, expected * 2)
+
+    monkeypatch.setattr(adapter, "_execute_in", _drifting_checkout)
+    with pytest.raises(AmazonCheckoutTotalDriftError):
+        adapter.execute("hh-1", draft.items, draft.estimated_total_cents)
+
+    site.visits.clear()
+    adapter.build_draft("hh-1", _ITEMS)
+    adapter.close()
+
+    # Items that reached the cart are re-read; B00000FOOD never got there.
+    assert _product_pages(site) == ["B00000TOWL", "B00000NOPE", "B00000DTRG"]
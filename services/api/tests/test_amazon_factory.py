@@ -1,14 +1,31 @@
 import pytest
-from services.api.app.services.amazon_factory import get_amazon_adapter
+from services.api.app.components import reload_components
+from services.api.app.services.amazon_factory import build_amazon_adapter, get_amazon_adapter
 
 
 def test_get_amazon_adapter_defaults_to_mock(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("HALO_AMAZON_ADAPTER", raising=False)
-    adapter = get_amazon_adapter()
+    adapter = build_amazon_adapter()
     assert adapter.vendor == "AMAZON_MOCK"
 
 
 def test_get_amazon_adapter_rejects_unknown(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("HALO_AMAZON_ADAPTER", "nope")
+    with pytest.raises(ValueError, match="Unknown HALO_AMAZON_ADAPTER"):
+        build_amazon_adapter()
+
+
+def test_get_amazon_adapter_is_memoized_until_reload(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("HALO_AMAZON_ADAPTER", raising=False)
+    reload_components()
+
+    adapter = get_amazon_adapter()
+    assert get_amazon_adapter() is adapter
+
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "nope")
+    assert get_amazon_adapter() is adapter
+
+    reload_components()
     with pytest.raises(ValueError, match="Unknown HALO_AMAZON_ADAPTER"):
         get_amazon_adapter()
+    reload_components()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.models.order import OrderItemPriced
+from services.api.app.services.amazon_base import ExecuteResult
+from services.api.app.services.amazon_mock import AmazonMockAdapter
+
+
+@pytest.fixture()
+def async_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_async.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    monkeypatch.setenv("HALO_API_MODE", "async")
+
+
+def _command(client: TestClient, text: str) -> dict:
+    resp = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+    )
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_async_mode_serves_full_flow(async_env: None) -> None:
+    from services.api.app.main import create_app
+
+    app = create_app()
+    assert app.state.api_mode == "async"
+
+    with TestClient(app) as client:
+        parsed = client.post(
+            "/v1/command/parse",
+            json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "cancel netflix"},
+        )
+        assert parsed.json()["verb"] == "CANCEL_SUBSCRIPTION"
+
+        draft_id = _command(client, "reorder usual")["draft_id"]
+        rehydrated = client.get(f"/v1/drafts/{draft_id}").json()
+        assert rehydrated["draft_id"] == draft_id
+        assert rehydrated["household_id"] == "hh-1"
+
+        done = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+        execution_id = done.json()["execution_id"]
+
+        rows = client.get("/v1/executions", params={"household_id": "hh-1"}).json()
+        assert [r["execution_id"] for r in rows] == [execution_id]
+
+        detail = client.get(f"/v1/executions/{execution_id}").json()
+        assert detail["status"] == "DONE"
+        assert detail["confirmation_latency_ms"] is not None
+        assert client.get(f"/v1/receipts/{execution_id}").json()[0]["type"] == "ORDER_RECEIPT"
+
+        assert client.get("/v1/executions/missing").status_code == 404
+        assert client.get("/v1/drafts/missing").status_code == 404
+
+
+class _BlockingAdapter(AmazonMockAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def execute(
+        self,
+        household_id: str,
+        items: list[OrderItemPriced],
+        expected_total_cents: int,
+    ) -> ExecuteResult:
+        self.entered.set()
+        assert self.release.wait(timeout=10)
+        return super().execute(household_id, items, expected_total_cents)
+
+
+def test_reads_flow_while_slow_path_is_saturated(
+    async_env: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HALO_API_SLOW_PATH_CONCURRENCY", "1")
+
+    import services.api.app.routers.draft as draft_router
+    from services.api.app.main import create_app
+
+    adapter = _BlockingAdapter()
+    monkeypatch.setattr(draft_router, "get_amazon_adapter", lambda: adapter)
+
+    with TestClient(create_app()) as client:
+        draft_id = _command(client, "reorder usual")["draft_id"]
+
+        results: dict[str, int] = {}
+        confirm = threading.Thread(
+            target=lambda: results.setdefault(
+                "confirm",
+                client.post(
+                    "/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"}
+                ).status_code,
+            )
+        )
+        confirm.start()
+        try:
+            assert adapter.entered.wait(timeout=10)
+
+            # The only slow-path slot is taken; audit reads must still be served.
+            feed = client.get("/v1/executions", params={"household_id": "hh-1"})
+            assert feed.status_code == 200
+            assert feed.json()[0]["status"] == "IN_PROGRESS"
+            assert client.get(f"/v1/drafts/{draft_id}").status_code == 200
+        finally:
+            adapter.release.set()
+            confirm.join(timeout=10)
+
+        assert results["confirm"] == 200
+
+
+def test_unknown_api_mode_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HALO_API_MODE", "threads")
+
+    from services.api.app.main import create_app
+
+    with pytest.raises(ValueError, match="Unknown HALO_API_MODE"):
+        create_app()
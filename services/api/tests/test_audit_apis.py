@@ -48,3 +48,105 @@ def test_audit_endpoints_return_execution_and_receipt(client: TestClient) -> Non
     rs = receipts.json()
     assert rs
     assert rs[0]["type"] in {"ORDER_RECEIPT", "CANCEL_CONFIRMATION", "BOOKING_CONFIRMATION"}
+
+
+def _confirm(client: TestClient, text: str) -> str:
+    draft = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+    ).json()
+    done = client.post("/v1/draft/confirm", json={"draft_id": draft["draft_id"], "user_id": "u-1"})
+    assert done.status_code == 200
+    return done.json()["execution_id"]
+
+
+def test_list_executions_keyset_pagination_and_filters(client: TestClient) -> None:
+    created = [_confirm(client, t) for t in ["reorder usual", "cancel netflix"] * 3]
+
+    pages: list[list[dict]] = []
+    params: dict = {"household_id": "hh-1", "limit": 4}
+    while True:
+        resp = client.get("/v1/executions", params=params)
+        assert resp.status_code == 200
+        pages.append(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {**params, "cursor": cursor}
+
+    assert [len(p) for p in pages] == [4, 2]
+    seen = [r["execution_id"] for p in pages for r in p]
+    assert sorted(seen) == sorted(created)
+    started = [(r["started_at"], r["execution_id"]) for p in pages for r in p]
+    assert started == sorted(started, reverse=True)
+
+    cancels = client.get(
+        "/v1/executions", params={"household_id": "hh-1", "verb": "CANCEL_SUBSCRIPTION"}
+    ).json()
+    assert len(cancels) == 3
+    assert {r["verb"] for r in cancels} == {"CANCEL_SUBSCRIPTION"}
+
+    assert (
+        client.get("/v1/executions", params={"household_id": "hh-1", "status": "FAILED"}).json()
+        == []
+    )
+    assert (
+        len(
+            client.get(
+                "/v1/executions", params={"household_id": "hh-1", "vendor": "AMAZON_MOCK"}
+            ).json()
+        )
+        == 3
+    )
+    assert (
+        client.get(
+            "/v1/executions", params={"household_id": "hh-1", "started_to": "2000-01-01T00:00:00"}
+        ).json()
+        == []
+    )
+
+
+def test_list_executions_rejects_bad_cursor_and_limit(client: TestClient) -> None:
+    bad_cursor = client.get("/v1/executions", params={"household_id": "hh-1", "cursor": "nope"})
+    assert bad_cursor.status_code == 400
+    too_many = client.get("/v1/executions", params={"household_id": "hh-1", "limit": 10_000})
+    assert too_many.status_code == 422
+
+
+def test_execution_detail_batch_get_is_one_query(client: TestClient) -> None:
+    from services.api.app.db.database import get_engine
+    from sqlalchemy import event
+
+    ids = [_confirm(client, t) for t in ["reorder usual", "cancel netflix", "reorder usual"]]
+    singles = {i: client.get(f"/v1/executions/{i}").json() for i in ids}
+
+    selects: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        del conn, cursor, parameters, context, executemany
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        resp = client.post(
+            "/v1/executions:batchGet", json={"execution_ids": [*ids, "missing", ids[0]]}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["missing_ids"] == ["missing"]
+    assert [d["execution_id"] for d in body["executions"]] == ids
+    assert body["executions"] == [singles[i] for i in ids]
+    assert all(
+        d["receipts"] and d["confirmation_latency_ms"] is not None for d in body["executions"]
+    )
+    assert len(selects) == 1
+
+    too_many = client.post(
+        "/v1/executions:batchGet", json={"execution_ids": [f"e{i}" for i in range(51)]}
+    )
+    assert too_many.status_code == 422
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from services.api.app.services.browser_pool import BrowserPool, BrowserPoolConfig
+
+
+class _FakeBrowser:
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.connected = True
+        self.stopped = False
+        self.thread = threading.get_ident()
+        self.contexts: list[_FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def new_context(self, storage_state: str) -> _FakeContext:
+        context = _FakeContext(storage_state)
+        self.contexts.append(context)
+        return context
+
+
+class _FakeContext:
+    def __init__(self, storage_state: str) -> None:
+        self.storage_state = storage_state
+        self.closed = False
+
+    def new_page(self) -> _FakePage:
+        return _FakePage()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeElement:
+    def inner_text(self) -> str:
+        return "$12.34"
+
+
+class _FakePage:
+    url = "https://www.amazon.test/dp/B000000001"
+
+    def goto(self, url: str, wait_until: str) -> None:
+        del url, wait_until
+
+    def wait_for_load_state(self, state: str) -> None:
+        del state
+
+    def query_selector(self, selector: str) -> _FakeElement | None:
+        return _FakeElement() if "a-offscreen" in selector else None
+
+
+class _Launcher:
+    def __init__(self) -> None:
+        self.launched: list[_FakeBrowser] = []
+
+    def __call__(self):
+        browser = _FakeBrowser(len(self.launched))
+        self.launched.append(browser)
+
+        def _stop() -> None:
+            browser.stopped = True
+
+        return browser, _stop
+
+
+def _launches(reason: str) -> float:
+    from services.api.app.metrics import registry
+
+    return registry.counter_value(
+        "browser_pool_launches_total", labels={"pool": "test", "reason": reason}
+    )
+
+
+@pytest.fixture()
+def launcher() -> _Launcher:
+    return _Launcher()
+
+
+def test_leases_reuse_a_warm_browser_on_its_own_thread(launcher: _Launcher) -> None:
+    pool = BrowserPool(BrowserPoolConfig(size=1, max_uses=10), launcher, name="test")
+    pool.start()
+
+    seen = [pool.run(lambda b: (b, threading.get_ident())) for _ in range(3)]
+    pool.close()
+
+    assert len(launcher.launched) == 1
+    browser = launcher.launched[0]
+    assert {id(b) for b, _ in seen} == {id(browser)}
+    # Playwright's sync API is thread-bound: every lease runs on the launching thread.
+    assert {t for _, t in seen} == {browser.thread}
+    assert browser.stopped
+
+
+def test_recycles_after_max_uses_and_recovers_from_crashes(launcher: _Launcher) -> None:
+    pool = BrowserPool(BrowserPoolConfig(size=1, max_uses=2, warm=False), launcher, name="test")
+    cold, recycled, crashed = _launches("cold"), _launches("recycle"), _launches("crash")
+
+    assert [pool.run(lambda b: b.n) for _ in range(3)] == [0, 0, 1]
+    assert launcher.launched[0].stopped
+
+    def _crash(browser: _FakeBrowser) -> None:
+        browser.connected = False
+        raise RuntimeError("Target closed")
+
+    with pytest.raises(RuntimeError, match="Target closed"):
+        pool.run(_crash)
+    assert pool.run(lambda b: b.n) == 2
+    pool.close()
+
+    assert _launches("cold") - cold == 1
+    assert _launches("recycle") - recycled == 1
+    assert _launches("crash") - crashed == 1
+
+
+def test_lease_wait_and_occupancy_are_measured(launcher: _Launcher) -> None:
+    from services.api.app.metrics import registry
+
+    pool = BrowserPool(BrowserPoolConfig(size=1), launcher, name="test")
+    release = threading.Event()
+    holder = threading.Thread(target=lambda: pool.run(lambda b: release.wait(5)))
+    holder.start()
+    time.sleep(0.05)
+
+    gauges = registry.snapshot()["gauges"]
+    assert gauges["browser_pool_busy{pool=test}"] == 1
+
+    waiter = threading.Thread(target=lambda: pool.run(lambda b: None))
+    waiter.start()
+    time.sleep(0.05)
+    assert registry.snapshot()["gauges"]["browser_pool_waiting{pool=test}"] == 1
+    release.set()
+    holder.join()
+    waiter.join()
+    pool.close()
+
+    lease_wait = registry.snapshot()["histograms"]["browser_pool_lease_wait_ms{pool=test}"]
+    assert lease_wait["max"] >= 40
+
+
+def test_amazon_drafts_lease_pooled_browsers_with_fresh_contexts(
+    launcher: _Launcher, tmp_path: Path
+) -> None:
+    from services.api.app.models.order import OrderItemInput
+    from services.api.app.services.amazon_browser import AmazonBrowserAdapter, _BrowserConfig
+
+    sessions = tmp_path / "sessions"
+    sessions.mkdir()
+    for hh in ("hh-1", "hh-2"):
+        (sessions / f"{hh}.json").write_text("{}")
+    cfg = _BrowserConfig(
+        base_url="https://www.amazon.test",
+        headless=True,
+        slow_mo_ms=0,
+        storage_state_dir=sessions,
+        artifacts_dir=tmp_path / "artifacts",
+        dry_run=True,
+        max_total_drift_ratio=0.05,
+    )
+    adapter = AmazonBrowserAdapter(
+        cfg, BrowserPool(BrowserPoolConfig(size=1), launcher, name="test")
+    )
+
+    for hh in ("hh-1", "hh-2"):
+        draft = adapter.build_draft(hh, [OrderItemInput(name="B000000001", quantity=2)])
+        assert draft.estimated_total_cents == 2468
+    adapter.close()
+
+    (browser,) = launcher.launched
+    assert [c.storage_state for c in browser.contexts] == [
+        str(sessions / "hh-1.json"),
+        str(sessions / "hh-2.json"),
+    ]
+    assert all(c.closed for c in browser.contexts)
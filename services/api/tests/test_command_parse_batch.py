@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+
+class _InFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+
+    def __exit__(self, *exc: object) -> None:
+        with self._lock:
+            self.now -= 1
+
+
+@pytest.fixture(params=["sync", "async"])
+def mode(request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_batch.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    monkeypatch.setenv("HALO_API_MODE", request.param)
+    return request.param
+
+
+def _batch(client: TestClient, *texts: str):
+    return client.post(
+        "/v1/command/parse:batch",
+        json={
+            "commands": [
+                {"household_id": "hh-1", "user_id": "u-1", "raw_command_text": t} for t in texts
+            ]
+        },
+    )
+
+
+def test_fake_extractor_results_come_back_in_input_order(mode: str) -> None:
+    from services.api.app.main import create_app
+
+    with TestClient(create_app()) as client:
+        resp = _batch(client, "cancel netflix", "reorder the usual", "fix kitchen sink")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [r["index"] for r in body["results"]] == [0, 1, 2]
+    assert [r["intent"]["verb"] for r in body["results"]] == [
+        "CANCEL_SUBSCRIPTION",
+        "REORDER",
+        "UNSUPPORTED",
+    ]
+    assert all(r["error"] is None and r["elapsed_ms"] >= 0 for r in body["results"])
+    assert body["elapsed_ms"] >= 0
+
+
+def test_item_errors_are_reported_in_place(mode: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.components import components
+    from services.api.app.llm.fake import FakeIntentExtractor
+    from services.api.app.main import create_app
+
+    class _Exploding(FakeIntentExtractor):
+        def extract(self, **kwargs):
+            if "explode" in kwargs["raw_command_text"]:
+                raise RuntimeError("extractor blew up")
+            return super().extract(**kwargs)
+
+    with TestClient(create_app()) as client:
+        monkeypatch.setattr(components(), "get", lambda name, build: _Exploding())
+        resp = _batch(client, "cancel netflix", "explode please", "reorder the usual")
+
+    results = resp.json()["results"]
+    assert [r["intent"] is None for r in results] == [False, True, False]
+    assert results[1]["error"] == "RuntimeError: extractor blew up"
+
+
+def test_openai_batches_run_concurrently_under_the_limit(
+    mode: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import services.api.app.llm.openai_extractor as openai_extractor
+    from services.api.app.main import create_app
+
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "false")
+    monkeypatch.setenv("HALO_PARSE_BATCH_CONCURRENCY", "3")
+    in_flight = _InFlight()
+
+    def _answer(user_json: dict) -> str:
+        return json.dumps(
+            {
+                "verb": "CANCEL_SUBSCRIPTION",
+                "object": user_json["command"],
+                "params": {"subscription_name": user_json["command"]},
+                "confidence": 0.9,
+                "routine_key": f"CANCEL_SUBSCRIPTION:{user_json['command']}",
+                "clarifications": [],
+            }
+        )
+
+    def _chat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt
+        with in_flight:
+            time.sleep(0.05)
+        return _answer(user_json)
+
+    async def _achat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt
+        with in_flight:
+            await anyio.sleep(0.05)
+        return _answer(user_json)
+
+    monkeypatch.setattr(openai_extractor, "_openai_chat_json", _chat)
+    monkeypatch.setattr(openai_extractor, "_aopenai_chat_json", _achat)
+
+    names = [f"sub-{i}" for i in range(9)]
+    with TestClient(create_app()) as client:
+        resp = _batch(client, *names)
+
+    assert [r["intent"]["object"] for r in resp.json()["results"]] == names
+    assert in_flight.peak == 3
+
+
+def test_oversized_batches_are_rejected(mode: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.main import create_app
+
+    monkeypatch.setenv("HALO_PARSE_BATCH_MAX_ITEMS", "2")
+
+    with TestClient(create_app()) as client:
+        assert _batch(client, "a", "b", "c").status_code == 422
+        assert _batch(client).status_code == 422
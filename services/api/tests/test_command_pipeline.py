@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.models.order import OrderItemInput
+from services.api.app.services.amazon_base import AmazonAdapterError, DraftResult
+from services.api.app.services.amazon_mock import AmazonMockAdapter
+from sqlalchemy import event
+
+
+class _FailingAmazonAdapter(AmazonMockAdapter):
+    def build_draft(self, household_id: str, items: list[OrderItemInput]) -> DraftResult:
+        raise AmazonAdapterError("cart page changed")
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_pipeline.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+
+    from services.api.app.db.household_bootstrap import clear_bootstrap_cache
+    from services.api.app.main import app
+
+    clear_bootstrap_cache()
+    with TestClient(app) as c:
+        yield c
+
+
+class _Budget:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def clear(self) -> None:
+        self.statements.clear()
+        self.commits = 0
+
+
+@pytest.fixture()
+def budget(client: TestClient) -> _Budget:
+    from services.api.app.db.database import get_engine
+
+    b = _Budget()
+    engine = get_engine()
+
+    def _statement(conn, cursor, statement, parameters, context, executemany) -> None:
+        del conn, cursor, parameters, context, executemany
+        b.statements.append(statement)
+
+    def _commit(conn) -> None:
+        del conn
+        b.commits += 1
+
+    event.listen(engine, "before_cursor_execute", _statement)
+    event.listen(engine, "commit", _commit)
+    yield b
+    event.remove(engine, "before_cursor_execute", _statement)
+    event.remove(engine, "commit", _commit)
+
+
+def _command(client: TestClient, text: str, household_id: str = "hh-1") -> dict:
+    r = client.post(
+        "/v1/command",
+        json={"household_id": household_id, "user_id": "u-1", "raw_command_text": text},
+    )
+    return {"status": r.status_code, **r.json()}
+
+
+# (command, card type, statements for a new household, statements once seeded and cached)
+_BUDGETS = [
+    ("reorder usual", "DRAFT", 8, 4),
+    ("cancel netflix", "DRAFT", 8, 4),
+    ("book cleaner", "DRAFT", 8, 4),
+    ("teleport me to mars", "UNSUPPORTED", 5, 2),
+]
+
+
+@pytest.mark.parametrize(("text", "card_type", "cold", "warm"), _BUDGETS)
+def test_command_commits_once_within_statement_budget(
+    client: TestClient, budget: _Budget, text: str, card_type: str, cold: int, warm: int
+) -> None:
+    card = _command(client, text)
+    assert (card["status"], card["type"]) == (200, card_type)
+    assert budget.commits == 1
+    assert len(budget.statements) == cold
+
+    budget.clear()
+    card = _command(client, text)
+    assert (card["status"], card["type"]) == (200, card_type)
+    assert budget.commits == 1
+    assert len(budget.statements) == warm
+
+
+def test_seeded_defaults_are_written_with_the_draft(client: TestClient) -> None:
+    reorder = _command(client, "reorder usual")
+    assert [i["name"] for i in reorder["body"]["items"]] == ["paper towels", "detergent"]
+
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import BookingVendor, Subscription, UsualItem
+
+    _command(client, "cancel netflix")
+    _command(client, "book cleaner")
+    _command(client, "book cleaner")
+
+    with db_session() as db:
+        assert db.query(UsualItem).filter_by(household_id="hh-1").count() == 2
+        assert db.query(Subscription).filter_by(household_id="hh-1").count() == 2
+        assert db.query(BookingVendor).filter_by(household_id="hh-1").count() == 1
+
+
+def test_failed_draft_still_records_the_command(
+    client: TestClient, budget: _Budget, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import services.api.app.routers.command as command_router
+
+    monkeypatch.setattr(command_router, "get_amazon_adapter", lambda: _FailingAmazonAdapter())
+
+    assert _command(client, "reorder usual")["status"] == 502
+    assert budget.commits == 1
+
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import Draft, EventLog, ExecutionRequest
+
+    with db_session() as db:
+        assert db.query(ExecutionRequest).count() == 1
+        assert db.query(Draft).count() == 0
+        assert {e.event_type for e in db.query(EventLog).all()} == {
+            "COMMAND_RECEIVED",
+            "INTENT_EXTRACTED",
+        }
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.services.booking_mock import MockBookingAdapter
+
+
+class _WarmBookingAdapter(MockBookingAdapter):
+    def __init__(self, hooks: list[str]) -> None:
+        self._hooks = hooks
+
+    def start(self) -> None:
+        self._hooks.append("start")
+
+    def close(self) -> None:
+        self._hooks.append("close")
+
+
+@pytest.fixture()
+def env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_components.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    return monkeypatch
+
+
+def test_components_are_built_once_and_closed_on_shutdown(env: pytest.MonkeyPatch) -> None:
+    import services.api.app.services.booking_factory as booking_factory
+
+    hooks: list[str] = []
+    builds: list[_WarmBookingAdapter] = []
+
+    def _build() -> _WarmBookingAdapter:
+        builds.append(_WarmBookingAdapter(hooks))
+        return builds[-1]
+
+    env.setattr(booking_factory, "build_booking_adapter", _build)
+
+    from services.api.app.main import app
+
+    with TestClient(app) as client:
+        # Warmed at startup, before any request.
+        assert hooks == ["start"]
+        for _ in range(2):
+            r = client.post(
+                "/v1/command",
+                json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "book cleaner"},
+            )
+            assert r.status_code == 200
+
+    assert len(builds) == 1
+    assert hooks == ["start", "close"]
+
+
+def test_misconfigured_component_does_not_block_startup(env: pytest.MonkeyPatch) -> None:
+    env.setenv("HALO_LLM_PROVIDER", "nope")
+
+    from services.api.app.main import app
+
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 200
+        r = client.post(
+            "/v1/command",
+            json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "reorder usual"},
+        )
+        assert r.status_code == 500
+        assert "Unknown HALO_LLM_PROVIDER" in r.json()["detail"]
+
+
+def test_close_errors_do_not_stop_other_components() -> None:
+    from services.api.app.components import ComponentRegistry
+
+    closed: list[str] = []
+
+    class _Broken:
+        def close(self) -> None:
+            raise RuntimeError("boom")
+
+    class _Fine:
+        def close(self) -> None:
+            closed.append("fine")
+
+    reg = ComponentRegistry()
+    reg.get("broken", _Broken)
+    reg.get("fine", _Fine)
+    reg.close()
+
+    assert closed == ["fine"]
+
+
+def test_slow_build_does_not_block_other_components() -> None:
+    from services.api.app.components import ComponentRegistry
+
+    reg = ComponentRegistry()
+    building = threading.Event()
+    release = threading.Event()
+    builds: list[str] = []
+
+    def _slow() -> str:
+        builds.append("slow")
+        building.set()
+        assert release.wait(5)
+        return "slow"
+
+    waiters = [threading.Thread(target=reg.get, args=("slow", _slow)) for _ in range(2)]
+    waiters[0].start()
+    assert building.wait(5)
+    waiters[1].start()
+
+    # Another component builds while "slow" is still building.
+    assert reg.get("fast", lambda: "fast") == "fast"
+
+    release.set()
+    for waiter in waiters:
+        waiter.join(5)
+    assert builds == ["slow"]
+    assert reg.get("slow", _slow) == "slow"
+
+
+def test_instance_built_across_a_reload_is_not_kept() -> None:
+    from services.api.app.components import ComponentRegistry
+
+    reg = ComponentRegistry()
+    closed: list[int] = []
+    builds: list[int] = []
+
+    class _Component:
+        def __init__(self) -> None:
+            builds.append(len(builds))
+            self.n = builds[-1]
+            if self.n == 0:
+                reg.close()  # a reload lands mid-build
+
+        def close(self) -> None:
+            closed.append(self.n)
+
+    assert reg.get("c", _Component).n == 1
+    assert closed == [0]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.models.order import OrderItemInput, OrderItemPriced
+from services.api.app.services.amazon_base import DraftResult, ExecuteResult
+from services.api.app.services.amazon_mock import AmazonMockAdapter
+from services.api.app.services.booking_base import BookingDraftResult, BookingExecuteResult
+from services.api.app.services.booking_mock import MockBookingAdapter
+
+
+def _checked_out() -> int:
+    from services.api.app.db.database import get_engine
+
+    return get_engine().pool.checkedout()
+
+
+class _ProbingAmazonAdapter(AmazonMockAdapter):
+    """Mock adapter that records pool checkout while the "vendor call" runs."""
+
+    def __init__(self, seen: list[int]) -> None:
+        super().__init__()
+        self._seen = seen
+
+    def build_draft(self, household_id: str, items: list[OrderItemInput]) -> DraftResult:
+        self._seen.append(_checked_out())
+        return super().build_draft(household_id, items)
+
+    def execute(
+        self,
+        household_id: str,
+        items: list[OrderItemPriced],
+        expected_total_cents: int,
+    ) -> ExecuteResult:
+        self._seen.append(_checked_out())
+        return super().execute(household_id, items, expected_total_cents)
+
+
+class _ProbingBookingAdapter(MockBookingAdapter):
+    def __init__(self, seen: list[int]) -> None:
+        self._seen = seen
+
+    def build_draft(self, household_id: str, **kwargs: object) -> BookingDraftResult:
+        self._seen.append(_checked_out())
+        return super().build_draft(household_id, **kwargs)
+
+    def execute(self, household_id: str, *, draft_payload: dict) -> BookingExecuteResult:
+        self._seen.append(_checked_out())
+        return super().execute(household_id, draft_payload=draft_payload)
+
+
+@pytest.fixture()
+def probes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[TestClient, list[int]]:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_release.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+
+    import services.api.app.routers.command as command_router
+    import services.api.app.routers.draft as draft_router
+
+    seen: list[int] = []
+    amazon = _ProbingAmazonAdapter(seen)
+    booking = _ProbingBookingAdapter(seen)
+    for module in (command_router, draft_router):
+        monkeypatch.setattr(module, "get_amazon_adapter", lambda: amazon)
+        monkeypatch.setattr(module, "get_booking_adapter", lambda: booking)
+
+    from services.api.app.main import app
+
+    with TestClient(app) as c:
+        yield c, seen
+
+
+@pytest.mark.parametrize("command", ["reorder usual", "book cleaner"])
+def test_no_connection_checked_out_during_vendor_calls(
+    probes: tuple[TestClient, list[int]], command: str
+) -> None:
+    client, seen = probes
+
+    draft = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": command},
+    )
+    assert draft.status_code == 200
+    draft_id = draft.json()["draft_id"]
+
+    if command.startswith("reorder"):
+        modified = client.post(
+            "/v1/draft/modify",
+            json={
+                "draft_id": draft_id,
+                "modifications": {"items": [{"name": "detergent", "quantity": 2}]},
+            },
+        )
+        assert modified.status_code == 200
+        assert modified.json()["estimated_cost_cents"] == 2 * 1599
+
+    done = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+    assert done.status_code == 200
+    assert done.json()["type"] == "DONE"
+
+    assert len(seen) >= 2
+    assert seen == [0] * len(seen)
+    assert _checked_out() == 0
+
+
+def test_result_is_recorded_after_vendor_call(probes: tuple[TestClient, list[int]]) -> None:
+    client, _seen = probes
+
+    draft_id = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "reorder usual"},
+    ).json()["draft_id"]
+    execution_id = client.post(
+        "/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"}
+    ).json()["execution_id"]
+
+    detail = client.get(f"/v1/executions/{execution_id}").json()
+    assert detail["status"] == "DONE"
+    assert detail["receipts"][0]["type"] == "ORDER_RECEIPT"
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect, text
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _alembic_config() -> Config:
+    cfg = Config()
+    cfg.set_main_option("script_location", str(REPO_ROOT / "db" / "migrations"))
+    return cfg
+
+
+def _schema(url: str) -> dict[str, set]:
+    engine = create_engine(url)
+    try:
+        inspector = inspect(engine)
+        out: dict[str, set] = {}
+        for table in inspector.get_table_names():
+            if table == "alembic_version":
+                continue
+            out[table] = {
+                (ix["name"], tuple(ix["column_names"])) for ix in inspector.get_indexes(table)
+            }
+            out[table] |= {("col", c["name"]) for c in inspector.get_columns(table)}
+        return out
+    finally:
+        engine.dispose()
+
+
+def test_migrations_match_model_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    migrated_url = f"sqlite+pysqlite:///{tmp_path / 'migrated.db'}"
+    created_url = f"sqlite+pysqlite:///{tmp_path / 'created.db'}"
+
+    monkeypatch.setenv("DATABASE_URL", migrated_url)
+    command.upgrade(_alembic_config(), "head")
+
+    from services.api.app.db.models import Base
+
+    engine = create_engine(created_url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    assert _schema(migrated_url) == _schema(created_url)
+
+
+def test_migrations_downgrade_to_base(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    url = f"sqlite+pysqlite:///{tmp_path / 'roundtrip.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+
+    cfg = _alembic_config()
+    command.upgrade(cfg, "head")
+    command.downgrade(cfg, "base")
+
+    assert set(_schema(url)) == set()
+
+
+def test_routine_key_backfill(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    url = f"sqlite+pysqlite:///{tmp_path / 'backfill.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+
+    cfg = _alembic_config()
+    command.upgrade(cfg, "0002")
+
+    intent = {"verb": "REORDER", "routine_key": "REORDER:USUAL", "confidence": 0.9}
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO households (id, name) VALUES ('hh-1', 'H')"))
+        conn.execute(
+            text("INSERT INTO users (id, household_id, display_name) VALUES ('u-1', 'hh-1', 'U')")
+        )
+        conn.execute(
+            text(
+                "INSERT INTO execution_requests "
+                "(id, household_id, user_id, channel, raw_command_text, normalized_intent_json) "
+                "VALUES ('er-1', 'hh-1', 'u-1', 'chat', 'reorder usual', :intent)"
+            ),
+            {"intent": json.dumps(intent)},
+        )
+        conn.execute(
+            text(
+                "INSERT INTO drafts (id, execution_request_id, verb, vendor, draft_payload_json) "
+                "VALUES ('d-1', 'er-1', 'REORDER', 'amazon', :payload)"
+            ),
+            {"payload": json.dumps({"intent": intent})},
+        )
+    engine.dispose()
+
+    command.upgrade(cfg, "head")
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        req = conn.execute(
+            text("SELECT verb, routine_key FROM execution_requests WHERE id = 'er-1'")
+        ).one()
+        draft_key = conn.execute(text("SELECT routine_key FROM drafts WHERE id = 'd-1'")).scalar()
+    engine.dispose()
+
+    assert tuple(req) == ("REORDER", "REORDER:USUAL")
+    assert draft_key == "REORDER:USUAL"
+
+
+def test_modify_count_backfill(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    url = f"sqlite+pysqlite:///{tmp_path / 'modify_count.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+
+    cfg = _alembic_config()
+    command.upgrade(cfg, "0008")
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO households (id, name) VALUES ('hh-1', 'H')"))
+        conn.execute(
+            text("INSERT INTO users (id, household_id, display_name) VALUES ('u-1', 'hh-1', 'U')")
+        )
+        conn.execute(
+            text(
+                "INSERT INTO execution_requests "
+                "(id, household_id, user_id, channel, raw_command_text, normalized_intent_json) "
+                "VALUES ('er-1', 'hh-1', 'u-1', 'chat', 'book cleaner', '{}')"
+            )
+        )
+        for draft_id in ("d-1", "d-2"):
+            conn.execute(
+                text(
+                    "INSERT INTO drafts (id, execution_request_id, verb, vendor, "
+                    "draft_payload_json) VALUES (:id, 'er-1', 'BOOK_APPOINTMENT', 'mock', '{}')"
+                ),
+                {"id": draft_id},
+            )
+        for n, event_type in enumerate(("DRAFT_MODIFIED", "DRAFT_MODIFIED", "DRAFT_CREATED")):
+            conn.execute(
+                text(
+                    "INSERT INTO event_log (id, household_id, entity_type, entity_id, "
+                    "event_type, event_payload_json) "
+                    "VALUES (:id, 'hh-1', 'Draft', 'd-1', :event_type, '{}')"
+                ),
+                {"id": f"ev-{n}", "event_type": event_type},
+            )
+    engine.dispose()
+
+    command.upgrade(cfg, "head")
+
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        counts = dict(conn.execute(text("SELECT id, modify_count FROM drafts")).all())
+    engine.dispose()
+
+    assert counts == {"d-1": 2, "d-2": 0}
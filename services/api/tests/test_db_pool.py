@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+
+@pytest.fixture()
+def pooled_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_pool.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_DB_POOL_SIZE", "3")
+    monkeypatch.setenv("HALO_DB_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("HALO_DB_POOL_TIMEOUT_S", "7")
+    monkeypatch.setenv("HALO_DB_POOL_RECYCLE_S", "120")
+    monkeypatch.setenv("HALO_DB_POOL_PRE_PING", "true")
+
+
+def test_get_engine_applies_pool_config(pooled_env: None) -> None:
+    from services.api.app.db.database import get_engine
+
+    pool = get_engine().pool
+    assert pool.size() == 3
+    assert pool._max_overflow == 2
+    assert pool._timeout == 7
+    assert pool._recycle == 120
+    assert pool._pre_ping is True
+
+
+def test_statement_timeout_is_passed_to_postgres(monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.db.database import PoolConfig, _connect_args
+
+    monkeypatch.setenv("HALO_DB_STATEMENT_TIMEOUT_MS", "5000")
+    cfg = PoolConfig.from_env()
+
+    assert _connect_args("postgresql+psycopg://u@h/db", cfg) == {
+        "options": "-c statement_timeout=5000"
+    }
+    assert _connect_args("postgresql+asyncpg://u@h/db", cfg) == {
+        "server_settings": {"statement_timeout": "5000"}
+    }
+    assert "options" not in _connect_args("sqlite+pysqlite:///x.db", cfg)
+
+
+def test_pool_gauges_and_checkout_wait_are_exported(pooled_env: None) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.main import app
+
+    with TestClient(app) as client:
+        with db_session() as db:
+            db.execute(text("SELECT 1"))
+            in_use = client.get("/metrics").json()["gauges"]["db_pool_in_use"]
+            assert in_use >= 1
+
+        snapshot = client.get("/metrics").json()
+
+    assert snapshot["gauges"]["db_pool_size"] == 3
+    assert snapshot["gauges"]["db_pool_in_use"] == 0
+    assert snapshot["gauges"]["db_pool_overflow"] == 0
+    assert snapshot["histograms"]["db_pool_checkout_wait_ms"]["count"] >= 1
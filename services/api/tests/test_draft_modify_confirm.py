@@ -130,3 +130,132 @@ def test_autopilot_signal_repeats_count_increments(client: TestClient) -> None:
 
     assert len(events) >= 2
     assert events[-1].event_payload_json["repeats_count"] >= 2
+
+
+def test_routine_stats_rollup_matches_rebuild(client: TestClient) -> None:
+    for _ in range(3):
+        draft_card = client.post(
+            "/v1/command",
+            json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "reorder usual"},
+        ).json()
+        done = client.post(
+            "/v1/draft/confirm", json={"draft_id": draft_card["draft_id"], "user_id": "u-1"}
+        )
+        assert done.status_code == 200
+
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import EventLog, RoutineStats
+    from services.api.app.services.routine_stats import mean_interval_ms, rebuild_routine_stats
+
+    def _rows() -> list[tuple]:
+        with db_session() as db:
+            return [
+                (
+                    s.household_id,
+                    s.routine_key,
+                    s.completed_count,
+                    s.first_completed_at,
+                    s.last_completed_at,
+                    s.cost_sum_cents,
+                    s.cost_count,
+                    s.last_items_json,
+                    mean_interval_ms(s),
+                )
+                for s in db.query(RoutineStats).order_by(RoutineStats.routine_key).all()
+            ]
+
+    incremental = _rows()
+    assert len(incremental) == 1
+    assert incremental[0][2] == 3
+
+    with db_session() as db:
+        last_signal = (
+            db.query(EventLog)
+            .filter(EventLog.event_type == "AUTOPILOT_SIGNAL_COMPUTED")
+            .order_by(EventLog.created_at.desc())
+            .first()
+        )
+        assert last_signal is not None
+        payload = last_signal.event_payload_json
+        assert payload["repeats_count"] == 3
+        assert payload["variance"]["item_changes_count"] == 0
+        assert payload["variance"]["cost_deviation_cents"] == 0
+
+        assert rebuild_routine_stats(db) == 1
+        db.commit()
+
+    assert _rows() == incremental
+
+
+def test_rebuild_keeps_drafts_without_a_routine_key(client: TestClient) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import Draft, RoutineStats
+    from services.api.app.services.routine_stats import rebuild_routine_stats
+
+    for text in ("reorder usual", "reorder usual", "cancel netflix"):
+        draft_id = client.post(
+            "/v1/command",
+            json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+        ).json()["draft_id"]
+        if text == "cancel netflix":
+            with db_session() as db:
+                draft = db.get(Draft, draft_id)
+                draft.routine_key = None
+                payload = dict(draft.draft_payload_json)
+                payload["intent"] = {**payload["intent"], "routine_key": ""}
+                draft.draft_payload_json = payload
+                db.commit()
+        done = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+        assert done.status_code == 200
+
+    def _rows() -> list[tuple]:
+        with db_session() as db:
+            return [
+                (s.household_id, s.routine_key, s.completed_count, s.last_items_json)
+                for s in db.query(RoutineStats).order_by(RoutineStats.routine_key).all()
+            ]
+
+    incremental = _rows()
+    assert [row[1:3] for row in incremental] == [
+        ("CANCEL_SUBSCRIPTION:UNKNOWN", 1),
+        ("REORDER:USUAL", 2),
+    ]
+
+    with db_session() as db:
+        assert rebuild_routine_stats(db) == 2
+        db.commit()
+
+    assert _rows() == incremental
+
+
+def test_autopilot_signal_failure_does_not_fail_confirm(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import services.api.app.routers.draft as draft_router
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import EventLog, Execution, RoutineStats
+    from services.api.app.services.routine_stats import lock_routine_stats
+
+    def _broken_lock(db, household_id: str, routine_key: str):
+        # Write something first: the savepoint must discard it along with the error.
+        lock_routine_stats(db, household_id, routine_key)
+        db.flush()
+        raise RuntimeError("could not obtain lock on row in relation routine_stats")
+
+    monkeypatch.setattr(draft_router, "lock_routine_stats", _broken_lock)
+    draft_id = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": "reorder usual"},
+    ).json()["draft_id"]
+
+    done = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+
+    assert done.status_code == 200
+    assert done.json()["type"] == "DONE"
+    execution_id = done.json()["execution_id"]
+    with db_session() as db:
+        assert db.get(Execution, execution_id).status == "DONE"
+        assert db.query(RoutineStats).count() == 0
+        # Events logged before the failed savepoint are still written.
+        events = db.query(EventLog.event_type).filter(EventLog.entity_id == execution_id).all()
+        assert {e for (e,) in events} == {"EXECUTION_STARTED", "EXECUTION_DONE"}
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.models.order import OrderItemInput
+from services.api.app.services.amazon_base import DraftResult
+from services.api.app.services.amazon_mock import AmazonMockAdapter
+
+_DELAY_S = 0.3
+
+
+class _SlowAdapter(AmazonMockAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.priced: list[list[tuple[str, int]]] = []
+        self.calls: list[str] = []
+        self.pricing = threading.Event()
+        self._lock = threading.Lock()
+
+    def build_draft(self, household_id: str, items: list[OrderItemInput]) -> DraftResult:
+        with self._lock:
+            self.priced.append([(i.name, i.quantity) for i in items])
+            self.calls.append("price")
+        self.pricing.set()
+        time.sleep(_DELAY_S)
+        return super().build_draft(household_id, items)
+
+
+@pytest.fixture()
+def adapter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _SlowAdapter:
+    import services.api.app.routers.command as command_router
+
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_spec.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "false")
+
+    slow = _SlowAdapter()
+    monkeypatch.setattr(command_router, "get_amazon_adapter", lambda: slow)
+    return slow
+
+
+@pytest.fixture()
+def llm_answers(adapter: _SlowAdapter, monkeypatch: pytest.MonkeyPatch) -> dict[str, dict]:
+    import services.api.app.llm.openai_extractor as openai_extractor
+
+    answers: dict[str, dict] = {}
+
+    def _chat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt
+        # Answer once pricing is under way (or clearly is not going to be) so the order of
+        # `adapter.calls` shows whether the two overlapped, without timing assertions.
+        adapter.pricing.wait(_DELAY_S * 10)
+        adapter.calls.append("extract")
+        return json.dumps(answers[user_json["command"]])
+
+    monkeypatch.setattr(openai_extractor, "_openai_chat_json", _chat)
+    return answers
+
+
+def _reorder(items: list[dict] | None) -> dict:
+    return {
+        "verb": "REORDER",
+        "object": "items" if items else "usual",
+        "params": {"items": items} if items else {"usual": True},
+        "confidence": 0.9,
+        "routine_key": "REORDER:USUAL",
+        "clarifications": [],
+    }
+
+
+def _outcome(outcome: str) -> float:
+    from services.api.app.metrics import registry
+
+    return registry.counter_value("draft_speculation_total", labels={"outcome": outcome})
+
+
+def _command(client: TestClient, text: str) -> dict:
+    r = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+    )
+    assert r.status_code == 200
+    return r.json()
+
+
+def test_matching_intent_uses_the_speculative_draft(
+    adapter: _SlowAdapter, llm_answers: dict[str, dict]
+) -> None:
+    from services.api.app.main import app
+
+    llm_answers["order 2 paper towels"] = _reorder([{"name": "Paper Towels", "quantity": 2}])
+    hits = _outcome("hit")
+
+    with TestClient(app) as client:
+        card = _command(client, "order 2 paper towels")
+
+    assert card["type"] == "DRAFT"
+    assert adapter.priced == [[("paper towels", 2)]]
+    assert _outcome("hit") - hits == 1
+    # Pricing started before extraction answered, i.e. the two overlapped.
+    assert adapter.calls == ["price", "extract"]
+    # The card names items as the final intent does, not as the rule pass guessed.
+    assert [i["name"] for i in card["body"]["items"]] == ["Paper Towels"]
+
+
+def test_diverging_intent_discards_the_speculative_draft(
+    adapter: _SlowAdapter, llm_answers: dict[str, dict]
+) -> None:
+    from services.api.app.main import app
+
+    llm_answers["order 2 paper towels"] = _reorder([{"name": "paper towels", "quantity": 4}])
+    llm_answers["order detergent"] = {
+        "verb": "CANCEL_SUBSCRIPTION",
+        "object": "netflix",
+        "params": {"subscription_name": "Netflix"},
+        "confidence": 0.9,
+        "routine_key": "CANCEL_SUBSCRIPTION:netflix",
+        "clarifications": [],
+    }
+    wasted = _outcome("wasted")
+
+    with TestClient(app) as client:
+        card = _command(client, "order 2 paper towels")
+        assert card["body"]["items"][0]["quantity"] == 4
+        assert _command(client, "order detergent")["title"] == "Draft: CANCEL SUBSCRIPTION"
+
+    assert adapter.priced[:2] == [[("paper towels", 2)], [("paper towels", 4)]]
+    assert _outcome("wasted") - wasted == 2
+
+
+def test_rules_only_extractor_does_not_speculate(
+    adapter: _SlowAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from services.api.app.main import app
+
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    before = _outcome("hit") + _outcome("wasted")
+
+    with TestClient(app) as client:
+        assert _command(client, "reorder the usual")["type"] == "DRAFT"
+
+    assert len(adapter.priced) == 1
+    assert _outcome("hit") + _outcome("wasted") == before
+
+
+def test_speculation_flag_accepts_the_usual_spellings(monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.services.draft_speculation import SpeculationConfig
+
+    monkeypatch.setenv("HALO_DRAFT_SPECULATION", "off")
+    assert not SpeculationConfig.from_env().enabled
+
+    monkeypatch.setenv("HALO_DRAFT_SPECULATION", "1")
+    assert SpeculationConfig.from_env().enabled
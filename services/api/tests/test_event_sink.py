@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_events.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    monkeypatch.setenv("HALO_EVENT_SPOOL_DIR", str(tmp_path / "spool"))
+
+    from services.api.app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def _event_types(entity_id: str | None = None) -> list[str]:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import EventLog
+
+    with db_session() as db:
+        q = db.query(EventLog)
+        if entity_id is not None:
+            q = q.filter(EventLog.entity_id == entity_id)
+        return [e.event_type for e in q.order_by(EventLog.created_at.asc()).all()]
+
+
+def _capture_event_inserts() -> list[str]:
+    from services.api.app.db.database import get_engine
+
+    statements: list[str] = []
+
+    @event.listens_for(get_engine(), "before_cursor_execute")
+    def _capture(*args: object) -> None:
+        statement = str(args[2])
+        if statement.lstrip().upper().startswith("INSERT INTO EVENT_LOG"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_events_are_written_in_one_insert_per_commit(client: TestClient) -> None:
+    r = client.post(
+        "/v1/command",
+        json={"household_id": "hh-ev", "user_id": "u-1", "raw_command_text": "reorder usual"},
+    )
+    assert r.status_code == 200
+    draft_id = r.json()["draft_id"]
+
+    inserts = _capture_event_inserts()
+    r = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+    assert r.status_code == 200
+    execution_id = r.json()["execution_id"]
+
+    # Two units of work around the vendor call, one INSERT each.
+    assert len(inserts) == 2
+    assert _event_types(execution_id) == [
+        "EXECUTION_STARTED",
+        "EXECUTION_DONE",
+        "AUTOPILOT_SIGNAL_COMPUTED",
+    ]
+
+
+def test_rolled_back_unit_of_work_drops_its_events(client: TestClient) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.event_sink import log_event
+
+    with db_session() as db:
+        log_event(
+            db,
+            household_id="hh-x",
+            user_id=None,
+            entity_type="Test",
+            entity_id="rolled-back",
+            event_type="NEVER_WRITTEN",
+            event_payload={},
+        )
+        db.rollback()
+        db.commit()
+
+    assert _event_types("rolled-back") == []
+
+
+def test_async_mode_spools_then_writes(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from services.api.app.db.event_sink import get_spool_writer
+
+    monkeypatch.setenv("HALO_EVENT_SINK_MODE", "async")
+    r = client.post(
+        "/v1/command",
+        json={"household_id": "hh-ev", "user_id": "u-1", "raw_command_text": "reorder usual"},
+    )
+    assert r.status_code == 200
+    draft_id = r.json()["draft_id"]
+
+    assert get_spool_writer().drain()
+    assert "DRAFT_CREATED" in _event_types(draft_id)
+    assert list((tmp_path / "spool").glob("*.jsonl")) == []
+
+
+def test_async_mode_replays_spool_without_duplicates(
+    client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from services.api.app.db.event_sink import get_spool_writer, stop_event_sink
+
+    stop_event_sink()
+    spool = tmp_path / "spool"
+    spool.mkdir(exist_ok=True)
+    row = {
+        "id": "evt-replayed",
+        "household_id": "hh-ev",
+        "user_id": None,
+        "entity_type": "Test",
+        "entity_id": "replayed",
+        "event_type": "REPLAYED",
+        "event_payload_json": {"n": 1},
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    # Same batch spooled twice: a crash after the INSERT but before the file was removed.
+    for name in ("0001-a.jsonl", "0002-b.jsonl"):
+        (spool / name).write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+    monkeypatch.setenv("HALO_EVENT_SINK_MODE", "async")
+    assert get_spool_writer().drain()
+
+    assert _event_types("replayed") == ["REPLAYED"]
+    assert list(spool.glob("*.jsonl")) == []
+
+
+def test_rolled_back_savepoint_drops_only_its_own_events(client: TestClient) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.event_sink import log_event
+
+    def _log(db, entity_id: str) -> None:
+        log_event(
+            db,
+            household_id="hh-x",
+            user_id=None,
+            entity_type="Test",
+            entity_id=entity_id,
+            event_type="SAVEPOINT_TEST",
+            event_payload={},
+        )
+
+    inserts = _capture_event_inserts()
+    with db_session() as db:
+        _log(db, "before-savepoint")
+        with db.begin_nested():
+            _log(db, "released-savepoint")
+        _log(db, "between-savepoints")
+        try:
+            with db.begin_nested():
+                _log(db, "rolled-back-savepoint")
+                raise RuntimeError("telemetry failed")
+        except RuntimeError:
+            pass
+        db.commit()
+
+    assert len(inserts) == 1
+    assert _event_types("before-savepoint") == ["SAVEPOINT_TEST"]
+    assert _event_types("released-savepoint") == ["SAVEPOINT_TEST"]
+    assert _event_types("between-savepoints") == ["SAVEPOINT_TEST"]
+    assert _event_types("rolled-back-savepoint") == []
+
+
+def test_unwritable_spool_batch_is_dead_lettered(client: TestClient, tmp_path: Path) -> None:
+    from services.api.app.db.event_sink import SpoolWriter
+    from services.api.app.metrics import registry
+
+    spool = tmp_path / "dead-letter-spool"
+    spool.mkdir()
+    row = {
+        "id": "evt-after-poison",
+        "household_id": "hh-ev",
+        "user_id": None,
+        "entity_type": "Test",
+        "entity_id": "after-poison",
+        "event_type": "WRITTEN",
+        "event_payload_json": {},
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    (spool / "0001-poison.jsonl").write_text("{not json\n", encoding="utf-8")
+    (spool / "0002-good.jsonl").write_text(json.dumps(row) + "\n", encoding="utf-8")
+    dead_lettered = registry.counter_value("event_sink_dead_letter_total")
+
+    writer = SpoolWriter(spool, retry_delay_s=0.0, max_attempts=3)
+    writer.start()
+    assert writer.drain()
+    writer.stop()
+
+    assert _event_types("after-poison") == ["WRITTEN"]
+    assert list(spool.glob("*.jsonl")) == []
+    assert [p.name for p in (spool / "dead_letter").iterdir()] == ["0001-poison.jsonl"]
+    assert registry.counter_value("event_sink_dead_letter_total") - dead_lettered == 1
+
+
+def test_async_mode_counts_modifications_still_in_the_spool(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from services.api.app.db.database import db_session
+    from services.api.app.db.event_sink import SpoolWriter, get_spool_writer
+    from services.api.app.db.models import EventLog
+
+    monkeypatch.setenv("HALO_EVENT_SINK_MODE", "async")
+    released = threading.Event()
+    write_spooled = SpoolWriter._write_spooled
+
+    def _held(self: SpoolWriter, path: Path) -> None:
+        assert released.wait(10)
+        write_spooled(self, path)
+
+    monkeypatch.setattr(SpoolWriter, "_write_spooled", _held)
+
+    draft_id = client.post(
+        "/v1/command",
+        json={"household_id": "hh-ev", "user_id": "u-1", "raw_command_text": "book cleaner"},
+    ).json()["draft_id"]
+    for idx in (1, 2):
+        r = client.post(
+            "/v1/draft/modify",
+            json={"draft_id": draft_id, "modifications": {"selected_time_window_index": idx}},
+        )
+        assert r.status_code == 200
+    done = client.post("/v1/draft/confirm", json={"draft_id": draft_id, "user_id": "u-1"})
+    assert done.json()["type"] == "DONE"
+
+    # No DRAFT_MODIFIED row had reached event_log when confirm computed the signal.
+    assert _event_types(draft_id) == []
+    released.set()
+    assert get_spool_writer().drain()
+
+    with db_session() as db:
+        signal = db.query(EventLog).filter(EventLog.event_type == "AUTOPILOT_SIGNAL_COMPUTED").one()
+    assert signal.event_payload_json["trust"]["modify_count_before_confirm"] == 2
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+_BOOTSTRAP_TABLES = re.compile(r"\b(households|users|preferences)\b")
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_bootstrap.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+
+    from services.api.app.db.household_bootstrap import clear_bootstrap_cache
+    from services.api.app.main import app
+
+    clear_bootstrap_cache()
+    with TestClient(app) as c:
+        yield c
+
+
+def _capture_bootstrap_sql() -> list[str]:
+    from services.api.app.db.database import get_engine
+
+    statements: list[str] = []
+
+    @event.listens_for(get_engine(), "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        del conn, cursor, parameters, context, executemany
+        if _BOOTSTRAP_TABLES.search(statement):
+            statements.append(statement)
+
+    return statements
+
+
+def _command(client: TestClient, household_id: str = "hh-1") -> None:
+    r = client.post(
+        "/v1/command",
+        json={"household_id": household_id, "user_id": "u-1", "raw_command_text": "cancel hulu"},
+    )
+    assert r.status_code == 200
+
+
+def test_known_household_skips_existence_checks(client: TestClient) -> None:
+    statements = _capture_bootstrap_sql()
+
+    _command(client)
+    assert len(statements) == 3
+    assert all("ON CONFLICT DO NOTHING" in s for s in statements)
+
+    statements.clear()
+    _command(client)
+    assert statements == []
+
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import Household, Preference, User
+
+    with db_session() as db:
+        assert db.get(Household, "hh-1") is not None
+        assert db.get(User, "u-1") is not None
+        assert db.get(Preference, "hh-1").default_merchant == "amazon"
+
+
+def test_rolled_back_bootstrap_is_not_cached(client: TestClient) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.household_bootstrap import ensure_household_user
+
+    statements = _capture_bootstrap_sql()
+    with db_session() as db:
+        ensure_household_user(db, "hh-rb", "u-rb")
+        db.rollback()
+    assert len(statements) == 3
+
+    statements.clear()
+    with db_session() as db:
+        ensure_household_user(db, "hh-rb", "u-rb")
+        db.commit()
+    assert len(statements) == 3
+
+    statements.clear()
+    with db_session() as db:
+        ensure_household_user(db, "hh-rb", "u-rb")
+    assert statements == []
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+_USUAL = {
+    "verb": "REORDER",
+    "object": "usual",
+    "params": {"usual": True},
+    "confidence": 0.9,
+    "routine_key": "REORDER:USUAL",
+    "clarifications": [],
+}
+
+
+@pytest.fixture()
+def llm_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    import services.api.app.llm.openai_extractor as openai_extractor
+
+    calls: list[dict] = []
+
+    def _fake_chat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, system_prompt
+        calls.append({"model": model, **user_json})
+        if user_json["command"] == "explode":
+            raise RuntimeError("OpenAI HTTP 500")
+        return json.dumps(_USUAL)
+
+    monkeypatch.setattr(openai_extractor, "_openai_chat_json", _fake_chat)
+    return calls
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, llm_calls: list[dict]) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_intent.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    from services.api.app.llm.intent_cache import clear_intent_cache
+    from services.api.app.main import app
+
+    clear_intent_cache()
+    with TestClient(app) as c:
+        yield c
+    clear_intent_cache()
+
+
+def _command(client: TestClient, text: str) -> dict:
+    r = client.post(
+        "/v1/command",
+        json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+    )
+    assert r.status_code == 200
+    return r.json()
+
+
+def _intent_cache_events() -> list[dict | None]:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import EventLog
+
+    with db_session() as db:
+        rows = (
+            db.query(EventLog)
+            .filter(EventLog.event_type == "INTENT_EXTRACTED")
+            .order_by(EventLog.created_at.asc())
+            .all()
+        )
+        return [r.event_payload_json.get("intent_cache") for r in rows]
+
+
+def test_repeat_commands_hit_memory_then_shared_tier(
+    client: TestClient, llm_calls: list[dict]
+) -> None:
+    from services.api.app.llm.intent_cache import clear_intent_cache
+
+    assert _command(client, "Reorder the usual")["type"] == "DRAFT"
+    assert _command(client, "  reorder   the usual ")["type"] == "DRAFT"
+
+    # A fresh process (or another replica) still finds the entry in the table.
+    clear_intent_cache()
+    assert _command(client, "reorder the usual")["type"] == "DRAFT"
+
+    assert len(llm_calls) == 1
+    miss, memory_hit, db_hit = _intent_cache_events()
+    assert miss["hit"] is False and miss["tier"] is None
+    assert memory_hit["hit"] is True and memory_hit["tier"] == "memory"
+    assert db_hit["hit"] is True and db_hit["tier"] == "db"
+    assert memory_hit["llm_ms"] == db_hit["llm_ms"] == miss["llm_ms"]
+
+
+def test_failed_extraction_is_not_cached(client: TestClient, llm_calls: list[dict]) -> None:
+    # The breaker's rule fallback answers instead; neither answer may be cached.
+    assert _command(client, "explode")["type"] == "UNSUPPORTED"
+    assert _command(client, "explode")["type"] == "UNSUPPORTED"
+
+    assert len(llm_calls) == 2
+    assert _intent_cache_events() == [None, None]
+
+
+def test_key_covers_answers_model_and_prompt() -> None:
+    from services.api.app.llm.intent_cache import intent_cache_key
+
+    base = {
+        "raw_command_text": "Book a table",
+        "clarification_answers": {"q0": "2", "q1": "friday"},
+        "model": "gpt-4o-mini",
+        "system_prompt": "prompt v1",
+    }
+    key = intent_cache_key(**base)
+
+    assert intent_cache_key(**{**base, "raw_command_text": " book  a TABLE "}) == key
+    assert intent_cache_key(**{**base, "clarification_answers": {"q1": "friday", "q0": "2"}}) == key
+    assert intent_cache_key(**{**base, "clarification_answers": {"q0": "4"}}) != key
+    assert intent_cache_key(**{**base, "model": "gpt-4o"}) != key
+    assert intent_cache_key(**{**base, "system_prompt": "prompt v2"}) != key
+
+
+def test_config_accepts_the_usual_boolean_spellings(monkeypatch: pytest.MonkeyPatch) -> None:
+    from services.api.app.llm.intent_cache import IntentCacheConfig
+
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "1")
+    monkeypatch.setenv("HALO_INTENT_CACHE_DB", "off")
+    cfg = IntentCacheConfig.from_env()
+
+    assert cfg.enabled is True
+    assert cfg.db_tier is False
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+
+import anyio
+import pytest
+
+_BOOKING = {
+    "verb": "BOOK_APPOINTMENT",
+    "object": "restaurant",
+    "params": {"service_type": "restaurant", "party_size": 4, "date": "2026-10-23"},
+    "confidence": 0.92,
+    "routine_key": "BOOK_APPOINTMENT:restaurant",
+    "clarifications": [],
+}
+
+
+@pytest.fixture()
+def llm_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    import services.api.app.llm.openai_extractor as openai_extractor
+
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "cascade")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "false")
+
+    calls: list[str] = []
+
+    def _answer(user_json: dict) -> str:
+        calls.append(user_json["command"])
+        if "explode" in user_json["command"]:
+            raise RuntimeError("OpenAI HTTP 503")
+        return json.dumps(_BOOKING)
+
+    def _chat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt
+        return _answer(user_json)
+
+    async def _achat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt
+        return _answer(user_json)
+
+    monkeypatch.setattr(openai_extractor, "_openai_chat_json", _chat)
+    monkeypatch.setattr(openai_extractor, "_aopenai_chat_json", _achat)
+    return calls
+
+
+def _extract(text: str):
+    from services.api.app.llm.factory import build_intent_extractor
+
+    return build_intent_extractor().extract(
+        raw_command_text=text, household_id="hh-1", user_id="u-1"
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "verb"),
+    [
+        ("order 2 paper towels", "REORDER"),
+        ("reorder the usual", "REORDER"),
+        ("cancel netflix", "CANCEL_SUBSCRIPTION"),
+    ],
+)
+def test_confident_rules_skip_the_llm(llm_calls: list[str], text: str, verb: str) -> None:
+    assert _extract(text).verb.value == verb
+    assert llm_calls == []
+
+
+def test_low_confidence_or_clarifying_rules_escalate(llm_calls: list[str]) -> None:
+    from services.api.app.metrics import registry
+
+    before = registry.counter_value("intent_cascade_total", labels={"tier": "llm"})
+
+    # Rules score bookings at 0.75, below the default 0.8 threshold.
+    assert _extract("book dinner for 4 on friday").params["party_size"] == 4
+    # Rules would ask "What should I order?".
+    assert _extract("order something").verb.value == "BOOK_APPOINTMENT"
+
+    assert llm_calls == ["book dinner for 4 on friday", "order something"]
+    assert registry.counter_value("intent_cascade_total", labels={"tier": "llm"}) - before == 2
+    latency = registry.snapshot()["histograms"]
+    assert any(k.startswith("intent_cascade_ms") and "llm" in k for k in latency)
+
+
+def test_threshold_is_configurable(llm_calls: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HALO_LLM_CASCADE_THRESHOLD", "0.7")
+
+    assert _extract("book a cleaner").verb.value == "BOOK_APPOINTMENT"
+    assert llm_calls == []
+
+
+def test_failed_llm_keeps_the_more_confident_rule_intent(llm_calls: list[str]) -> None:
+    intent = _extract("book a cleaner, explode")
+    assert llm_calls == ["book a cleaner, explode"]
+    assert intent.verb.value == "BOOK_APPOINTMENT"
+    assert intent.params["service_type"] == "cleaning"
+
+
+def test_async_cascade_uses_the_async_llm_path(llm_calls: list[str]) -> None:
+    from services.api.app.llm.factory import build_intent_extractor
+
+    extractor = build_intent_extractor()
+
+    async def _run() -> tuple[str, str]:
+        ruled = await extractor.aextract(
+            raw_command_text="cancel netflix", household_id="hh-1", user_id="u-1"
+        )
+        escalated = await extractor.aextract(
+            raw_command_text="book dinner for 4", household_id="hh-1", user_id="u-1"
+        )
+        return ruled.verb.value, escalated.object
+
+    assert anyio.run(_run) == ("CANCEL_SUBSCRIPTION", "restaurant")
+    assert llm_calls == ["book dinner for 4"]
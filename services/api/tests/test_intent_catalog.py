@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from services.api.app.llm.catalog import ItemCatalog, MatchedItem
+
+
+def test_matches_synonyms_plurals_and_quantities_in_catalog_order() -> None:
+    catalog = ItemCatalog(
+        [
+            {"name": "paper towels", "synonyms": ["kitchen roll"]},
+            {"name": "detergent", "synonyms": []},
+        ]
+    )
+
+    # Catalog order, as before the trie; the first mention of an item sets its quantity.
+    assert catalog.match("order detergents and 2 kitchen rolls, plus 3 paper towels") == [
+        MatchedItem(name="paper towels", quantity=2),
+        MatchedItem(name="detergent", quantity=1),
+    ]
+    # Plurals fold to the singular on both sides.
+    assert catalog.match("order a paper towel") == [MatchedItem(name="paper towels", quantity=1)]
+    assert catalog.match("order some towels") == []
+
+
+def test_longest_phrase_wins() -> None:
+    catalog = ItemCatalog([{"name": "milk"}, {"name": "oat milk", "synonyms": ["oatly"]}])
+
+    assert catalog.match("buy 2 oat milk and milk") == [
+        MatchedItem(name="milk", quantity=1),
+        MatchedItem(name="oat milk", quantity=2),
+    ]
+
+
+def test_household_catalogs_load_from_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "catalog.json"
+    path.write_text(
+        json.dumps(
+            {
+                "default": [{"name": "paper towels"}],
+                "households": {"hh-1": [{"name": "oat milk", "synonyms": ["oatly"]}]},
+            }
+        )
+    )
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+    monkeypatch.setenv("HALO_ITEM_CATALOG_PATH", str(path))
+
+    from services.api.app.llm.factory import build_intent_extractor
+
+    extractor = build_intent_extractor()
+
+    def _extract(household_id: str):
+        return extractor.extract(
+            raw_command_text="order 2 oatly and paper towels",
+            household_id=household_id,
+            user_id="u-1",
+        )
+
+    assert _extract("hh-1").params["items"] == [
+        {"name": "paper towels", "quantity": 1},
+        {"name": "oat milk", "quantity": 2},
+    ]
+    assert _extract("hh-2").params["items"] == [{"name": "paper towels", "quantity": 1}]
+
+
+class _CountingNode(dict):
+    """Trie node that counts child lookups, the unit of work in `ItemCatalog.match`."""
+
+    lookups = 0
+
+    def get(self, key, default=None):
+        _CountingNode.lookups += 1
+        return super().get(key, default)
+
+
+def _counting(node: dict) -> _CountingNode:
+    return _CountingNode(
+        {key: child if key is None else _counting(child) for key, child in node.items()}
+    )
+
+
+def test_match_work_does_not_grow_with_the_catalog() -> None:
+    # Wall-clock numbers live in scripts/bench_intent_catalog.py; this pins the algorithm.
+    from scripts.bench_intent_catalog import _COMMANDS, synthetic_entries
+
+    def _lookups(size: int) -> int:
+        catalog = ItemCatalog(synthetic_entries(size))
+        catalog._root = _counting(catalog._root)
+        _CountingNode.lookups = 0
+        for text in _COMMANDS:
+            catalog.match(text)
+        return _CountingNode.lookups
+
+    small = _lookups(10)
+    assert small > 0
+    assert _lookups(20_000) == small
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import time
+
+import anyio
+import pytest
+
+_INTENT = {
+    "verb": "REORDER",
+    "object": "usual",
+    "params": {"usual": True},
+    "confidence": 0.9,
+    "routine_key": "REORDER:USUAL",
+    "clarifications": [],
+}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def llm(monkeypatch: pytest.MonkeyPatch) -> dict:
+    import services.api.app.llm.openai_extractor as openai_extractor
+
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "false")
+    monkeypatch.setenv("HALO_LLM_BREAKER_FAILURES", "2")
+
+    script = {"calls": 0, "fail": False, "sleep_s": 0.0}
+
+    def _chat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt, user_json
+        script["calls"] += 1
+        if script["fail"]:
+            raise RuntimeError("OpenAI HTTP 503")
+        return json.dumps(_INTENT)
+
+    async def _achat(*, api_key: str, model: str, system_prompt: str, user_json: dict) -> str:
+        del api_key, model, system_prompt, user_json
+        script["calls"] += 1
+        await anyio.sleep(script["sleep_s"])
+        return json.dumps(_INTENT)
+
+    monkeypatch.setattr(openai_extractor, "_openai_chat_json", _chat)
+    monkeypatch.setattr(openai_extractor, "_aopenai_chat_json", _achat)
+    return script
+
+
+def _extractor():
+    from services.api.app.llm.factory import build_intent_extractor
+
+    return build_intent_extractor()
+
+
+def _extract(extractor, text: str = "order 2 paper towels"):
+    return extractor.extract(raw_command_text=text, household_id="hh-1", user_id="u-1")
+
+
+def test_breaker_opens_then_probes_once_when_half_open() -> None:
+    from services.api.app.llm.breaker import BreakerConfig, CircuitBreaker
+    from services.api.app.metrics import registry
+
+    clock = _Clock()
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=2, reset_s=30), clock=clock)
+    trips = registry.counter_value("llm_breaker_trips_total")
+
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    assert registry.snapshot()["gauges"]["llm_breaker_state"] == 2
+
+    clock.now = 31
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+    assert registry.counter_value("llm_breaker_trips_total") - trips == 2
+
+
+def test_failures_fall_back_to_rules_and_open_the_breaker(llm: dict) -> None:
+    from services.api.app.metrics import registry
+
+    extractor = _extractor()
+    assert _extract(extractor).params == {"usual": True}
+
+    llm["fail"] = True
+    before = registry.counter_value("intent_degraded_total", labels={"reason": "breaker_open"})
+    failed = [_extract(extractor) for _ in range(2)]
+    assert [i.params["degraded"] for i in failed] == ["llm_error", "llm_error"]
+    assert failed[0].params["items"] == [{"name": "paper towels", "quantity": 2}]
+
+    skipped = _extract(extractor)
+    assert skipped.params["degraded"] == "breaker_open"
+    assert skipped.verb.value == "REORDER"
+    assert llm["calls"] == 3
+    after = registry.counter_value("intent_degraded_total", labels={"reason": "breaker_open"})
+    assert after - before == 1
+
+
+def test_async_budget_cancels_a_slow_llm(llm: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HALO_LLM_BUDGET_S", "0.05")
+    llm["sleep_s"] = 5.0
+    extractor = _extractor()
+
+    async def _run():
+        return await extractor.aextract(
+            raw_command_text="cancel netflix", household_id="hh-1", user_id="u-1"
+        )
+
+    started = time.perf_counter()
+    intent = anyio.run(_run)
+
+    assert time.perf_counter() - started < 1.0
+    assert intent.params == {"subscription_name": "Netflix", "degraded": "budget_exceeded"}
+    assert intent.verb.value == "CANCEL_SUBSCRIPTION"
+
+
+def test_cancelled_probe_lets_the_next_call_probe() -> None:
+    from services.api.app.llm.breaker import (
+        BreakerConfig,
+        CircuitBreaker,
+        GuardedIntentExtractor,
+    )
+    from services.api.app.llm.fake import FakeIntentExtractor
+
+    class _HangingLLM:
+        async def aextract(self, **kwargs: object):
+            await anyio.sleep(5.0)
+
+        def extract(self, **kwargs: object):
+            raise KeyboardInterrupt
+
+    clock = _Clock()
+    cfg = BreakerConfig(budget_s=10, failure_threshold=1, reset_s=30)
+    breaker = CircuitBreaker(cfg, clock=clock)
+    breaker.record_failure()
+    clock.now = 31
+    extractor = GuardedIntentExtractor(
+        llm=_HangingLLM(), fallback=FakeIntentExtractor(), cfg=cfg, breaker=breaker
+    )
+
+    async def _cancelled_probe():
+        with anyio.move_on_after(0.05) as scope:
+            await extractor.aextract(
+                raw_command_text="cancel netflix", household_id="hh-1", user_id="u-1"
+            )
+        assert scope.cancelled_caught
+
+    anyio.run(_cancelled_probe)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    breaker.release_probe()
+
+    with pytest.raises(KeyboardInterrupt):
+        _extract(extractor)
+    assert breaker.state == "half_open"
+    assert breaker.allow()
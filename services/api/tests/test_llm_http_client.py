@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import anyio
+import pytest
+
+_INTENT = {
+    "verb": "REORDER",
+    "object": "usual",
+    "params": {"usual": True},
+    "confidence": 0.9,
+    "routine_key": "REORDER:USUAL",
+    "clarifications": [],
+}
+
+
+class _StandIn(ThreadingHTTPServer):
+    """Chat-completions stand-in that records which client connection served each request."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.peers: list[tuple[str, int]] = []
+        self.scripted: list[tuple[int, dict[str, str]]] = []
+        self.delay_s = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/chat/completions"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StandIn
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.peers.append(self.client_address)
+        time.sleep(self.server.delay_s)
+
+        status, headers = self.server.scripted.pop(0) if self.server.scripted else (200, {})
+        if status == 200:
+            body = {"choices": [{"message": {"content": json.dumps(_INTENT)}}]}
+        else:
+            body = {"error": {"message": "scripted failure"}}
+        raw = json.dumps(body).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, format: str, *args: object) -> None:
+        del format, args
+
+
+@pytest.fixture()
+def stand_in(monkeypatch: pytest.MonkeyPatch) -> Iterator[_StandIn]:
+    import services.api.app.llm.openai_extractor as openai_extractor
+    from services.api.app.llm.http_client import close_llm_clients
+
+    monkeypatch.setenv("HALO_LLM_BACKOFF_BASE_S", "0")
+    monkeypatch.setenv("HALO_LLM_MAX_RETRIES", "2")
+    anyio.run(close_llm_clients)
+
+    server = _StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(openai_extractor, "_CHAT_COMPLETIONS_URL", server.url)
+    yield server
+    anyio.run(close_llm_clients)
+    server.shutdown()
+    server.server_close()
+
+
+def _extractor():
+    from services.api.app.llm.openai_extractor import OpenAIIntentExtractor
+
+    return OpenAIIntentExtractor(api_key="sk-test", model="gpt-4o-mini")
+
+
+def _kwargs(text: str = "reorder the usual") -> dict:
+    return {"raw_command_text": text, "household_id": "hh-1", "user_id": "u-1"}
+
+
+def test_sync_calls_reuse_one_connection(stand_in: _StandIn) -> None:
+    extractor = _extractor()
+    for _ in range(3):
+        assert extractor.extract(**_kwargs()).verb.value == "REORDER"
+
+    assert len(stand_in.peers) == 3
+    assert len(set(stand_in.peers)) == 1
+
+
+def test_async_calls_reuse_one_connection(stand_in: _StandIn) -> None:
+    extractor = _extractor()
+
+    async def _run() -> list[str]:
+        return [(await extractor.aextract(**_kwargs())).verb.value for _ in range(3)]
+
+    assert anyio.run(_run) == ["REORDER"] * 3
+    assert len(stand_in.peers) == 3
+    assert len(set(stand_in.peers)) == 1
+
+
+def test_retries_429_and_5xx_then_succeeds(stand_in: _StandIn) -> None:
+    from services.api.app.metrics import registry
+
+    before = registry.counter_value("llm_http_retries_total")
+    stand_in.scripted = [(503, {}), (429, {"Retry-After": "0"})]
+
+    assert _extractor().extract(**_kwargs()).verb.value == "REORDER"
+    assert len(stand_in.peers) == 3
+    assert registry.counter_value("llm_http_retries_total") - before == 2
+
+
+def test_gives_up_after_max_retries_and_fails_closed(stand_in: _StandIn) -> None:
+    stand_in.scripted = [(500, {}), (502, {}), (503, {})]
+
+    intent = _extractor().extract(**_kwargs())
+    assert intent.verb.value == "UNSUPPORTED"
+    assert "OpenAI HTTP 503" in intent.params["error"]
+    assert len(stand_in.peers) == 3
+
+
+def test_client_errors_are_not_retried(stand_in: _StandIn) -> None:
+    stand_in.scripted = [(400, {})]
+
+    intent = _extractor().extract(**_kwargs())
+    assert intent.verb.value == "UNSUPPORTED"
+    assert "OpenAI HTTP 400" in intent.params["error"]
+    assert len(stand_in.peers) == 1
+
+
+def test_backoff_is_jittered_and_capped() -> None:
+    import httpx
+    from services.api.app.llm.http_client import LLMHTTPConfig
+
+    cfg = LLMHTTPConfig(backoff_base_s=1.0, backoff_max_s=4.0)
+    delays = [cfg.backoff_s(attempt, None) for attempt in range(8) for _ in range(20)]
+    assert all(0 <= d <= 4.0 for d in delays)
+    assert len(set(delays)) > 1
+
+    throttled = httpx.Response(429, headers={"Retry-After": "30"})
+    assert cfg.backoff_s(0, throttled) == 4.0
+
+
+def test_deadline_clips_slow_requests_and_skips_late_retries(stand_in: _StandIn) -> None:
+    import httpx
+    from services.api.app.llm.http_client import LLMBudgetExceeded, llm_deadline, post_json
+
+    request = {"headers": {}, "body": {}}
+    stand_in.delay_s = 2.0
+    started = time.perf_counter()
+    with pytest.raises(httpx.TimeoutException), llm_deadline(0.2):
+        post_json(stand_in.url, **request)
+    assert time.perf_counter() - started < 1.5
+
+    stand_in.delay_s = 0.0
+    stand_in.scripted = [(429, {"Retry-After": "5"})]
+    with pytest.raises(LLMBudgetExceeded), llm_deadline(1.0):
+        post_json(stand_in.url, **request)
+    assert len(stand_in.peers) == 2
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Iterator
+from pathlib import Path
+
+import anyio
+import pytest
+from scripts.openai_standin import StandInBehavior, StandInServer, load_fixtures, parse_latency
+
+
+@pytest.fixture()
+def serve(monkeypatch: pytest.MonkeyPatch) -> Iterator:
+    from services.api.app.llm.http_client import close_llm_clients
+
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-local")
+    monkeypatch.setenv("HALO_INTENT_CACHE_ENABLED", "false")
+    monkeypatch.setenv("HALO_LLM_BACKOFF_BASE_S", "0")
+    servers: list[StandInServer] = []
+
+    def _serve(behavior: StandInBehavior) -> StandInServer:
+        server = StandInServer(behavior)
+        server.serve_in_thread()
+        monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+        anyio.run(close_llm_clients)
+        servers.append(server)
+        return server
+
+    yield _serve
+    anyio.run(close_llm_clients)
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _extract(text: str):
+    from services.api.app.llm.factory import build_intent_extractor
+
+    return build_intent_extractor().extract(
+        raw_command_text=text, household_id="hh-1", user_id="u-1"
+    )
+
+
+def test_answers_from_fixtures_then_from_the_fake_extractor(serve, tmp_path: Path) -> None:
+    path = tmp_path / "fixtures.json"
+    recorded = {
+        "verb": "BOOK_APPOINTMENT",
+        "object": "restaurant",
+        "params": {"service_type": "restaurant", "party_size": 2},
+        "confidence": 0.95,
+        "routine_key": "BOOK_APPOINTMENT:restaurant",
+        "clarifications": [],
+    }
+    path.write_text(json.dumps({"Dinner for two": recorded}))
+    server = serve(StandInBehavior(fixtures=load_fixtures(path)))
+
+    assert _extract("  dinner for TWO ").params == recorded["params"]
+    assert _extract("cancel netflix").params == {"subscription_name": "Netflix"}
+    assert server.counts == {"ok": 2, "error": 0, "throttled": 0}
+
+
+def test_injected_throttling_exercises_retries_and_the_breaker(
+    serve, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from services.api.app.metrics import registry
+
+    monkeypatch.setenv("HALO_LLM_BREAKER_FAILURES", "1")
+    server = serve(StandInBehavior(throttle_rate=1.0, retry_after_s=0))
+    retries = registry.counter_value("llm_http_retries_total")
+
+    from services.api.app.llm.factory import build_intent_extractor
+
+    extractor = build_intent_extractor()
+    kwargs = {"raw_command_text": "cancel netflix", "household_id": "hh-1", "user_id": "u-1"}
+    assert extractor.extract(**kwargs).params["degraded"] == "llm_error"
+    assert extractor.extract(**kwargs).params["degraded"] == "breaker_open"
+
+    assert server.counts["throttled"] == 3
+    assert registry.counter_value("llm_http_retries_total") - retries == 2
+
+
+def test_latency_specs() -> None:
+    rng = random.Random(7)
+
+    assert parse_latency("fixed:250")(rng) == 0.25
+    assert all(0.01 <= parse_latency("uniform:10:20")(rng) <= 0.02 for _ in range(50))
+    samples = sorted(parse_latency("lognormal:100:0.5")(rng) for _ in range(501))
+    assert 0.08 < samples[250] < 0.12
+    with pytest.raises(ValueError):
+        parse_latency("gaussian:1")
+
+
+def test_pipeline_bench_runs_offline(serve) -> None:
+    from scripts.bench_llm_pipeline import run
+
+    server = serve(StandInBehavior(latency=parse_latency("fixed:5"), seed=1))
+
+    summary = run(20, 4, use_async=True)
+    assert summary["requests"] == 20
+    assert summary["degraded"] == {}
+    assert server.counts["ok"] == 20
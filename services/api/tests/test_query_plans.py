@@ -0,0 +1,135 @@
+"""Query-plan regression suite.
+
+Every SELECT issued by the command, draft and audit routers is captured while driving the
+API end-to-end, then re-run under SQLite's EXPLAIN QUERY PLAN. A plain ``SCAN <table>``
+step on a model table means the query went back to a full table scan.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    db_path = tmp_path / "halo_plans.db"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{db_path}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_BOOKING_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+
+    from services.api.app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def _drive_all_router_queries(client: TestClient) -> None:
+    def command(text: str) -> dict:
+        resp = client.post(
+            "/v1/command",
+            json={"household_id": "hh-1", "user_id": "u-1", "raw_command_text": text},
+        )
+        assert resp.status_code == 200
+        return resp.json()
+
+    reorder = command("reorder usual")
+    items = command("order 2 paper towels")
+    cancel = command("cancel netflix")
+    book = command("book cleaner")
+
+    client.post(
+        "/v1/draft/modify",
+        json={
+            "draft_id": reorder["draft_id"],
+            "modifications": {"items": [{"name": "detergent", "quantity": 3}]},
+        },
+    )
+    client.post(
+        "/v1/draft/modify",
+        json={"draft_id": cancel["draft_id"], "modifications": {"subscription_name": "Netflix"}},
+    )
+    client.post(
+        "/v1/draft/modify",
+        json={"draft_id": book["draft_id"], "modifications": {"selected_time_window_index": 1}},
+    )
+
+    execution_ids = []
+    for card in (reorder, items, cancel, book):
+        assert client.get(f"/v1/drafts/{card['draft_id']}").status_code == 200
+        done = client.post(
+            "/v1/draft/confirm", json={"draft_id": card["draft_id"], "user_id": "u-1"}
+        )
+        assert done.status_code == 200
+        execution_ids.append(done.json()["execution_id"])
+
+    assert client.get("/v1/executions", params={"household_id": "hh-1"}).status_code == 200
+    first_page = client.get("/v1/executions", params={"household_id": "hh-1", "limit": 1})
+    next_page = client.get(
+        "/v1/executions",
+        params={
+            "household_id": "hh-1",
+            "limit": 1,
+            "cursor": first_page.headers["X-Next-Cursor"],
+            "verb": "REORDER",
+            "status": "DONE",
+            "started_from": "2000-01-01T00:00:00",
+        },
+    )
+    assert next_page.status_code == 200
+    batch = client.post("/v1/executions:batchGet", json={"execution_ids": execution_ids})
+    assert batch.status_code == 200
+    for execution_id in execution_ids:
+        assert client.get(f"/v1/executions/{execution_id}").status_code == 200
+        assert client.get(f"/v1/receipts/{execution_id}").status_code == 200
+
+    assert client.get("/v1/vendors/health").status_code == 200
+    assert client.get("/v1/vendors/health", params={"household_id": "hh-1"}).status_code == 200
+
+
+def _full_scans(conn, statement: str, parameters, tables: set[str]) -> list[str]:
+    plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    scans = []
+    for row in plan:
+        detail = str(row[-1])
+        parts = detail.split()
+        if len(parts) >= 2 and parts[0] == "SCAN" and parts[1] in tables:
+            if "USING" not in parts:
+                scans.append(detail)
+    return scans
+
+
+def test_router_queries_never_full_scan(client: TestClient) -> None:
+    from services.api.app.db.database import get_engine
+    from services.api.app.db.models import Base
+
+    engine = get_engine()
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        del conn, cursor, context
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        _drive_all_router_queries(client)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert captured, "Expected router queries to be captured"
+
+    tables = set(Base.metadata.tables)
+    offenders: dict[str, list[str]] = {}
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            scans = _full_scans(conn, statement, parameters, tables)
+            if scans:
+                offenders[statement] = scans
+
+    assert not offenders, f"Full table scans detected: {offenders}"
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from services.api.app.models.order import OrderItemPriced
+from services.api.app.services.amazon_base import AmazonAdapterError, ExecuteResult
+from services.api.app.services.amazon_mock import AmazonMockAdapter
+
+
+class _FailingAmazonAdapter(AmazonMockAdapter):
+    def execute(
+        self,
+        household_id: str,
+        items: list[OrderItemPriced],
+        expected_total_cents: int,
+    ) -> ExecuteResult:
+        raise AmazonAdapterError("checkout exploded")
+
+
+@pytest.fixture()
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+pysqlite:///{tmp_path / 'halo_health.db'}")
+    monkeypatch.setenv("HALO_DB_AUTO_CREATE", "true")
+    monkeypatch.setenv("HALO_AMAZON_ADAPTER", "mock")
+    monkeypatch.setenv("HALO_LLM_PROVIDER", "fake")
+
+    from services.api.app.main import app
+
+    with TestClient(app) as c:
+        yield c
+
+
+def _reorder(client: TestClient, household_id: str) -> int:
+    card = client.post(
+        "/v1/command",
+        json={"household_id": household_id, "user_id": "u-1", "raw_command_text": "reorder usual"},
+    ).json()
+    resp = client.post("/v1/draft/confirm", json={"draft_id": card["draft_id"], "user_id": "u-1"})
+    return resp.status_code
+
+
+def test_vendor_health_counts_attempts_and_failures(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert _reorder(client, "hh-1") == 200
+
+    import services.api.app.routers.draft as draft_router
+
+    monkeypatch.setattr(draft_router, "get_amazon_adapter", lambda: _FailingAmazonAdapter())
+    assert _reorder(client, "hh-2") == 502
+
+    overall = client.get("/v1/vendors/health").json()
+    assert overall["household_id"] is None
+    (amazon,) = overall["vendors"]
+    assert amazon["vendor"] == "AMAZON_MOCK"
+    for window in ("1h", "24h", "7d"):
+        assert amazon["windows"][window] == {"attempts": 2, "failures": 1, "failure_rate": 0.5}
+
+    hh1 = client.get("/v1/vendors/health", params={"household_id": "hh-1"}).json()
+    assert hh1["vendors"][0]["windows"]["24h"] == {
+        "attempts": 1,
+        "failures": 0,
+        "failure_rate": 0.0,
+    }
+
+    assert client.get("/v1/vendors/health", params={"vendor": "RESY"}).json()["vendors"] == []
+
+
+def test_windows_slide_across_bucket_boundaries() -> None:
+    from services.api.app.services.vendor_health import WindowCounts, summarize
+
+    now = datetime(2026, 1, 8, 10, 15)
+    rows = [
+        ("V", datetime(2026, 1, 8, 10), 2, 1),  # current bucket: fully inside every window
+        ("V", datetime(2026, 1, 8, 9), 4, 4),  # 45 of its 60 minutes are inside the last hour
+        ("V", datetime(2026, 1, 1, 10), 8, 0),  # 45 minutes inside the 7d window
+    ]
+
+    health = summarize(rows, now)["V"]
+
+    assert health["1h"] == WindowCounts(attempts=5, failures=4)
+    assert health["24h"] == WindowCounts(attempts=6, failures=5)
+    assert health["7d"] == WindowCounts(attempts=12, failures=5)
+
+
+def test_expired_buckets_are_pruned_once_per_hour(client: TestClient) -> None:
+    from services.api.app.db.database import db_session
+    from services.api.app.db.models import VendorHealthBucket
+    from services.api.app.services.vendor_health import RETENTION, record_vendor_outcome
+
+    def _expired_bucket(db, household_id: str) -> None:
+        db.add(
+            VendorHealthBucket(
+                vendor="OLD", household_id=household_id, bucket_start=hour - 2 * RETENTION
+            )
+        )
+        db.flush()
+
+    def _buckets(db) -> int:
+        return db.query(VendorHealthBucket).filter(VendorHealthBucket.vendor == "OLD").count()
+
+    hour = datetime(2030, 1, 1, 10)
+    with db_session() as db:
+        _expired_bucket(db, "hh-1")
+        record_vendor_outcome(db, vendor="V", household_id="hh-1", failed=False, at=hour)
+        assert _buckets(db) == 0
+
+        _expired_bucket(db, "hh-2")
+        record_vendor_outcome(db, vendor="V", household_id="hh-1", failed=False, at=hour)
+        assert _buckets(db) == 1  # same hour: no second DELETE
+
+        record_vendor_outcome(
+            db, vendor="V", household_id="hh-1", failed=False, at=hour.replace(hour=11)
+        )
+        assert _buckets(db) == 0
+        db.rollback()